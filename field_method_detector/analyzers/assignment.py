@@ -0,0 +1,201 @@
+"""
+Optimal Rename Assignment
+=========================
+
+Maximum-weight bipartite assignment between missing and new names, used by
+the "optimal" matching strategy of MatchingEngine as an alternative to the
+greedy two-phase pass.
+
+Solved with the Hungarian algorithm (shortest augmenting paths with
+potentials). scipy.optimize.linear_sum_assignment is used when SciPy is
+installed, otherwise a NumPy-vectorized implementation, and a pure Python
+one as the last resort. Many-to-one renames (several old names collapsing
+into one new name) are allowed through a per-column capacity.
+"""
+
+import logging
+from typing import List, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional
+    np = None
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:  # Optional
+    linear_sum_assignment = None
+
+logger = logging.getLogger(__name__)
+
+INF = float("inf")
+
+
+def solve_assignment(cost: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """
+    Minimum-cost assignment for a rectangular cost matrix.
+
+    Every row is assigned when rows <= columns (every column otherwise).
+
+    Args:
+        cost: Matriz de costos (lista de filas)
+
+    Returns:
+        Lista de pares (fila, columna) ordenada por fila
+    """
+    n_rows = len(cost)
+    n_cols = len(cost[0]) if n_rows else 0
+    if not n_rows or not n_cols:
+        return []
+
+    if linear_sum_assignment is not None:
+        rows, cols = linear_sum_assignment(np.asarray(cost, dtype=float))
+        return sorted(zip(rows.tolist(), cols.tolist()))
+
+    if n_rows > n_cols:
+        transposed = [list(column) for column in zip(*cost)]
+        return sorted((row, col) for col, row in solve_assignment(transposed))
+
+    if np is not None:
+        return _hungarian_numpy(np.asarray(cost, dtype=float))
+    return _hungarian_python(cost)
+
+
+def _hungarian_python(cost: Sequence[Sequence[float]]) -> List[Tuple[int, int]]:
+    """Hungarian algorithm, O(n²·m), for n rows <= m columns (1-based internals)"""
+    n, m = len(cost), len(cost[0])
+    u = [0.0] * (n + 1)
+    v = [0.0] * (m + 1)
+    owner = [0] * (m + 1)  # owner[j]: row assigned to column j (0 = free)
+    way = [0] * (m + 1)
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        j0 = 0
+        minv = [INF] * (m + 1)
+        used = [False] * (m + 1)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            row_cost = cost[i0 - 1]
+            delta = INF
+            j1 = 0
+            for j in range(1, m + 1):
+                if not used[j]:
+                    current = row_cost[j - 1] - u[i0] - v[j]
+                    if current < minv[j]:
+                        minv[j] = current
+                        way[j] = j0
+                    if minv[j] < delta:
+                        delta = minv[j]
+                        j1 = j
+            for j in range(m + 1):
+                if used[j]:
+                    u[owner[j]] += delta
+                    v[j] -= delta
+                else:
+                    minv[j] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        # Augment along the alternating path
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    return sorted((owner[j] - 1, j - 1) for j in range(1, m + 1) if owner[j])
+
+
+def _hungarian_numpy(cost: "np.ndarray") -> List[Tuple[int, int]]:
+    """Same algorithm as _hungarian_python() with the column scans vectorized"""
+    n, m = cost.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    owner = np.zeros(m + 1, dtype=np.int64)
+    way = np.zeros(m + 1, dtype=np.int64)
+
+    for row in range(1, n + 1):
+        owner[0] = row
+        j0 = 0
+        minv = np.full(m + 1, INF)
+        used = np.zeros(m + 1, dtype=bool)
+        while True:
+            used[j0] = True
+            i0 = owner[j0]
+            free = ~used
+            free[0] = False
+
+            current = cost[i0 - 1] - u[i0] - v[1:]
+            improved = free[1:] & (current < minv[1:])
+            minv[1:][improved] = current[improved]
+            way[1:][improved] = j0
+
+            candidates = np.where(free[1:], minv[1:], INF)
+            j1 = int(np.argmin(candidates)) + 1
+            delta = candidates[j1 - 1]
+
+            u[owner[used]] += delta
+            v[used] -= delta
+            minv[~used] -= delta
+            j0 = j1
+            if owner[j0] == 0:
+                break
+        while j0:
+            j1 = way[j0]
+            owner[j0] = owner[j1]
+            j0 = j1
+
+    return sorted((int(owner[j]) - 1, j - 1) for j in range(1, m + 1) if owner[j])
+
+
+def assign_renames(
+    names1: Sequence[str],
+    names2: Sequence[str],
+    scores: Sequence[Sequence[float]],
+    slack: int = 1,
+    min_score: float = 0.0,
+) -> List[Tuple[str, str, float]]:
+    """
+    Pair old names with new names maximizing the total similarity.
+
+    Args:
+        names1: Nombres que desaparecen (filas de scores)
+        names2: Nombres nuevos (columnas de scores)
+        scores: Similaridad names1[i] → names2[j]
+        slack: Nombres viejos adicionales que un mismo nombre nuevo puede
+            absorber (0 = asignación uno a uno)
+        min_score: Pares con similaridad <= min_score no se asignan
+
+    Returns:
+        Lista de (old_name, new_name, similarity) ordenada por similaridad
+        descendente
+    """
+    if not names1 or not names2:
+        return []
+
+    capacity = 1 + max(0, slack)
+    weights = [[score if score > min_score else 0.0 for score in row] for row in scores]
+    # Each new name becomes `capacity` interchangeable columns
+    cost = [[-w for w in row for _ in range(capacity)] for row in weights]
+
+    assigned = []
+    for row, col in solve_assignment(cost):
+        similarity = scores[row][col // capacity]
+        if weights[row][col // capacity] > 0:
+            assigned.append((names1[row], names2[col // capacity], similarity))
+
+    # Extra names on a target with a high-confidence match must be strong too
+    best_by_target = {}
+    for _, new_name, similarity in assigned:
+        best_by_target[new_name] = max(best_by_target.get(new_name, 0.0), similarity)
+
+    matches = []
+    for old_name, new_name, similarity in assigned:
+        best = best_by_target[new_name]
+        if similarity < best and best >= 0.9 and similarity < 0.8:
+            continue
+        matches.append((old_name, new_name, similarity))
+
+    matches.sort(key=lambda match: (-match[2], match[0], match[1]))
+    return matches
@@ -12,6 +12,9 @@ from core.models import Model, Field, Method, Reference, CallType, InheritanceTy
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes; invalidates persisted extractions
+EXTRACTOR_VERSION = "1"
+
 
 class OdooASTVisitor(ast.NodeVisitor):
     """
@@ -21,8 +24,10 @@ class OdooASTVisitor(ast.NodeVisitor):
     - References and cross-model calls
     """
 
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, content: Optional[str] = None):
         self.file_path = file_path
+        # Source being visited; when absent it is read from file_path on demand
+        self.content = content
         self.models: List[Model] = []
         self.current_model: Optional[Model] = None
         self.current_method: Optional[str] = None
@@ -322,8 +327,10 @@ class OdooASTVisitor(ast.NodeVisitor):
     def _get_source_segment(self, node) -> str:
         """Get source code segment for node"""
         try:
-            with open(self.file_path, "r") as f:
-                content = f.read()
+            content = self.content
+            if content is None:
+                with open(self.file_path, "r") as f:
+                    content = f.read()
             if hasattr(ast, "get_source_segment"):
                 return ast.get_source_segment(content, node) or ""
             return f"# Source at line {node.lineno}"
@@ -491,7 +498,7 @@ def extract_models(content: str, file_path: str) -> List[Model]:
     """
     try:
         tree = ast.parse(content)
-        visitor = OdooASTVisitor(file_path)
+        visitor = OdooASTVisitor(file_path, content)
 
         # Add parent references for better context
         for node in ast.walk(tree):
@@ -37,6 +37,62 @@ class ImpactCandidate:
     context: str
 
 
+class ReferenceIndex:
+    """
+    Inverted index of all references, built once per all_models.
+
+    References are grouped by (reference_name, reference_type) and, inside
+    each group, by the model a rename must be declared on for them to match:
+    the target model for cross-model references and the source model for
+    self, decorator and super references. Looking up a rename then visits
+    only the references that can possibly match it, in the same order as a
+    full scan over all_models.
+    """
+
+    # Call types whose references match on the source model
+    SOURCE_MODEL_CALL_TYPES = (CallType.SELF, CallType.DECORATOR, CallType.SUPER)
+
+    def __init__(self, all_models: Dict[str, List[Model]]):
+        self._index: Dict[Tuple[str, str], Dict[str, List[Reference]]] = {}
+        self.size = 0
+
+        for models in all_models.values():
+            for model in models:
+                for reference in model.references:
+                    self.add(reference)
+
+    def add(self, reference: Reference) -> None:
+        """Index a single reference (references that never match are skipped)"""
+        if reference.call_type == CallType.CROSS_MODEL:
+            match_model = reference.target_model
+        elif reference.call_type in self.SOURCE_MODEL_CALL_TYPES:
+            match_model = reference.source_model
+        else:
+            return
+        if not match_model:
+            return
+
+        by_model = self._index.setdefault(
+            (reference.reference_name, reference.reference_type), {}
+        )
+        by_model.setdefault(match_model, []).append(reference)
+        self.size += 1
+
+    def candidates(self, name: str, item_type: str, model: str) -> List[Reference]:
+        """
+        References named `name` of type `item_type` that target `model`.
+
+        Args:
+            name: Nombre del campo/método (old_name del renombre)
+            item_type: 'field' o 'method'
+            model: Modelo donde se declara el renombre
+
+        Returns:
+            Referencias candidatas, en orden de recorrido de all_models
+        """
+        return self._index.get((name, item_type), {}).get(model, [])
+
+
 class CrossReferenceAnalyzer:
     """
     Analyzes cross-references and generates impact candidates for renames.
@@ -90,6 +146,7 @@ class CrossReferenceAnalyzer:
         from analyzers.matching_engine import MatchingEngine
 
         all_candidates = []
+        reference_index = ReferenceIndex(all_models)
 
         for candidate in primary_changes:
             # CRITICAL: Check if this is a TRUE primary change
@@ -109,7 +166,7 @@ class CrossReferenceAnalyzer:
 
                 # Generate cross-references ONLY for true primary changes
                 cross_references = self._find_all_cross_references(
-                    candidate, all_models
+                    candidate, all_models, reference_index
                 )
 
                 # Convert each reference to RenameCandidate with unique global ID
@@ -155,6 +212,7 @@ class CrossReferenceAnalyzer:
             List of all candidates (primary + impacts)
         """
         all_candidates = []
+        reference_index = ReferenceIndex(all_models)
 
         for primary in primary_candidates:
             logger.debug(
@@ -165,7 +223,9 @@ class CrossReferenceAnalyzer:
             all_candidates.append(primary)
 
             # Find all impacts for this rename
-            impacts = self._find_impacts_for_rename(primary, all_models)
+            impacts = self._find_impacts_for_rename(
+                primary, all_models, reference_index
+            )
 
             # Convert impacts to candidates
             impact_candidates = self._convert_impacts_to_candidates(primary, impacts)
@@ -178,25 +238,42 @@ class CrossReferenceAnalyzer:
         return all_candidates
 
     def _find_impacts_for_rename(
-        self, primary: RenameCandidate, all_models: Dict[str, List[Model]]
+        self,
+        primary: RenameCandidate,
+        all_models: Dict[str, List[Model]],
+        reference_index: Optional[ReferenceIndex] = None,
     ) -> List[ImpactCandidate]:
         """Find all impacts for a primary rename candidate"""
         impacts = []
 
-        # Search through all models for references to the renamed item
-        for module_name, models in all_models.items():
-            for model in models:
-                for reference in model.references:
-                    # Check if this reference matches our rename
-                    if self._reference_matches_rename(reference, primary):
-                        impact = self._create_impact_candidate(
-                            reference, primary, model
-                        )
-                        if impact:
-                            impacts.append(impact)
+        # Only visit the indexed references to the renamed item
+        for reference in self._matching_references(
+            primary, all_models, reference_index
+        ):
+            impact = self._create_impact_candidate(reference, primary, None)
+            if impact:
+                impacts.append(impact)
 
         return impacts
 
+    def _matching_references(
+        self,
+        primary: RenameCandidate,
+        all_models: Dict[str, List[Model]],
+        reference_index: Optional[ReferenceIndex] = None,
+    ) -> List[Reference]:
+        """References in all_models that match the primary rename"""
+        if reference_index is None:
+            reference_index = ReferenceIndex(all_models)
+
+        return [
+            reference
+            for reference in reference_index.candidates(
+                primary.old_name, primary.item_type, primary.model
+            )
+            if self._reference_matches_rename(reference, primary)
+        ]
+
     def _reference_matches_rename(
         self, reference: Reference, primary: RenameCandidate
     ) -> bool:
@@ -287,7 +364,10 @@ class CrossReferenceAnalyzer:
         return False
 
     def _create_impact_candidate(
-        self, reference: Reference, primary: RenameCandidate, source_model: Model
+        self,
+        reference: Reference,
+        primary: RenameCandidate,
+        source_model: Optional[Model],
     ) -> Optional[ImpactCandidate]:
         """Create an impact candidate from a reference"""
 
@@ -440,19 +520,14 @@ class CrossReferenceAnalyzer:
             return ValidationStatus.PENDING.value
 
     def _find_all_cross_references(
-        self, primary_change: RenameCandidate, all_models: Dict[str, List[Model]]
+        self,
+        primary_change: RenameCandidate,
+        all_models: Dict[str, List[Model]],
+        reference_index: Optional[ReferenceIndex] = None,
     ) -> List[Reference]:
         """Busca todas las referencias cruzadas para un cambio primario"""
-        references = []
-
-        # Buscar en todos los modelos
-        for module_name, models in all_models.items():
-            for model in models:
-                for reference in model.references:
-                    if self._reference_matches_rename(reference, primary_change):
-                        references.append(reference)
-
-        return references
+        # Solo se visitan las referencias indexadas bajo (nombre, tipo, modelo)
+        return self._matching_references(primary_change, all_models, reference_index)
 
     def _reference_to_candidate(
         self, reference: Reference, primary: RenameCandidate, change_id: str
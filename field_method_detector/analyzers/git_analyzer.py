@@ -8,6 +8,7 @@ Handles Git repository operations, commit resolution, and file content retrieval
 import json
 import logging
 import subprocess
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -19,6 +20,113 @@ class GitRepositoryError(Exception):
     pass
 
 
+class GitBatchReader:
+    """
+    Long-lived ``git cat-file --batch`` session.
+
+    A single git process serves every object lookup, so reading N files
+    costs one fork/exec instead of two per file. Requests are pipelined:
+    all object names are written before the responses are read back.
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = repo_path
+        self._process: subprocess.Popen | None = None
+        self._lock = threading.Lock()
+
+    def _ensure_started(self) -> subprocess.Popen:
+        """Start the git process if it is not running"""
+        if self._process is None or self._process.poll() is not None:
+            logger.debug(f"Starting git cat-file --batch session in {self.repo_path}")
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=str(self.repo_path),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+        return self._process
+
+    def read_objects(self, object_names: list[str]) -> dict[str, bytes | None]:
+        """
+        Read several objects in one pipelined round trip.
+
+        Args:
+            object_names: Object names understood by git, e.g. blob SHAs or
+                ``<commit>:<path>`` expressions
+
+        Returns:
+            Dictionary mapping each requested name to the raw blob content,
+            or None when the object is missing or is not a blob
+        """
+        unique_names = list(dict.fromkeys(object_names))
+        if not unique_names:
+            return {}
+
+        with self._lock:
+            process = self._ensure_started()
+
+            # Write requests from a separate thread so a large response can't
+            # fill the stdout pipe while we are still writing stdin
+            request = "".join(f"{name}\n" for name in unique_names).encode()
+            writer = threading.Thread(
+                target=self._write_requests, args=(process, request)
+            )
+            writer.start()
+
+            try:
+                results = {name: self._read_response(process) for name in unique_names}
+            except (OSError, ValueError) as e:
+                self._terminate()
+                raise GitRepositoryError(f"git cat-file --batch session failed: {e}")
+            finally:
+                writer.join()
+
+        return results
+
+    @staticmethod
+    def _write_requests(process: subprocess.Popen, request: bytes) -> None:
+        try:
+            process.stdin.write(request)
+            process.stdin.flush()
+        except OSError:
+            # Surfaced as a short read on stdout
+            pass
+
+    @staticmethod
+    def _read_response(process: subprocess.Popen) -> bytes | None:
+        """Read one ``<oid> <type> <size>`` header plus body, or a missing line"""
+        header = process.stdout.readline()
+        if not header:
+            raise OSError("unexpected end of output")
+
+        # "<name> missing" / "<name> ambiguous" carry no body; names may
+        # contain spaces, so check the suffix rather than the field count
+        if header.rstrip().endswith((b" missing", b" ambiguous")):
+            return None
+
+        _object_sha, object_type, size = header.split()
+        body = process.stdout.read(int(size) + 1)[:-1]
+        return body if object_type == b"blob" else None
+
+    def _terminate(self) -> None:
+        if self._process is not None:
+            self._process.kill()
+            self._process.wait()
+            self._process = None
+
+    def close(self) -> None:
+        """Stop the git process"""
+        with self._lock:
+            if self._process is None:
+                return
+            if self._process.stdin:
+                self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
 class GitAnalyzer:
     """Git repository analyzer for commit and file operations"""
 
@@ -34,6 +142,25 @@ class GitAnalyzer:
         """
         self.repo_path = Path(repo_path).resolve()
         self._validate_repository()
+        self._batch_reader: GitBatchReader | None = None
+
+    def __enter__(self) -> "GitAnalyzer":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self):
+        """Release the persistent git cat-file session, if any"""
+        if self._batch_reader is not None:
+            self._batch_reader.close()
+            self._batch_reader = None
+
+    def _get_batch_reader(self) -> GitBatchReader:
+        """Get the blob reader session, starting it on first use"""
+        if self._batch_reader is None:
+            self._batch_reader = GitBatchReader(self.repo_path)
+        return self._batch_reader
 
     def _validate_repository(self):
         """Validate that the path contains a valid Git repository"""
@@ -160,17 +287,92 @@ class GitAnalyzer:
         Returns:
             File content as string, or None if file doesn't exist at commit
         """
-        # First check if file exists at commit to avoid noisy error logs
-        if not self.file_exists_at_commit(file_path, commit_sha):
+        content = self.get_files_at_commit([file_path], commit_sha).get(file_path)
+        if content is None:
             logger.debug(f"File {file_path} not found at commit {commit_sha}")
-            return None
+        return content
 
-        try:
-            result = self._run_git_command(["show", f"{commit_sha}:{file_path}"])
-            return result.stdout
-        except GitRepositoryError:
-            logger.debug(f"File {file_path} not found at commit {commit_sha}")
-            return None
+    def get_files_at_commit(
+        self, file_paths: list[str], commit_sha: str
+    ) -> dict[str, str]:
+        """
+        Get the content of several files at a specific commit.
+
+        All lookups go through the persistent ``git cat-file --batch`` session
+        in one pipelined round trip. Missing files need no separate existence
+        check; they are simply left out of the result.
+
+        Args:
+            file_paths: Relative paths to files from repository root
+            commit_sha: Commit SHA to retrieve files from
+
+        Returns:
+            Dictionary mapping each existing file path to its content
+        """
+        object_names = {f"{commit_sha}:{path}": path for path in file_paths}
+        raw_contents = self._get_batch_reader().read_objects(list(object_names))
+
+        contents = {}
+        for object_name, raw in raw_contents.items():
+            if raw is not None:
+                contents[object_names[object_name]] = raw.decode(
+                    "utf-8", errors="replace"
+                )
+
+        missing = len(object_names) - len(contents)
+        if missing:
+            logger.debug(f"{missing} files not found at commit {commit_sha[:8]}")
+
+        return contents
+
+    def list_tree_at_commit(
+        self, commit_sha: str, paths: list[str] | None = None
+    ) -> dict[str, str]:
+        """
+        List the blobs of a commit tree without touching the work tree.
+
+        Args:
+            commit_sha: Commit SHA whose tree is listed
+            paths: Optional pathspecs (relative to repository root) to restrict
+                the listing to, e.g. module directories
+
+        Returns:
+            Dictionary mapping file path to blob SHA
+        """
+        args = ["ls-tree", "-r", "-z", commit_sha]
+        if paths:
+            args += ["--"] + list(paths)
+
+        result = self._run_git_command(args)
+
+        entries = {}
+        for record in result.stdout.split("\0"):
+            if not record:
+                continue
+            meta, file_path = record.split("\t", 1)
+            _mode, object_type, object_sha = meta.split()
+            if object_type == "blob":
+                entries[file_path] = object_sha
+
+        return entries
+
+    def read_blobs(self, blob_shas: list[str]) -> dict[str, str]:
+        """
+        Read several blobs through the persistent ``git cat-file --batch`` session.
+
+        Args:
+            blob_shas: Blob SHAs to read
+
+        Returns:
+            Dictionary mapping blob SHA to its decoded content. Missing
+            objects are omitted from the result.
+        """
+        raw_contents = self._get_batch_reader().read_objects(blob_shas)
+        return {
+            blob_sha: raw.decode("utf-8", errors="replace")
+            for blob_sha, raw in raw_contents.items()
+            if raw is not None
+        }
 
     def get_file_diff(
         self, file_path: str, commit_from: str, commit_to: str
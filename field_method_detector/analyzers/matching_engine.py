@@ -15,7 +15,20 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 from config.naming_rules import naming_engine
 from config.settings import SCORING_WEIGHTS, config
 from core.models import Model, Field, Method, Reference, RenameCandidate
+from analyzers.assignment import assign_renames
 from analyzers.inheritance_graph import InheritanceGraph, build_inheritance_graph
+from analyzers.name_similarity import (
+    ACTION_PATTERNS,
+    API_PATTERNS,
+    COMPUTE_PATTERNS,
+    INTERNAL_PATTERNS,
+    ITEM_PRODUCT_INVALID_CONTEXTS,
+    ITEM_PRODUCT_VALID_CONTEXTS,
+    REMOVABLE_WORDS,
+    SYNONYM_GROUPS,
+    BatchSimilarity,
+    extract_words,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -31,9 +44,37 @@ class MatchingEngine:
     # Global shared counter for unique change IDs across all instances
     _global_change_id_counter = 1
 
-    def __init__(self, start_id: int = None, inheritance_graph: InheritanceGraph = None):
+    # Strategies for pairing missing names with new names
+    STRATEGIES = ("greedy", "optimal")
+
+    def __init__(
+        self,
+        start_id: int = None,
+        inheritance_graph: InheritanceGraph = None,
+        strategy: str = None,
+        assignment_slack: int = None,
+    ):
+        """
+        Args:
+            start_id: Reinicia el contador global de change_id
+            inheritance_graph: Grafo de herencia para reclasificación
+            strategy: "greedy" (two-phase pass) u "optimal" (asignación
+                bipartita de máxima similaridad); por defecto config.matching_strategy
+            assignment_slack: Nombres viejos adicionales que un nombre nuevo
+                puede absorber con la estrategia "optimal"
+        """
         self.naming_engine = naming_engine
         self.inheritance_graph = inheritance_graph
+        self.strategy = strategy or config.matching_strategy
+        if self.strategy not in self.STRATEGIES:
+            raise ValueError(f"Unknown matching strategy: {self.strategy}")
+        self.assignment_slack = (
+            config.assignment_slack if assignment_slack is None else assignment_slack
+        )
+        self.batch_similarity = BatchSimilarity(
+            getattr(self.naming_engine, "is_transformation", None),
+            predict=getattr(self.naming_engine, "predict", None),
+        )
         if start_id is not None:
             MatchingEngine._global_change_id_counter = start_id
 
@@ -51,19 +92,32 @@ class MatchingEngine:
         module_name: str,
         include_inheritance: bool = True,
         include_cross_references: bool = True,
+        changed_model_names: Optional[Set[str]] = None,
     ) -> List[RenameCandidate]:
         """
         Single method that finds all types of renames:
         - Direct renames (original functionality)
         - Inheritance impacts (inheritance-aware functionality)
         - Cross-references (cross-reference functionality)
+
+        When changed_model_names is given, direct matching is limited to those
+        models (the ones defined in files whose content changed); models only
+        defined in unchanged files are identical on both sides and cannot
+        produce direct renames. Impact phases still see every model.
         """
         all_candidates = []
 
         # Phase 1: Direct renames
-        direct_candidates = self._find_direct_renames(
-            before_models, after_models, module_name
-        )
+        if changed_model_names is not None:
+            direct_candidates = self._find_direct_renames(
+                [m for m in before_models if m.name in changed_model_names],
+                [m for m in after_models if m.name in changed_model_names],
+                module_name,
+            )
+        else:
+            direct_candidates = self._find_direct_renames(
+                before_models, after_models, module_name
+            )
 
         # Set module name for all candidates
         for candidate in direct_candidates:
@@ -110,6 +164,7 @@ class MatchingEngine:
 
         # Group candidates by (model, old_name, new_name, item_type)
         from collections import defaultdict
+
         change_groups = defaultdict(list)
 
         for candidate in all_candidates:
@@ -344,8 +399,8 @@ class MatchingEngine:
     ) -> List[Tuple[str, str, float]]:
         """Find optimal matches allowing many-to-one mappings (multiple old names to same new name)"""
         # Convert to lists for indexing
-        missing_list = list(missing_names)
-        new_list = list(new_names)
+        missing_list = sorted(missing_names)
+        new_list = sorted(new_names)
 
         # Log raw comparison count for debugging
         total_comparisons = len(missing_list) * len(new_list)
@@ -354,13 +409,26 @@ class MatchingEngine:
                 f"Evaluating {total_comparisons} raw comparisons ({len(missing_list)} missing × {len(new_list)} new)"
             )
 
-        # Calculate all possible matches with similarities
-        all_matches = []
-        for missing in missing_list:
-            for new in new_list:
-                similarity = self._calculate_similarity(missing, new)
-                if similarity > 0:  # Only consider non-zero similarities
-                    all_matches.append((similarity, missing, new))
+        if self.strategy == "optimal":
+            # Global maximum-similarity pairing; only pairs above the
+            # confidence threshold are worth an assignment slot
+            scores = self.batch_similarity.score_matrix(missing_list, new_list)
+            matches = assign_renames(
+                missing_list,
+                new_list,
+                scores,
+                slack=self.assignment_slack,
+                min_score=config.confidence_threshold,
+            )
+            if total_comparisons > 0:
+                logger.debug(
+                    f"Assigned {len(matches)} matches from {total_comparisons} comparisons"
+                )
+            return matches
+
+        # Calculate all possible matches with similarities (batched; same
+        # scores as _calculate_similarity, non-zero similarities only)
+        all_matches = self.batch_similarity.scored_pairs(missing_list, new_list)
 
         # Sort by similarity descending (highest first)
         all_matches.sort(reverse=True)
@@ -431,30 +499,24 @@ class MatchingEngine:
 
     def _are_semantically_incompatible(self, name1: str, name2: str) -> bool:
         """Check if two method names represent incompatible semantic patterns"""
-        # Define incompatible prefixes/patterns in Odoo
-        action_patterns = ["action_", "button_", "open_", "show_"]
-        compute_patterns = ["_compute_", "_calculate_", "_get_computed_"]
-        api_patterns = ["api_", "json_", "jsonrpc_"]
-        internal_patterns = ["_internal_", "_private_", "_helper_"]
-
         # Check if names have incompatible patterns
         name1_lower = name1.lower()
         name2_lower = name2.lower()
 
         # Action methods should not become compute methods
-        if any(name1_lower.startswith(p) for p in action_patterns) and any(
-            name2_lower.startswith(p) for p in compute_patterns
+        if any(name1_lower.startswith(p) for p in ACTION_PATTERNS) and any(
+            name2_lower.startswith(p) for p in COMPUTE_PATTERNS
         ):
             return True
 
-        if any(name1_lower.startswith(p) for p in compute_patterns) and any(
-            name2_lower.startswith(p) for p in action_patterns
+        if any(name1_lower.startswith(p) for p in COMPUTE_PATTERNS) and any(
+            name2_lower.startswith(p) for p in ACTION_PATTERNS
         ):
             return True
 
         # API methods should not become internal methods
-        if any(name1_lower.startswith(p) for p in api_patterns) and any(
-            name2_lower.startswith(p) for p in internal_patterns
+        if any(name1_lower.startswith(p) for p in API_PATTERNS) and any(
+            name2_lower.startswith(p) for p in INTERNAL_PATTERNS
         ):
             return True
 
@@ -492,54 +554,13 @@ class MatchingEngine:
 
     def _find_synonym_matches(self, words1: List[str], words2: List[str]) -> Set[tuple]:
         """Find synonym matches between two word lists for Odoo-specific concepts"""
-        # Define synonym groups for common Odoo concepts
-        synonym_groups = [
-            # Counting/quantity concepts - CORE for our use case
-            {"number", "count", "qty", "quantity", "total", "amount", "sum"},
-            # Product concepts (be more specific about item/product relationship)
-            {"product", "products"},
-            {"item", "items"},  # Keep separate - only match in specific contexts
-            # Template/model concepts
-            {"template", "tmpl", "model", "variant", "tpl"},
-            # Related/associated concepts (often removed in renames)
-            {"related", "associated", "linked", "connected", "ref"},
-            # ID/identifier concepts (singular/plural)
-            {"id", "ids", "identifier", "identifiers", "key", "keys"},
-            # Compute/calculate concepts
-            {"compute", "calculate", "calc", "get", "determine"},
-            # Line/item list concepts
-            {"line", "lines", "item", "items", "record", "records"},
-            # State/status concepts
-            {"state", "status", "stage", "phase"},
-            # Transfer/movement concepts
-            {"received", "delivered", "transferred", "moved", "sent"},
-            # Common Odoo field suffixes/prefixes
-            {"name", "title", "label", "description", "desc"},
-            # Price/cost concepts (singular/plural)
-            {"price", "prices", "cost", "costs", "rate", "rates"},
-            # Update/modify concepts
-            {"update", "updatable", "modify", "change", "edit", "alter"},
-            # Action/view concepts (UI actions)
-            {"open", "view", "show", "display", "action"},
-            # Financial/invoice concepts
-            {"invoice", "invoiced", "bill", "billing", "charge"},
-            # Tax concepts
-            {"tax", "taxed", "untaxed", "exempt"},
-            # Amount/value concepts
-            {"amount", "amounts", "value", "values", "sum", "total"},
-            # Order/ordering concepts
-            {"order", "orders", "ordering", "sequence"},
-            # Assignment/log concepts
-            {"assign", "assignation", "allocation", "log", "logs", "history"},
-        ]
-
         matches = set()
 
         for word1 in words1:
             for word2 in words2:
                 if word1 != word2:  # Skip exact matches (already counted)
                     # Check if words are in the same synonym group
-                    for group in synonym_groups:
+                    for group in SYNONYM_GROUPS:
                         if word1 in group and word2 in group:
                             matches.add((word1, word2))
                             break
@@ -561,54 +582,14 @@ class MatchingEngine:
         ):
             return False
 
-        # Context words where item/product synonymy is invalid
-        invalid_contexts = [
-            # Financial/pricing contexts where item has different meaning
-            "pricelist",
-            "price",
-            "cost",
-            "invoice",
-            "bill",
-            # Document contexts where item means line items, not products
-            "document",
-            "report",
-            "list",
-            "menu",
-            "view",
-            # Configuration contexts
-            "config",
-            "setting",
-            "option",
-            "choice",
-        ]
-
         # Check if any invalid context words are present
         all_words = set(words1) | set(words2)
-        for invalid_word in invalid_contexts:
+        for invalid_word in ITEM_PRODUCT_INVALID_CONTEXTS:
             if invalid_word in all_words:
                 return False
 
-        # Valid contexts where item/product synonymy makes sense
-        valid_contexts = [
-            # Sales/order contexts
-            "sale",
-            "order",
-            "line",
-            "qty",
-            "quantity",
-            # Inventory contexts
-            "stock",
-            "move",
-            "picking",
-            "delivery",
-            # General product-related contexts
-            "template",
-            "variant",
-            "attribute",
-        ]
-
         # Allow if any valid context is present
-        for valid_word in valid_contexts:
+        for valid_word in ITEM_PRODUCT_VALID_CONTEXTS:
             if valid_word in all_words:
                 return True
 
@@ -617,23 +598,12 @@ class MatchingEngine:
 
     def _calculate_removal_bonus(self, words1: List[str], words2: List[str]) -> float:
         """Calculate bonus for words commonly removed in refactoring"""
-        removable_words = {
-            "related",
-            "associated",
-            "linked",
-            "ref",
-            "old",
-            "new",
-            "temp",
-            "tmp",
-        }
-
         words1_set = set(words1)
         words2_set = set(words2)
 
         # Find removable words that appear in one list but not the other
-        removed_words = (words1_set & removable_words) - words2_set
-        added_words = (words2_set & removable_words) - words1_set
+        removed_words = (words1_set & REMOVABLE_WORDS) - words2_set
+        added_words = (words2_set & REMOVABLE_WORDS) - words1_set
 
         # Small bonus for each removed/added removable word (indicates refactoring)
         total_removable = len(removed_words) + len(added_words)
@@ -649,53 +619,7 @@ class MatchingEngine:
 
     def _extract_words(self, name: str) -> List[str]:
         """Extract meaningful words from a method/field name"""
-        import re
-
-        # Remove common prefixes/suffixes that are structural
-        name = re.sub(r"^_+|_+$", "", name)
-
-        # Split on underscores and camelCase
-        words = re.split(r"_+", name)
-        result = []
-
-        for word in words:
-            # Split camelCase
-            camel_words = re.findall(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z][a-z]|\b)", word)
-            if camel_words:
-                result.extend([w.lower() for w in camel_words])
-            else:
-                result.append(word.lower())
-
-        # Filter out very short words and common structural words
-        structural_words = {
-            "get",
-            "set",
-            "is",
-            "has",
-            "do",
-            "to",
-            "of",
-            "for",
-            "by",
-            "id",
-            "ids",
-        }
-        # Also filter words commonly removed in refactoring
-        removable_words = {
-            "related",
-            "associated",
-            "linked",
-            "ref",
-            "old",
-            "new",
-            "temp",
-            "tmp",
-        }
-        meaningful_words = [
-            w for w in result if len(w) > 2 and w not in structural_words
-        ]
-
-        return meaningful_words
+        return list(extract_words(name))
 
     def _calculate_structure_bonus(self, name1: str, name2: str) -> float:
         """Calculate bonus for similar structural patterns"""
@@ -0,0 +1,471 @@
+"""
+Name Similarity Scoring
+=======================
+
+Word tables shared by the scalar similarity path of MatchingEngine and a
+batched scorer that fills the whole missing × new score matrix at once.
+
+The batched scorer tokenizes every name a single time, turns synonym groups
+into per-word bitmasks and, when NumPy is available, computes the word
+overlap counts of all pairs with matrix products. Scores are identical to
+MatchingEngine._calculate_similarity().
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import AbstractSet, Callable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional: falls back to precomputed token sets
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Synonym groups for common Odoo concepts
+SYNONYM_GROUPS = [
+    # Counting/quantity concepts - CORE for our use case
+    {"number", "count", "qty", "quantity", "total", "amount", "sum"},
+    # Product concepts (be more specific about item/product relationship)
+    {"product", "products"},
+    {"item", "items"},  # Keep separate - only match in specific contexts
+    # Template/model concepts
+    {"template", "tmpl", "model", "variant", "tpl"},
+    # Related/associated concepts (often removed in renames)
+    {"related", "associated", "linked", "connected", "ref"},
+    # ID/identifier concepts (singular/plural)
+    {"id", "ids", "identifier", "identifiers", "key", "keys"},
+    # Compute/calculate concepts
+    {"compute", "calculate", "calc", "get", "determine"},
+    # Line/item list concepts
+    {"line", "lines", "item", "items", "record", "records"},
+    # State/status concepts
+    {"state", "status", "stage", "phase"},
+    # Transfer/movement concepts
+    {"received", "delivered", "transferred", "moved", "sent"},
+    # Common Odoo field suffixes/prefixes
+    {"name", "title", "label", "description", "desc"},
+    # Price/cost concepts (singular/plural)
+    {"price", "prices", "cost", "costs", "rate", "rates"},
+    # Update/modify concepts
+    {"update", "updatable", "modify", "change", "edit", "alter"},
+    # Action/view concepts (UI actions)
+    {"open", "view", "show", "display", "action"},
+    # Financial/invoice concepts
+    {"invoice", "invoiced", "bill", "billing", "charge"},
+    # Tax concepts
+    {"tax", "taxed", "untaxed", "exempt"},
+    # Amount/value concepts
+    {"amount", "amounts", "value", "values", "sum", "total"},
+    # Order/ordering concepts
+    {"order", "orders", "ordering", "sequence"},
+    # Assignment/log concepts
+    {"assign", "assignation", "allocation", "log", "logs", "history"},
+]
+
+# Bitmask of the synonym groups each word belongs to
+SYNONYM_MASKS = {}
+for _group_id, _group in enumerate(SYNONYM_GROUPS):
+    for _word in _group:
+        SYNONYM_MASKS[_word] = SYNONYM_MASKS.get(_word, 0) | (1 << _group_id)
+
+# Context words where item/product synonymy is invalid
+ITEM_PRODUCT_INVALID_CONTEXTS = {
+    # Financial/pricing contexts where item has different meaning
+    "pricelist",
+    "price",
+    "cost",
+    "invoice",
+    "bill",
+    # Document contexts where item means line items, not products
+    "document",
+    "report",
+    "list",
+    "menu",
+    "view",
+    # Configuration contexts
+    "config",
+    "setting",
+    "option",
+    "choice",
+}
+
+# Valid contexts where item/product synonymy makes sense
+ITEM_PRODUCT_VALID_CONTEXTS = {
+    # Sales/order contexts
+    "sale",
+    "order",
+    "line",
+    "qty",
+    "quantity",
+    # Inventory contexts
+    "stock",
+    "move",
+    "picking",
+    "delivery",
+    # General product-related contexts
+    "template",
+    "variant",
+    "attribute",
+}
+
+# Words commonly removed in refactoring
+REMOVABLE_WORDS = {
+    "related",
+    "associated",
+    "linked",
+    "ref",
+    "old",
+    "new",
+    "temp",
+    "tmp",
+}
+
+# Very common structural words ignored when comparing names
+STRUCTURAL_WORDS = {
+    "get",
+    "set",
+    "is",
+    "has",
+    "do",
+    "to",
+    "of",
+    "for",
+    "by",
+    "id",
+    "ids",
+}
+
+# Incompatible prefixes/patterns in Odoo
+ACTION_PATTERNS = ("action_", "button_", "open_", "show_")
+COMPUTE_PATTERNS = ("_compute_", "_calculate_", "_get_computed_")
+API_PATTERNS = ("api_", "json_", "jsonrpc_")
+INTERNAL_PATTERNS = ("_internal_", "_private_", "_helper_")
+
+# Below this many pairs the NumPy setup costs more than it saves
+NUMPY_MIN_PAIRS = 256
+
+_EDGE_UNDERSCORES_RE = re.compile(r"^_+|_+$")
+_UNDERSCORES_RE = re.compile(r"_+")
+_CAMEL_CASE_RE = re.compile(r"[A-Z]?[a-z]+|[A-Z]+(?=[A-Z][a-z]|\b)")
+
+
+@lru_cache(maxsize=16384)
+def extract_words(name: str) -> Tuple[str, ...]:
+    """Extract meaningful words from a method/field name"""
+    # Remove common prefixes/suffixes that are structural
+    name = _EDGE_UNDERSCORES_RE.sub("", name)
+
+    # Split on underscores and camelCase
+    result = []
+    for word in _UNDERSCORES_RE.split(name):
+        camel_words = _CAMEL_CASE_RE.findall(word)
+        if camel_words:
+            result.extend(w.lower() for w in camel_words)
+        else:
+            result.append(word.lower())
+
+    # Filter out very short words and common structural words
+    return tuple(w for w in result if len(w) > 2 and w not in STRUCTURAL_WORDS)
+
+
+class NameFeatures:
+    """Everything the similarity score needs from one name, computed once"""
+
+    __slots__ = (
+        "name",
+        "words",
+        "word_set",
+        "removable",
+        "synonym_words",
+        "has_item",
+        "has_product",
+        "has_invalid_context",
+        "has_valid_context",
+        "is_action",
+        "is_compute",
+        "is_api",
+        "is_internal",
+        "is_private",
+        "ends_with_id",
+        "ends_with_ids",
+    )
+
+    def __init__(self, name: str):
+        self.name = name
+        self.words = extract_words(name)
+        self.word_set = frozenset(self.words)
+        self.removable = self.word_set & REMOVABLE_WORDS
+        self.synonym_words = tuple(
+            (word, SYNONYM_MASKS[word])
+            for word in self.word_set
+            if word in SYNONYM_MASKS
+        )
+        self.has_item = "item" in self.word_set
+        self.has_product = "product" in self.word_set
+        self.has_invalid_context = not self.word_set.isdisjoint(
+            ITEM_PRODUCT_INVALID_CONTEXTS
+        )
+        self.has_valid_context = not self.word_set.isdisjoint(
+            ITEM_PRODUCT_VALID_CONTEXTS
+        )
+
+        lowered = name.lower()
+        self.is_action = lowered.startswith(ACTION_PATTERNS)
+        self.is_compute = lowered.startswith(COMPUTE_PATTERNS)
+        self.is_api = lowered.startswith(API_PATTERNS)
+        self.is_internal = lowered.startswith(INTERNAL_PATTERNS)
+
+        self.is_private = name.startswith("_")
+        self.ends_with_id = name.endswith("_id")
+        self.ends_with_ids = name.endswith("_ids")
+
+    def incompatible_with(self, other: "NameFeatures") -> bool:
+        """Action/compute and api/internal names never rename into each other"""
+        return (
+            (self.is_action and other.is_compute)
+            or (self.is_compute and other.is_action)
+            or (self.is_api and other.is_internal)
+        )
+
+    def structure_bonus(self, other: "NameFeatures") -> float:
+        """Bonus for similar structural patterns"""
+        if self.is_private == other.is_private:
+            return 0.1
+        if (self.ends_with_id and other.ends_with_id) or (
+            self.ends_with_ids and other.ends_with_ids
+        ):
+            return 0.1
+        return 0.0
+
+    def synonym_count(self, other: "NameFeatures") -> int:
+        """Number of distinct (word1, word2) synonym pairs between both names"""
+        count = 0
+        for word1, mask1 in self.synonym_words:
+            for word2, mask2 in other.synonym_words:
+                if word1 != word2 and mask1 & mask2:
+                    count += 1
+
+        # Special contextual matching for item/product
+        if (self.has_item and other.has_product) or (
+            self.has_product and other.has_item
+        ):
+            if not (self.has_invalid_context or other.has_invalid_context) and (
+                self.has_valid_context or other.has_valid_context
+            ):
+                count += (self.has_item and other.has_product) + (
+                    self.has_product and other.has_item
+                )
+        return count
+
+    def semantic_similarity(self, other: "NameFeatures") -> float:
+        """Word overlap similarity; same arithmetic as the scalar path"""
+        if not self.words or not other.words:
+            return 0.0
+
+        exact_common = len(self.word_set & other.word_set)
+        total_matches = exact_common + self.synonym_count(other)
+        total_words = len(self.word_set) + len(other.word_set) - exact_common
+
+        removable_common = len(self.removable & other.removable)
+        total_removable = (len(self.removable) - removable_common) + (
+            len(other.removable) - removable_common
+        )
+        max_total_words = max(len(self.words), len(other.words))
+        removal_bonus = min(0.2, (total_removable / max_total_words) * 0.3)
+
+        word_similarity = (total_matches / total_words) + removal_bonus
+        return min(1.0, word_similarity + self.structure_bonus(other))
+
+
+class BatchSimilarity:
+    """
+    Score every pair of two name lists in one call.
+
+    Args:
+        is_transformation: Optional callable(old, new) -> bool; pairs for which
+            it returns True score 0.9, as in the scalar path
+        use_numpy: Force (True) or disable (False) the NumPy matrix path; by
+            default it is used when available and the matrix is large enough
+        predict: Optional callable(old) -> set of new names, equivalent to
+            is_transformation but looked up once per old name instead of
+            once per pair (takes precedence over is_transformation)
+    """
+
+    def __init__(
+        self,
+        is_transformation: Optional[Callable[[str, str], bool]] = None,
+        use_numpy: Optional[bool] = None,
+        predict: Optional[Callable[[str], AbstractSet[str]]] = None,
+    ):
+        self.is_transformation = is_transformation
+        self.predict = predict
+        if use_numpy and np is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        self.use_numpy = use_numpy
+
+    def score_matrix(
+        self, names1: Sequence[str], names2: Sequence[str]
+    ) -> List[List[float]]:
+        """Similarity of names1[i] → names2[j] as a nested list"""
+        features1 = [NameFeatures(name) for name in names1]
+        features2 = [NameFeatures(name) for name in names2]
+
+        pairs = len(features1) * len(features2)
+        use_numpy = self.use_numpy
+        if use_numpy is None:
+            use_numpy = np is not None and pairs >= NUMPY_MIN_PAIRS
+
+        if use_numpy and pairs:
+            matrix = _semantic_matrix_numpy(features1, features2).tolist()
+        else:
+            matrix = [
+                [f1.semantic_similarity(f2) for f2 in features2] for f1 in features1
+            ]
+
+        # Overrides applied by the scalar path before the word similarity,
+        # written from lowest to highest precedence
+        columns_by_name = {}
+        for j, f2 in enumerate(features2):
+            columns_by_name.setdefault(f2.name, []).append(j)
+        action_columns = [j for j, f2 in enumerate(features2) if f2.is_action]
+        compute_columns = [j for j, f2 in enumerate(features2) if f2.is_compute]
+        internal_columns = [j for j, f2 in enumerate(features2) if f2.is_internal]
+        empty_columns = columns_by_name.get("", [])
+
+        for i, f1 in enumerate(features1):
+            row = matrix[i]
+
+            # Known naming rule transformation
+            if self.predict is not None:
+                for new_name in self.predict(f1.name):
+                    for j in columns_by_name.get(new_name, ()):
+                        row[j] = 0.9
+            elif self.is_transformation is not None:
+                for j, f2 in enumerate(features2):
+                    if self.is_transformation(f1.name, f2.name):
+                        row[j] = 0.9
+
+            # Semantically incompatible patterns
+            for flag, columns in (
+                (f1.is_action, compute_columns),
+                (f1.is_compute, action_columns),
+                (f1.is_api, internal_columns),
+            ):
+                if flag:
+                    for j in columns:
+                        row[j] = 0.0
+
+            # Empty names
+            if not f1.name:
+                row[:] = [0.0] * len(row)
+            for j in empty_columns:
+                row[j] = 0.0
+
+            # Identical names
+            for j in columns_by_name.get(f1.name, ()):
+                row[j] = 1.0
+
+        return matrix
+
+    def scored_pairs(
+        self, names1: Sequence[str], names2: Sequence[str]
+    ) -> List[Tuple[float, str, str]]:
+        """All (similarity, name1, name2) with non-zero similarity"""
+        matrix = self.score_matrix(names1, names2)
+        return [
+            (similarity, name1, names2[j])
+            for name1, row in zip(names1, matrix)
+            for j, similarity in enumerate(row)
+            if similarity > 0
+        ]
+
+
+def _semantic_matrix_numpy(
+    features1: List[NameFeatures], features2: List[NameFeatures]
+) -> "np.ndarray":
+    """NumPy version of NameFeatures.semantic_similarity() for all pairs"""
+    vocabulary = {}
+    for features in (features1, features2):
+        for f in features:
+            for word in f.word_set:
+                vocabulary.setdefault(word, len(vocabulary))
+
+    def incidence(features):
+        matrix = np.zeros((len(features), len(vocabulary)))
+        for row, f in enumerate(features):
+            matrix[row, [vocabulary[w] for w in f.word_set]] = 1.0
+        return matrix
+
+    def column(features, attribute):
+        return np.array([getattr(f, attribute) for f in features])
+
+    words1 = incidence(features1)
+    words2 = incidence(features2)
+
+    # Word-to-word synonym relation (same group, different word)
+    masks = np.array(
+        [SYNONYM_MASKS.get(word, 0) for word in vocabulary], dtype=np.int64
+    )
+    synonyms = (masks[:, None] & masks[None, :]) != 0
+    np.fill_diagonal(synonyms, False)
+
+    exact_common = words1 @ words2.T
+    synonym_count = (words1 @ synonyms) @ words2.T
+
+    # Item/product contextual synonymy
+    context_ok = ~(
+        column(features1, "has_invalid_context")[:, None]
+        | column(features2, "has_invalid_context")[None, :]
+    ) & (
+        column(features1, "has_valid_context")[:, None]
+        | column(features2, "has_valid_context")[None, :]
+    )
+    item_product = (
+        column(features1, "has_item")[:, None]
+        & column(features2, "has_product")[None, :]
+    ).astype(float) + (
+        column(features1, "has_product")[:, None]
+        & column(features2, "has_item")[None, :]
+    )
+    synonym_count += item_product * context_ok
+
+    set_sizes1 = words1.sum(axis=1)
+    set_sizes2 = words2.sum(axis=1)
+    total_words = set_sizes1[:, None] + set_sizes2[None, :] - exact_common
+    total_matches = exact_common + synonym_count
+
+    removable_columns = [i for w, i in vocabulary.items() if w in REMOVABLE_WORDS]
+    removable1 = words1[:, removable_columns]
+    removable2 = words2[:, removable_columns]
+    removable_common = removable1 @ removable2.T
+    total_removable = (removable1.sum(axis=1)[:, None] - removable_common) + (
+        removable2.sum(axis=1)[None, :] - removable_common
+    )
+    word_counts1 = np.array([len(f.words) for f in features1])
+    word_counts2 = np.array([len(f.words) for f in features2])
+    max_total_words = np.maximum(word_counts1[:, None], word_counts2[None, :])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        removal_bonus = np.minimum(0.2, (total_removable / max_total_words) * 0.3)
+        word_similarity = (total_matches / total_words) + removal_bonus
+
+    private1 = column(features1, "is_private")
+    private2 = column(features2, "is_private")
+    same_suffix = (
+        column(features1, "ends_with_id")[:, None]
+        & column(features2, "ends_with_id")[None, :]
+    ) | (
+        column(features1, "ends_with_ids")[:, None]
+        & column(features2, "ends_with_ids")[None, :]
+    )
+    structure_bonus = np.where(
+        (private1[:, None] == private2[None, :]) | same_suffix, 0.1, 0.0
+    )
+
+    similarity = np.minimum(1.0, word_similarity + structure_bonus)
+
+    # Names without meaningful words score 0 in the scalar path
+    has_words = (word_counts1[:, None] > 0) & (word_counts2[None, :] > 0)
+    return np.where(has_words, similarity, 0.0)
@@ -581,6 +581,104 @@ CONTEXTUAL_PATTERNS = [
 ]
 
 
+class CompiledRule:
+    """Naming rule with its regex compiled and the literal text it anchors on"""
+
+    __slots__ = ("rule", "regex", "prefix", "suffix", "predicts")
+
+    def __init__(self, rule: dict):
+        self.rule = rule
+        self.regex = re.compile(rule["pattern"])
+        self.prefix, self.suffix = _literal_anchors(rule["pattern"])
+        # Rules trusted enough to count as a known transformation
+        self.predicts = not rule.get("validation_only", False) and rule["weight"] >= 0.9
+
+    def apply(self, name: str) -> str | None:
+        """Predicted new name, or None when the rule does not match"""
+        if self.regex.match(name):
+            return self.regex.sub(self.rule["replacement"], name)
+        return None
+
+
+class RuleIndex:
+    """
+    Rules indexed by the literal prefix of their pattern.
+
+    Only rules whose literal prefix and suffix are present in a name are
+    returned as candidates, in their original table order.
+    """
+
+    def __init__(self, rules: list[dict]):
+        self.rules = [CompiledRule(rule) for rule in rules]
+        self._by_prefix: dict[str, list[int]] = {}
+        for position, compiled in enumerate(self.rules):
+            self._by_prefix.setdefault(compiled.prefix, []).append(position)
+        self._prefix_lengths = sorted({len(prefix) for prefix in self._by_prefix})
+
+    def candidates(self, name: str) -> list[CompiledRule]:
+        """Rules that can possibly match name, in table order"""
+        positions = []
+        for length in self._prefix_lengths:
+            if length > len(name):
+                break
+            positions.extend(self._by_prefix.get(name[:length], ()))
+        positions.sort()
+        return [
+            self.rules[position]
+            for position in positions
+            if name.endswith(self.rules[position].suffix)
+        ]
+
+
+def _literal_anchors(pattern: str) -> tuple[str, str]:
+    """
+    Literal text a ^...$ anchored pattern requires at the start and end.
+
+    Conservative: anything that is not a plain identifier character ends the
+    literal run, and patterns with top-level alternation get no anchors.
+    """
+    depth = 0
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return "", ""
+
+    def is_literal(char: str) -> bool:
+        return char.isalnum() or char == "_"
+
+    prefix = ""
+    if pattern.startswith("^"):
+        body = pattern[1:]
+        length = 0
+        while length < len(body) and is_literal(body[length]):
+            length += 1
+        # A quantifier after the run makes its last character optional
+        if length < len(body) and body[length] in "?*{":
+            length -= 1
+        prefix = body[:max(length, 0)]
+
+    suffix = ""
+    if pattern.endswith("$") and not pattern.endswith("\\$"):
+        body = pattern[:-1]
+        start = len(body)
+        while start > 0 and is_literal(body[start - 1]):
+            start -= 1
+        # An escape before the run turns its first character into a class
+        if start > 0 and body[start - 1] == "\\":
+            start += 1
+        suffix = body[start:]
+
+    return prefix, suffix
+
+
 class NamingRuleEngine:
     """Engine for applying and validating naming rules"""
 
@@ -590,19 +688,38 @@ class NamingRuleEngine:
         self.api_patterns = API_STYLE_PATTERNS
         self.contextual_patterns = CONTEXTUAL_PATTERNS
 
+        # Rule tables compiled once and indexed by literal prefix/suffix
+        self._field_index = RuleIndex(self.field_rules)
+        self._method_index = RuleIndex(self.method_rules)
+        self._validation_rules = [
+            compiled
+            for compiled in self._field_index.rules
+            if compiled.rule.get("validation_only", False)
+        ]
+        self._api_regexes = [
+            (re.compile(p["old_pattern"]), re.compile(p["new_pattern"]), p)
+            for p in self.api_patterns
+        ]
+        self._contextual_regexes = [
+            (re.compile(p["old_pattern"]), re.compile(p["new_pattern"]), p)
+            for p in self.contextual_patterns
+        ]
+        self._predictions: dict[str, frozenset[str]] = {}
+
     def apply_field_rule(
         self, old_name: str, field_type: str | None = None
     ) -> list[dict]:
         """Apply field naming rules to predict new name"""
         matches = []
 
-        for rule in self.field_rules:
+        for compiled in self._field_index.candidates(old_name):
+            rule = compiled.rule
             if rule.get("validation_only", False):
                 # Skip validation-only rules for prediction
                 continue
 
-            if re.match(rule["pattern"], old_name):
-                predicted_name = re.sub(rule["pattern"], rule["replacement"], old_name)
+            predicted_name = compiled.apply(old_name)
+            if predicted_name is not None:
                 matches.append(
                     {
                         "predicted_name": predicted_name,
@@ -619,10 +736,10 @@ class NamingRuleEngine:
         """Apply method naming rules to predict new name"""
         matches = []
 
-        for rule in self.method_rules:
-            if re.match(rule["pattern"], old_name):
-                predicted_name = re.sub(rule["pattern"], rule["replacement"], old_name)
-
+        for compiled in self._method_index.candidates(old_name):
+            rule = compiled.rule
+            predicted_name = compiled.apply(old_name)
+            if predicted_name is not None:
                 # Bonus if decorators match expected ones
                 confidence = rule["weight"]
                 if decorators and rule.get("decorators"):
@@ -645,12 +762,10 @@ class NamingRuleEngine:
         """Validate field follows naming conventions"""
         validations = []
 
-        for rule in self.field_rules:
-            if not rule.get("validation_only", False):
-                continue
-
+        for compiled in self._validation_rules:
+            rule = compiled.rule
             if rule.get("field_types") and field_type in rule["field_types"]:
-                if re.match(rule["pattern"], field_name):
+                if compiled.regex.match(field_name):
                     validations.append(
                         {
                             "type": "convention_followed",
@@ -673,9 +788,9 @@ class NamingRuleEngine:
         self, old_definition: str, new_definition: str
     ) -> dict | None:
         """Detect Old API → New API style changes"""
-        for pattern in self.api_patterns:
-            old_match = re.search(pattern["old_pattern"], old_definition)
-            new_match = re.search(pattern["new_pattern"], new_definition)
+        for old_regex, new_regex, pattern in self._api_regexes:
+            old_match = old_regex.search(old_definition)
+            new_match = new_regex.search(new_definition)
 
             if old_match and new_match:
                 return {
@@ -688,36 +803,33 @@ class NamingRuleEngine:
 
         return None
 
+    def predict(self, old_name: str) -> frozenset[str]:
+        """
+        New names that old_name becomes under a known transformation.
+
+        Only high-confidence (weight >= 0.9), non validation-only rules of both
+        tables count. Results are memoized per name.
+        """
+        predicted = self._predictions.get(old_name)
+        if predicted is None:
+            names = set()
+            for index in (self._field_index, self._method_index):
+                for compiled in index.candidates(old_name):
+                    if compiled.predicts:
+                        predicted_name = compiled.apply(old_name)
+                        if predicted_name is not None:
+                            names.add(predicted_name)
+            predicted = self._predictions[old_name] = frozenset(names)
+        return predicted
+
     def is_transformation(self, old_name: str, new_name: str) -> bool:
         """Check if old_name -> new_name follows a known naming rule transformation"""
-        # Check field rules
-        for rule in self.field_rules:
-            if rule.get("validation_only", False):
-                # Skip validation-only rules for transformation checking
-                continue
-            if re.match(rule["pattern"], old_name):
-                predicted_name = re.sub(rule["pattern"], rule["replacement"], old_name)
-                if predicted_name == new_name and rule["weight"] >= 0.9:
-                    return True
-
-        # Check method rules
-        for rule in self.method_rules:
-            if rule.get("validation_only", False):
-                # Skip validation-only rules for transformation checking
-                continue
-            if re.match(rule["pattern"], old_name):
-                predicted_name = re.sub(rule["pattern"], rule["replacement"], old_name)
-                if predicted_name == new_name and rule["weight"] >= 0.9:
-                    return True
-
-        return False
+        return new_name in self.predict(old_name)
 
     def check_contextual_similarity(self, old_name: str, new_name: str) -> dict | None:
         """Check for contextual similarity patterns"""
-        for pattern in self.contextual_patterns:
-            if re.match(pattern["old_pattern"], old_name) and re.match(
-                pattern["new_pattern"], new_name
-            ):
+        for old_regex, new_regex, pattern in self._contextual_regexes:
+            if old_regex.match(old_name) and new_regex.match(new_name):
                 if pattern.get("validation") == "same_components":
                     # Check if field components are the same
                     old_parts = set(old_name.split("_"))
@@ -58,6 +58,18 @@ ANALYZE_CATEGORIES = ["models", "wizards"]  # From modified_modules.json
 LOG_LEVEL = "INFO"
 LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
+# Rename matching strategy: "greedy" (two-phase pass) or "optimal"
+# (bipartite assignment); slack = extra old names one new name may absorb
+DEFAULT_MATCHING_STRATEGY = "greedy"
+DEFAULT_ASSIGNMENT_SLACK = 1
+
+# Parallel analysis (worker processes, 0 = one per CPU)
+DEFAULT_JOBS = 1
+
+# Extracted model cache (keyed by git blob SHA + extractor version)
+DEFAULT_MODEL_CACHE_DIR = str(Path(__file__).resolve().parent.parent / ".cache")
+DEFAULT_MODEL_CACHE_MAX_MB = 256
+
 # Progress reporting
 SHOW_PROGRESS_BAR = True
 PROGRESS_UPDATE_INTERVAL = 10  # Every N files
@@ -85,6 +97,21 @@ class Config:
         self.output_csv = os.getenv("OUTPUT_CSV", DEFAULT_OUTPUT_CSV)
         self.report_file = os.getenv("REPORT_FILE", DEFAULT_REPORT_FILE)
 
+        self.matching_strategy = os.getenv(
+            "MATCHING_STRATEGY", DEFAULT_MATCHING_STRATEGY
+        ).lower()
+        self.assignment_slack = int(
+            os.getenv("ASSIGNMENT_SLACK", DEFAULT_ASSIGNMENT_SLACK)
+        )
+
+        self.jobs = int(os.getenv("JOBS", DEFAULT_JOBS))
+
+        self.use_model_cache = os.getenv("MODEL_CACHE", "true").lower() == "true"
+        self.model_cache_dir = os.getenv("MODEL_CACHE_DIR", DEFAULT_MODEL_CACHE_DIR)
+        self.model_cache_max_mb = int(
+            os.getenv("MODEL_CACHE_MAX_MB", DEFAULT_MODEL_CACHE_MAX_MB)
+        )
+
         self.log_level = os.getenv("LOG_LEVEL", LOG_LEVEL)
         self.show_progress = (
             os.getenv("SHOW_PROGRESS", str(SHOW_PROGRESS_BAR)).lower() == "true"
@@ -106,6 +133,18 @@ class Config:
                 "Auto-approve threshold must be higher than confidence threshold"
             )
 
+        if self.matching_strategy not in ("greedy", "optimal"):
+            raise ValueError("Matching strategy must be 'greedy' or 'optimal'")
+
+        if self.assignment_slack < 0:
+            raise ValueError("Assignment slack must be zero or positive")
+
+        if self.jobs < 0:
+            raise ValueError("Jobs must be 0 (one per CPU) or a positive number")
+
+        if self.model_cache_max_mb <= 0:
+            raise ValueError("Model cache size must be a positive number of MB")
+
     def get_repo_path_from_json(self, json_file_path: str) -> str:
         """Auto-detect repository path from JSON file location"""
         if self.repo_path:
@@ -51,6 +51,13 @@ class InheritanceGraph:
         # Cache for expensive operations
         self._inheritance_chains_cache: Dict[str, List[str]] = {}
         self._resolved_methods_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        self._resolved_fields_cache: Dict[Tuple[str, str], Optional[str]] = {}
+
+        # Transitive closure, built on first query and dropped by add_model()
+        self._closure_built = False
+        self._descendants: Dict[str, List[str]] = {}
+        self._method_definers: Dict[str, Set[str]] = {}  # method -> models
+        self._field_definers: Dict[str, Set[str]] = {}  # field -> models
 
     def add_model(self, model: Model) -> None:
         """
@@ -96,13 +103,11 @@ class InheritanceGraph:
         Returns:
             List of model names in inheritance order
         """
-        if model_name in self._inheritance_chains_cache:
-            return self._inheritance_chains_cache[model_name]
-
-        if model_name not in self.models:
-            return []
+        self.build_closure()
+        return self._inheritance_chains_cache.get(model_name, [])
 
-        # BFS to build inheritance chain
+    def _compute_inheritance_chain(self, model_name: str) -> List[str]:
+        """BFS over the parents of a model (child first, cycles cut)"""
         chain = []
         visited = set()
         queue = deque([model_name])
@@ -119,12 +124,41 @@ class InheritanceGraph:
             parents = self.reverse_inheritance.get(current, [])
             queue.extend(parents)
 
-        # Cache result
-        self._inheritance_chains_cache[model_name] = chain
-
-        logger.debug(f"Inheritance chain for {model_name}: {chain}")
         return chain
 
+    def build_closure(self) -> None:
+        """
+        Precompute ancestors, descendants and definition indexes.
+
+        Runs once after the models have been added; add_model() invalidates
+        it, and the next query rebuilds it. Afterwards inheritance chains and
+        descendants are dictionary lookups, and definition lookups only walk
+        the chain against a set of defining models.
+        """
+        if self._closure_built:
+            return
+
+        descendants = defaultdict(list)
+        for model_name in self.models:
+            chain = self._compute_inheritance_chain(model_name)
+            self._inheritance_chains_cache[model_name] = chain
+            for ancestor in chain[1:]:
+                descendants[ancestor].append(model_name)
+        self._descendants = dict(descendants)
+
+        method_definers = defaultdict(set)
+        field_definers = defaultdict(set)
+        for model_name, model in self.models.items():
+            for method in model.methods:
+                method_definers[method.name].add(model_name)
+            for field_info in model.fields:
+                field_definers[field_info.name].add(model_name)
+        self._method_definers = dict(method_definers)
+        self._field_definers = dict(field_definers)
+
+        self._closure_built = True
+        logger.debug(f"Built inheritance closure for {len(self.models)} models")
+
     def find_method_definition(
         self, model_name: str, method_name: str
     ) -> Optional[str]:
@@ -140,33 +174,7 @@ class InheritanceGraph:
         Returns:
             Name of the model where the method is defined, or None if not found
         """
-        cache_key = (model_name, method_name)
-        if cache_key in self._resolved_methods_cache:
-            return self._resolved_methods_cache[cache_key]
-
-        # Search inheritance chain
-        inheritance_chain = self.get_inheritance_chain(model_name)
-
-        for model in inheritance_chain:
-            model_obj = self.models.get(model)
-            if not model_obj:
-                continue
-
-            # Check if this model defines the method
-            for method in model_obj.methods:
-                if method.name == method_name:
-                    self._resolved_methods_cache[cache_key] = model
-                    logger.debug(
-                        f"Method {method_name} for {model_name} defined in {model}"
-                    )
-                    return model
-
-        # Method not found in inheritance chain
-        self._resolved_methods_cache[cache_key] = None
-        logger.debug(
-            f"Method {method_name} not found in inheritance chain for {model_name}"
-        )
-        return None
+        return self._find_definition(model_name, method_name, "method")
 
     def find_field_definition(self, model_name: str, field_name: str) -> Optional[str]:
         """
@@ -179,26 +187,37 @@ class InheritanceGraph:
         Returns:
             Name of the model where the field is defined, or None if not found
         """
-        # Search inheritance chain
-        inheritance_chain = self.get_inheritance_chain(model_name)
-
-        for model in inheritance_chain:
-            model_obj = self.models.get(model)
-            if not model_obj:
-                continue
+        return self._find_definition(model_name, field_name, "field")
 
-            # Check if this model defines the field
-            for field_info in model_obj.fields:
-                if field_info.name == field_name:
-                    logger.debug(
-                        f"Field {field_name} for {model_name} defined in {model}"
-                    )
-                    return model
-
-        logger.debug(
-            f"Field {field_name} not found in inheritance chain for {model_name}"
-        )
-        return None
+    def _find_definition(
+        self, model_name: str, item_name: str, item_type: str
+    ) -> Optional[str]:
+        """First model in the inheritance chain that defines a method/field"""
+        if item_type == "method":
+            cache = self._resolved_methods_cache
+        else:
+            cache = self._resolved_fields_cache
+
+        cache_key = (model_name, item_name)
+        if cache_key in cache:
+            return cache[cache_key]
+
+        self.build_closure()
+        if item_type == "method":
+            defining_models = self._method_definers.get(item_name)
+        else:
+            defining_models = self._field_definers.get(item_name)
+
+        owner = None
+        if defining_models:
+            for model in self._inheritance_chains_cache.get(model_name, []):
+                if model in defining_models:
+                    owner = model
+                    break
+
+        cache[cache_key] = owner
+        logger.debug(f"{item_type} {item_name} for {model_name} defined in {owner}")
+        return owner
 
     def find_all_references(
         self,
@@ -254,6 +273,35 @@ class InheritanceGraph:
         """
         return self.inheritance_edges.get(model_name, [])
 
+    def get_descendant_models(self, model_name: str) -> List[str]:
+        """
+        Get all models that inherit from the given model, directly or not.
+
+        Args:
+            model_name: Name of the ancestor model
+
+        Returns:
+            List of descendant model names
+        """
+        self.build_closure()
+        return self._descendants.get(model_name, [])
+
+    def get_defining_models(self, item_name: str, item_type: str) -> Set[str]:
+        """
+        Get the models that declare a method or field with the given name.
+
+        Args:
+            item_name: Name of the method or field
+            item_type: 'method' or 'field'
+
+        Returns:
+            Set of model names
+        """
+        self.build_closure()
+        if item_type == "method":
+            return self._method_definers.get(item_name, set())
+        return self._field_definers.get(item_name, set())
+
     def get_parent_models(self, model_name: str) -> List[str]:
         """
         Get all models that the given model inherits from.
@@ -327,6 +375,11 @@ class InheritanceGraph:
         """Clear all internal caches"""
         self._inheritance_chains_cache.clear()
         self._resolved_methods_cache.clear()
+        self._resolved_fields_cache.clear()
+        self._closure_built = False
+        self._descendants = {}
+        self._method_definers = {}
+        self._field_definers = {}
 
     def validate_graph_integrity(self) -> List[str]:
         """
@@ -0,0 +1,221 @@
+"""
+Persistent Cache of Extracted Models
+====================================
+
+Stores the Model/Field/Method/Reference lists extracted from a Python file,
+keyed by the Git blob SHA of its contents and the extractor version. Blobs
+are immutable, so a cached extraction stays valid until the extractor itself
+changes; re-running the detector over the same commits skips parsing.
+
+Entries live in a single SQLite database and are evicted least recently used
+first once the stored payloads exceed the configured size.
+"""
+
+import logging
+import pickle
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from analyzers.ast_visitor import EXTRACTOR_VERSION
+from core.models import Model, pack_models, unpack_models
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ModelCache:
+    """On-disk cache of extracted models keyed by blob SHA + extractor version"""
+
+    DB_NAME = "models.sqlite3"
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        extractor_version: str = EXTRACTOR_VERSION,
+    ):
+        """
+        Args:
+            cache_dir: Directorio donde se crea la base de datos
+            max_bytes: Tamaño máximo de los payloads almacenados antes de desalojar
+            extractor_version: Versión del extractor; entradas de otras versiones se ignoran
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.extractor_version = extractor_version
+        self.hits = 0
+        self.misses = 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.cache_dir / self.DB_NAME))
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS models (
+                blob_sha TEXT NOT NULL,
+                extractor_version TEXT NOT NULL,
+                file_path TEXT NOT NULL,
+                payload BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access INTEGER NOT NULL,
+                PRIMARY KEY (blob_sha, extractor_version)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS models_last_access ON models (last_access)"
+        )
+        self._conn.commit()
+
+        # Logical clock for LRU ordering; immune to coarse wall clock resolution
+        (self._clock,) = self._conn.execute(
+            "SELECT COALESCE(MAX(last_access), 0) FROM models"
+        ).fetchone()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get_many(self, blob_paths: Dict[str, str]) -> Dict[str, List[Model]]:
+        """
+        Look up cached extractions.
+
+        Args:
+            blob_paths: Mapping file_path -> blob SHA
+
+        Returns:
+            Mapping file_path -> models for the paths found in the cache
+        """
+        if not blob_paths:
+            return {}
+
+        shas = sorted(set(blob_paths.values()))
+        now = self._tick()
+        rows = {}
+        # Stay below SQLite's host parameter limit
+        for start in range(0, len(shas), 500):
+            chunk = shas[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            cursor = self._conn.execute(
+                f"SELECT blob_sha, file_path, payload FROM models "
+                f"WHERE extractor_version = ? AND blob_sha IN ({placeholders})",
+                [self.extractor_version, *chunk],
+            )
+            for blob_sha, cached_path, payload in cursor:
+                rows[blob_sha] = (cached_path, payload)
+            self._conn.execute(
+                f"UPDATE models SET last_access = ? "
+                f"WHERE extractor_version = ? AND blob_sha IN ({placeholders})",
+                [now, self.extractor_version, *chunk],
+            )
+        self._conn.commit()
+
+        found = {}
+        for file_path, blob_sha in blob_paths.items():
+            row = rows.get(blob_sha)
+            if row is None:
+                continue
+            cached_path, payload = row
+            try:
+                models = unpack_models(pickle.loads(payload))
+            except Exception as e:
+                logger.warning(f"Discarding unreadable cache entry {blob_sha}: {e}")
+                continue
+            if cached_path != file_path:
+                _relocate_models(models, file_path)
+            found[file_path] = models
+
+        self.hits += len(found)
+        self.misses += len(blob_paths) - len(found)
+        return found
+
+    def get(self, blob_sha: str, file_path: str) -> Optional[List[Model]]:
+        """Cached models for a single blob, or None when not cached"""
+        return self.get_many({file_path: blob_sha}).get(file_path)
+
+    def put_many(self, entries: Dict[str, tuple[str, List[Model]]]) -> None:
+        """
+        Store extractions and evict old entries if the cache grew too large.
+
+        Args:
+            entries: Mapping blob SHA -> (file_path, models)
+        """
+        if not entries:
+            return
+
+        now = self._tick()
+        rows = []
+        for blob_sha, (file_path, models) in entries.items():
+            payload = pickle.dumps(pack_models(models), pickle.HIGHEST_PROTOCOL)
+            rows.append(
+                (
+                    blob_sha,
+                    self.extractor_version,
+                    file_path,
+                    payload,
+                    len(payload),
+                    now,
+                )
+            )
+
+        self._conn.executemany(
+            "INSERT OR REPLACE INTO models VALUES (?, ?, ?, ?, ?, ?)", rows
+        )
+        self._conn.commit()
+        self._evict()
+
+    def put(self, blob_sha: str, file_path: str, models: List[Model]) -> None:
+        """Store the extraction of a single blob"""
+        self.put_many({blob_sha: (file_path, models)})
+
+    def total_size(self) -> int:
+        """Total size in bytes of the stored payloads"""
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM models"
+        ).fetchone()
+        return total
+
+    def _tick(self) -> int:
+        """Advance the logical access clock"""
+        self._clock += 1
+        return self._clock
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        excess = self.total_size() - self.max_bytes
+        if excess <= 0:
+            return
+
+        doomed = []
+        cursor = self._conn.execute(
+            "SELECT blob_sha, extractor_version, size FROM models "
+            "ORDER BY last_access ASC"
+        )
+        for blob_sha, version, size in cursor:
+            if excess <= 0:
+                break
+            doomed.append((blob_sha, version))
+            excess -= size
+
+        self._conn.executemany(
+            "DELETE FROM models WHERE blob_sha = ? AND extractor_version = ?", doomed
+        )
+        self._conn.commit()
+        logger.debug(f"Evicted {len(doomed)} cached extractions")
+
+
+def _relocate_models(models: List[Model], file_path: str) -> None:
+    """Point models extracted from an identical blob at another path"""
+    for model in models:
+        model.file_path = file_path
+        for item in model.fields + model.methods + model.references:
+            item.source_file = file_path
@@ -71,23 +71,38 @@ class ModelRegistry:
             with open(file_path, "r", encoding="utf-8") as f:
                 content = f.read()
 
-            models = self._extract_models_from_content(content, file_path)
-
-            if models:
-                logger.debug(f"Extracted {len(models)} models from {file_path}")
-                self.file_models[file_path] = models
-
-                # Add to registry by model name
-                for model in models:
-                    model_name = model.name
-                    if model_name:
-                        if model_name not in self.models:
-                            self.models[model_name] = []
-                        self.models[model_name].append(model)
+            self.add_file_content(file_path, content)
 
         except Exception as e:
             logger.error(f"Failed to process file {file_path}: {e}")
 
+    def add_file_content(self, file_path: str, content: str) -> List[Model]:
+        """
+        Register the models defined in already loaded Python source
+
+        Args:
+            file_path: Path used to identify the file (e.g. repository-relative)
+            content: Python source code of the file
+
+        Returns:
+            List of models extracted from the content
+        """
+        models = self._extract_models_from_content(content, file_path)
+
+        if models:
+            logger.debug(f"Extracted {len(models)} models from {file_path}")
+            self.file_models[file_path] = models
+
+            # Add to registry by model name
+            for model in models:
+                model_name = model.name
+                if model_name:
+                    if model_name not in self.models:
+                        self.models[model_name] = []
+                    self.models[model_name].append(model)
+
+        return models
+
     def _extract_models_from_content(self, content: str, file_path: str) -> List[Model]:
         """Extract model definitions from Python file content"""
         try:
@@ -41,9 +41,11 @@ Examples:
 import argparse
 import json
 import logging
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 # Local imports
 from analyzers.git_analyzer import GitAnalyzer, GitRepositoryError
@@ -54,8 +56,12 @@ from core.models import (
     ValidationStatus,
     ChangeScope,
     ImpactType,
+    copy_models,
+    pack_models,
+    unpack_models,
 )
 from config.settings import Config
+from core.model_cache import ModelCache
 from core.model_registry import ModelRegistry
 from core.inheritance_graph import InheritanceGraph
 from core.model_flattener import ModelFlattener
@@ -67,6 +73,8 @@ from analyzers.cross_reference_analyzer import CrossReferenceAnalyzer
 current_dir = Path(__file__).parent
 sys.path.insert(0, str(current_dir))
 
+logger = logging.getLogger(__name__)
+
 
 # =====================================
 # CONFIGURATION AND SETUP UTILITIES
@@ -100,6 +108,17 @@ def setup_logging(verbose: bool = False) -> None:
     logging.getLogger("requests").setLevel(logging.WARNING)
 
 
+def non_negative_int(value: str) -> int:
+    """Tipo argparse para enteros mayores o iguales a cero"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or positive, got {number}")
+    return number
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parsea argumentos de línea de comandos con validaciones completas.
@@ -184,6 +203,18 @@ Examples:
         default=0.50,
         help="Confidence threshold for auto-approval (0.0-1.0, default: %(default)s)",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=non_negative_int,
+        default=None,
+        help="Worker processes for module analysis (0 = one per CPU, default: JOBS or 1)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the on-disk cache of extracted models and parse every file",
+    )
 
     # Mode selection
     parser.add_argument(
@@ -460,14 +491,13 @@ def _build_registries_for_commits(
         Tupla con (registry_before, registry_after)
 
     Performance Notes:
-        - Cada registro se construye con una sola operación de checkout
-        - Se restaura el commit original automáticamente
+        - Cada registro se construye leyendo blobs Git, sin checkout
+        - El work tree no se modifica
         - Maneja errores de archivos no encontrados gracefully
-        - Utiliza cache interno del ModelRegistry para evitar re-parsing
     """
     logger.debug(f"Building model registries for {len(python_files)} Python files")
 
-    # Construir registros en secuencia (no paralelizable debido a Git checkout)
+    # Construir registros leyendo blobs de cada commit (sin checkout)
     registry_before = build_registry_for_commit(python_files, git_analyzer, commit_from)
     registry_after = build_registry_for_commit(python_files, git_analyzer, commit_to)
 
@@ -847,12 +877,12 @@ def build_registry_for_commit(
     """
     Construye un ModelRegistry completo para un commit específico.
 
-    Este método maneja operaciones Git de forma altamente optimizada:
+    Lee el código directamente de los objetos Git (tree/blob) del commit,
+    sin hacer checkout ni tocar el work tree:
     1. Extrae paths de módulos automáticamente desde lista de archivos
-    2. Hace checkout al commit target una sola vez (no por archivo)
-    3. Procesa todos los módulos encontrados en batch
-    4. Restaura commit original automáticamente en bloque finally
-    5. Maneja errores de archivos faltantes gracefully
+    2. Lista los blobs Python de esos módulos con `git ls-tree -r`
+    3. Lee todos los blobs en lote con `git cat-file --batch`
+    4. Alimenta cada contenido a ModelRegistry sin pasar por disco
 
     Args:
         files: Lista de archivos Python a procesar. Se usan para inferir
@@ -866,15 +896,14 @@ def build_registry_for_commit(
         y referencias cruzadas para todos los modelos descubiertos.
 
     Performance Notes:
-        - Una sola operación checkout por commit (no por archivo)
-        - Extrae paths de módulos automáticamente usando patrón "addons/"
-        - Cache interno en ModelRegistry evita re-parsing de archivos
-        - Batch processing de todos los módulos encontrados
+        - Sin checkout: el work tree y HEAD no se modifican, por lo que
+          varias detecciones pueden ejecutarse en paralelo sobre el mismo clon
+        - Dos procesos Git por commit (ls-tree + cat-file), no por archivo
+        - Blobs idénticos entre archivos se leen una sola vez
 
     Error Handling:
-        - Si checkout falla, propaga GitRepositoryError
-        - Si archivos individuales fallan, los omite con warning
-        - Siempre restaura commit original en bloque finally
+        - Si Git falla, registra el error y retorna el registry parcial
+        - Si algún blob no puede leerse, lo omite con warning
         - Si no se encuentran paths válidos, retorna registry vacío con warning
 
     Module Discovery:
@@ -910,15 +939,27 @@ def build_registry_for_commit(
 
     logger.debug(f"Discovered {len(module_paths)} module paths: {sorted(module_paths)}")
 
-    # Optimización crítica: un solo checkout, procesar todo, restaurar
-    current_commit = git_analyzer.get_current_commit()
     try:
-        logger.debug(f"Checking out commit {commit[:8]} for registry construction")
-        git_analyzer.checkout_commit(commit)
+        # Listar blobs Python de los módulos directamente desde el tree del commit
+        tree_entries = git_analyzer.list_tree_at_commit(commit, sorted(module_paths))
+        python_blobs = {
+            path: blob_sha
+            for path, blob_sha in tree_entries.items()
+            if path.endswith(".py")
+        }
+        logger.debug(
+            f"Reading {len(python_blobs)} Python blobs at commit {commit[:8]}"
+        )
 
-        # Procesar todos los módulos en el commit actual
-        logger.debug(f"Scanning {len(module_paths)} module paths")
-        registry.scan_modules(list(module_paths))
+        # Leer todos los blobs en lote (sin checkout)
+        contents = git_analyzer.read_blobs(list(python_blobs.values()))
+
+        for path in sorted(python_blobs):
+            content = contents.get(python_blobs[path])
+            if content is None:
+                logger.warning(f"Blob for {path} missing at commit {commit[:8]}")
+                continue
+            registry.add_file_content(path, content)
 
         # Log estadísticas del registry construido
         discovered_models = registry.get_all_model_names()
@@ -933,15 +974,6 @@ def build_registry_for_commit(
         logger.error(f"Error building registry for commit {commit[:8]}: {e}")
         # No re-raise para permitir fallback graceful
 
-    finally:
-        # Siempre restaurar commit original
-        if current_commit:
-            logger.debug(f"Restoring original commit {current_commit[:8]}")
-            try:
-                git_analyzer.checkout_commit(current_commit)
-            except Exception as restore_error:
-                logger.error(f"Failed to restore original commit: {restore_error}")
-
     return registry
 
 
@@ -956,10 +988,16 @@ def analyze_module_unified(
     commit_from: str,
     commit_to: str,
     return_models: bool = False,
+    model_cache: Optional[ModelCache] = None,
 ) -> tuple[List[RenameCandidate], dict] | List[RenameCandidate]:
     """
     Simplified analysis pipeline using unified structures throughout.
     No more conversions between formats.
+
+    Files whose blob did not change between both commits are extracted once
+    and only models touched by changed blobs go through direct matching.
+    When a model_cache is given, blobs already extracted in earlier runs are
+    not parsed again and new extractions are stored for later runs.
     """
     module_name = module_data["module_name"]
     logger.info(f"Starting unified analysis for module '{module_name}'")
@@ -971,17 +1009,14 @@ def analyze_module_unified(
             logger.warning(f"No Python files found in module {module_name}")
             return []
 
-        # Single extraction to Model (no conversions)
-        before_models = _extract_models_from_git(
-            python_files, git_analyzer, commit_from
+        sources = _fetch_module_sources(
+            python_files, git_analyzer, commit_from, commit_to, model_cache
         )
-        after_models = _extract_models_from_git(python_files, git_analyzer, commit_to)
-
-        # Single engine handles everything (no format conversions)
-        engine = MatchingEngine()
-        candidates = engine.find_all_renames(before_models, after_models, module_name)
-
-        logger.info(f"Unified analysis completed. Found {len(candidates)} candidates")
+        sources_before, sources_after, blobs_before, blobs_after, unchanged = sources
+        candidates, before_models, after_models, parsed = _analyze_module_sources(
+            module_name, python_files, sources_before, sources_after, unchanged
+        )
+        _store_parsed_models(model_cache, parsed, blobs_before, blobs_after)
 
         if return_models:
             # Return candidates and BOTH before/after models
@@ -1003,27 +1038,399 @@ def analyze_module_unified(
         return []
 
 
-def _extract_models_from_git(
+def _fetch_module_sources(
+    python_files: List[str],
+    git_analyzer: GitAnalyzer,
+    commit_from: str,
+    commit_to: str,
+    model_cache: Optional[ModelCache] = None,
+) -> tuple[dict, dict, dict[str, str], dict[str, str], set[str]]:
+    """
+    Resolve the module sources at both commits.
+
+    Blob SHAs come from one ls-tree call per commit. Files with the same blob
+    at both commits are only resolved on the BEFORE side; their AFTER models
+    are copied from it by _analyze_module_sources().
+
+    Returns:
+        Tupla (sources_before, sources_after, blobs_before, blobs_after,
+        unchanged). Los sources mapean file_path a su contenido o a sus
+        modelos cacheados; los blobs mapean file_path a su blob SHA y
+        unchanged contiene los archivos cuyo blob no cambió
+    """
+    blobs_before = _list_module_blobs(python_files, git_analyzer, commit_from)
+    blobs_after = _list_module_blobs(python_files, git_analyzer, commit_to)
+    unchanged = {
+        path
+        for path, blob_sha in blobs_after.items()
+        if blobs_before.get(path) == blob_sha
+    }
+    if unchanged:
+        logger.debug(
+            f"{len(unchanged)}/{len(python_files)} files unchanged between commits"
+        )
+
+    sources_before = _resolve_blob_sources(blobs_before, git_analyzer, model_cache)
+    sources_after = _resolve_blob_sources(
+        {path: sha for path, sha in blobs_after.items() if path not in unchanged},
+        git_analyzer,
+        model_cache,
+    )
+    return sources_before, sources_after, blobs_before, blobs_after, unchanged
+
+
+def _list_module_blobs(
     python_files: List[str], git_analyzer: GitAnalyzer, commit_sha: str
-) -> List[Model]:
-    """Extract Model objects from files at a specific git commit"""
+) -> dict[str, str]:
+    """Blob SHA of each of the given files that exists at the commit"""
+    wanted = set(python_files)
+    return {
+        path: blob_sha
+        for path, blob_sha in git_analyzer.list_tree_at_commit(
+            commit_sha, python_files
+        ).items()
+        if path in wanted
+    }
+
+
+def _resolve_blob_sources(
+    blob_shas: dict[str, str],
+    git_analyzer: GitAnalyzer,
+    model_cache: Optional[ModelCache] = None,
+) -> dict[str, str | List[Model]]:
+    """
+    Map each file to its cached models or, on a cache miss, to its content
+    read through the git cat-file session.
+    """
+    sources = {}
+    if model_cache is not None:
+        sources.update(model_cache.get_many(blob_shas))
+
+    missing = {path: sha for path, sha in blob_shas.items() if path not in sources}
+    if missing:
+        contents = git_analyzer.read_blobs(list(missing.values()))
+        for path, blob_sha in missing.items():
+            if blob_sha in contents:
+                sources[path] = contents[blob_sha]
+
+    return sources
+
+
+def _store_parsed_models(
+    model_cache: Optional[ModelCache],
+    parsed: dict[str, dict[str, List[Model]]],
+    blobs_before: dict[str, str],
+    blobs_after: dict[str, str],
+) -> None:
+    """Persist freshly parsed extractions under their blob SHA"""
+    if model_cache is None:
+        return
+
+    entries = {}
+    for side, blob_shas in (("before", blobs_before), ("after", blobs_after)):
+        for path, models in parsed[side].items():
+            entries[blob_shas[path]] = (path, models)
+
+    try:
+        model_cache.put_many(entries)
+    except Exception as e:
+        logger.warning(f"Could not update model cache: {e}")
+
+
+def _analyze_module_sources(
+    module_name: str,
+    python_files: List[str],
+    sources_before: dict[str, str | List[Model]],
+    sources_after: dict[str, str | List[Model]],
+    unchanged: set[str] = frozenset(),
+) -> tuple[List[RenameCandidate], List[Model], List[Model], dict]:
+    """
+    CPU-bound half of the unified analysis: parsing and matching.
+
+    Works on already fetched sources only, so it needs no Git access and can
+    run in a worker process. Files listed in ``unchanged`` take their AFTER
+    models from a copy of the BEFORE extraction instead of being parsed again.
+
+    Returns:
+        Tupla (candidates, before_models, after_models, parsed), donde parsed
+        contiene {"before": {...}, "after": {...}} con los modelos extraídos
+        en esta llamada por archivo (los que no venían de la caché)
+    """
+    parsed = {"before": {}, "after": {}}
+
+    # Single extraction to Model (no conversions)
+    before_by_file = _extract_models_by_file(
+        python_files, sources_before, parsed["before"]
+    )
+    after_by_file = _extract_models_by_file(
+        [path for path in python_files if path not in unchanged],
+        sources_after,
+        parsed["after"],
+    )
+    for path in unchanged:
+        if path in before_by_file:
+            # Copy: AFTER models get annotated later (e.g. resolved targets)
+            after_by_file[path] = copy_models(before_by_file[path])
+
+    before_models = _flatten_models(python_files, before_by_file)
+    after_models = _flatten_models(python_files, after_by_file)
+
+    # Only models defined in changed files can contain direct renames
+    changed_model_names = {
+        model.name
+        for by_file in (before_by_file, after_by_file)
+        for path, models in by_file.items()
+        if path not in unchanged
+        for model in models
+    }
+
+    # Single engine handles everything (no format conversions)
+    engine = MatchingEngine()
+    candidates = engine.find_all_renames(
+        before_models,
+        after_models,
+        module_name,
+        changed_model_names=changed_model_names,
+    )
+
+    logger.info(f"Unified analysis completed. Found {len(candidates)} candidates")
+
+    return candidates, before_models, after_models, parsed
+
+
+def _extract_models_by_file(
+    python_files: List[str],
+    contents: dict[str, str | List[Model]],
+    parsed: Optional[dict[str, List[Model]]] = None,
+) -> dict[str, List[Model]]:
+    """
+    Extract Model objects from already loaded file contents, per file.
+
+    Entries that already hold a list of models (cache hits) are used as is.
+    Files parsed here are also recorded in ``parsed`` when given.
+    """
     from analyzers.ast_visitor import extract_models
 
-    all_models = []
+    models_by_file = {}
 
     for file_path in python_files:
+        content = contents.get(file_path)
+        if isinstance(content, list):
+            models_by_file[file_path] = content
+            continue
+        if content is None:
+            continue
         try:
-            content = git_analyzer.get_file_content_at_commit(file_path, commit_sha)
-            if content:
-                models = extract_models(content, file_path)
-                all_models.extend(models)
+            models = extract_models(content, file_path) if content else []
+            models_by_file[file_path] = models
+            if parsed is not None:
+                parsed[file_path] = models
         except Exception as e:
-            logger.error(
-                f"Error extracting models from {file_path} at {commit_sha}: {e}"
-            )
+            logger.error(f"Error extracting models from {file_path}: {e}")
+
+    return models_by_file
+
 
+def _flatten_models(
+    python_files: List[str], models_by_file: dict[str, List[Model]]
+) -> List[Model]:
+    """Concatenate per-file models in python_files order"""
+    all_models = []
+    for file_path in python_files:
+        all_models.extend(models_by_file.get(file_path, []))
     return all_models
 
+
+# =====================================
+# PARALLEL MODULE ANALYSIS
+# =====================================
+
+
+def _pack_sources(sources: dict[str, str | List[Model]]) -> dict[str, str | tuple]:
+    """Convert cached models in a sources mapping to their packed form"""
+    return {
+        path: pack_models(value) if isinstance(value, list) else value
+        for path, value in sources.items()
+    }
+
+
+def _unpack_sources(sources: dict[str, str | tuple]) -> dict[str, str | List[Model]]:
+    """Inverse of _pack_sources()"""
+    return {
+        path: unpack_models(value) if isinstance(value, tuple) else value
+        for path, value in sources.items()
+    }
+
+
+def _analyze_module_worker(
+    module_name: str,
+    python_files: List[str],
+    sources_before: dict[str, str | tuple],
+    sources_after: dict[str, str | tuple],
+    unchanged: set[str],
+) -> tuple[List[RenameCandidate], int, tuple, tuple, dict]:
+    """
+    Entry point executed in worker processes.
+
+    Change ids are returned relative to the module together with the number
+    of ids consumed, so the parent can rebase them onto the global counter.
+    Models travel in both directions through pack_models() to keep the
+    payloads small.
+    """
+    first_id = MatchingEngine._global_change_id_counter
+    candidates, before_models, after_models, parsed = _analyze_module_sources(
+        module_name,
+        python_files,
+        _unpack_sources(sources_before),
+        _unpack_sources(sources_after),
+        unchanged,
+    )
+    ids_used = MatchingEngine._global_change_id_counter - first_id
+
+    # Make ids module-relative (0-based) so the parent can rebase them
+    for candidate in candidates:
+        candidate.change_id = str(int(candidate.change_id) - first_id)
+        if candidate.parent_change_id:
+            candidate.parent_change_id = str(
+                int(candidate.parent_change_id) - first_id
+            )
+
+    packed_parsed = {side: _pack_sources(files) for side, files in parsed.items()}
+    return (
+        candidates,
+        ids_used,
+        pack_models(before_models),
+        pack_models(after_models),
+        packed_parsed,
+    )
+
+
+def analyze_modules_parallel(
+    modules_to_analyze: List[dict],
+    git_analyzer: GitAnalyzer,
+    commit_from: str,
+    commit_to: str,
+    jobs: int,
+    model_cache: Optional[ModelCache] = None,
+) -> list[tuple[List[RenameCandidate], dict] | List[RenameCandidate]]:
+    """
+    Analiza varios módulos en paralelo con un pool de procesos.
+
+    El proceso padre lee los blobs de cada módulo con su sesión git cat-file
+    (y consulta la caché de modelos, si la hay) y envía los contenidos a los
+    workers, que solo parsean y comparan. Los resultados se devuelven en el
+    mismo orden que modules_to_analyze y con la misma forma que
+    analyze_module_unified(..., return_models=True).
+
+    Los change_id se reasignan en el padre, módulo por módulo y en orden,
+    por lo que la numeración global es determinista e idéntica a la de una
+    ejecución secuencial.
+
+    Args:
+        modules_to_analyze: Módulos a analizar
+        git_analyzer: Instancia configurada de GitAnalyzer (solo usada en el padre)
+        commit_from: SHA del commit inicial
+        commit_to: SHA del commit final
+        jobs: Número de procesos (0 = uno por CPU)
+        model_cache: Caché persistente de modelos extraídos (opcional)
+
+    Returns:
+        Lista de resultados por módulo, en el orden de entrada
+    """
+    max_workers = jobs or os.cpu_count() or 1
+    logger.info(
+        f"Analyzing {len(modules_to_analyze)} modules with {max_workers} worker processes"
+    )
+
+    submitted = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Blob retrieval happens here while workers already parse earlier modules
+        for module_data in modules_to_analyze:
+            module_name = module_data["module_name"]
+            python_files = _extract_python_files_from_module(module_data)
+            if not python_files:
+                logger.warning(f"No Python files found in module {module_name}")
+                submitted.append(None)
+                continue
+
+            try:
+                sources = _fetch_module_sources(
+                    python_files, git_analyzer, commit_from, commit_to, model_cache
+                )
+                sources_before, sources_after, blobs_before, blobs_after, unchanged = (
+                    sources
+                )
+            except Exception as e:
+                logger.error(f"Error reading sources for {module_name}: {e}")
+                submitted.append(None)
+                continue
+
+            future = executor.submit(
+                _analyze_module_worker,
+                module_name,
+                python_files,
+                _pack_sources(sources_before),
+                _pack_sources(sources_after),
+                unchanged,
+            )
+            submitted.append((future, blobs_before, blobs_after))
+
+        results = []
+        for module_data, entry in zip(modules_to_analyze, submitted):
+            module_name = module_data["module_name"]
+            if entry is None:
+                results.append([])
+                continue
+
+            future, blobs_before, blobs_after = entry
+            try:
+                (
+                    candidates,
+                    ids_used,
+                    packed_before,
+                    packed_after,
+                    packed_parsed,
+                ) = future.result()
+            except Exception as e:
+                logger.error(f"Error in unified analysis for {module_name}: {e}")
+                results.append([])
+                continue
+
+            # Worker counters are process-local: rebase onto the global counter
+            # in module order, reserving the same ids a sequential run would use
+            base_id = MatchingEngine._global_change_id_counter
+            MatchingEngine._global_change_id_counter += ids_used
+            for candidate in candidates:
+                candidate.change_id = str(base_id + int(candidate.change_id))
+                if candidate.parent_change_id:
+                    candidate.parent_change_id = str(
+                        base_id + int(candidate.parent_change_id)
+                    )
+
+            parsed = {
+                side: _unpack_sources(files) for side, files in packed_parsed.items()
+            }
+            _store_parsed_models(model_cache, parsed, blobs_before, blobs_after)
+
+            models_dict = {
+                module_name: {
+                    "before": unpack_models(packed_before),
+                    "after": unpack_models(packed_after),
+                }
+            }
+            results.append((candidates, models_dict))
+
+    return results
+
+
+def _extract_models_from_git(
+    python_files: List[str], git_analyzer: GitAnalyzer, commit_sha: str
+) -> List[Model]:
+    """Extract Model objects from files at a specific git commit"""
+    # One pipelined round trip through the git cat-file session for all files
+    contents = git_analyzer.get_files_at_commit(python_files, commit_sha)
+    return _flatten_models(python_files, _extract_models_by_file(python_files, contents))
+
     # LEGACY ANALYSIS (FALLBACK)
     # =====================================
 
@@ -1249,6 +1656,9 @@ def main() -> int:
     global logger
     logger = logging.getLogger(__name__)
 
+    git_analyzer = None
+    model_cache = None
+
     try:
         # BLOCK 1: Configuration Loading and Validation
         logger.info("Loading modified modules JSON...")
@@ -1262,6 +1672,11 @@ def main() -> int:
         app_config.verbose = args.verbose
         app_config.output_csv = args.output
         app_config.report_file = args.report_file
+        if args.jobs is not None:
+            app_config.jobs = args.jobs
+        if args.no_cache:
+            app_config.use_model_cache = False
+        app_config.validate()
 
         # BLOCK 2: Git Repository and Component Initialization
         # Determine repository path (auto-detect from JSON or use provided)
@@ -1272,6 +1687,16 @@ def main() -> int:
         logger.info("Initializing Git analyzer...")
         git_analyzer = GitAnalyzer(repo_path)
 
+        # Persistent cache of extracted models (keyed by blob SHA)
+        if app_config.use_model_cache:
+            try:
+                model_cache = ModelCache(
+                    app_config.model_cache_dir,
+                    app_config.model_cache_max_mb * 1024 * 1024,
+                )
+            except Exception as e:
+                logger.warning(f"Model cache disabled: {e}")
+
         # BLOCK 3: Commit Resolution and Information Display
         logger.info("Resolving commits...")
         commit_from, commit_to = git_analyzer.resolve_commits(
@@ -1370,6 +1795,17 @@ def main() -> int:
         collected_before_models = {}  # For cross-reference generation
         collected_after_models = {}  # For inheritance graph
 
+        parallel_results = None
+        if app_config.jobs != 1 and len(modules_to_analyze) > 1:
+            parallel_results = analyze_modules_parallel(
+                modules_to_analyze,
+                git_analyzer,
+                commit_from,
+                commit_to,
+                app_config.jobs,
+                model_cache,
+            )
+
         for i, module_data in enumerate(modules_to_analyze, 1):
             module_name = module_data["module_name"]
             logger.info(
@@ -1377,9 +1813,17 @@ def main() -> int:
             )
 
             # Use unified analysis and collect models for cross-references
-            result = analyze_module_unified(
-                module_data, git_analyzer, commit_from, commit_to, return_models=True
-            )
+            if parallel_results is not None:
+                result = parallel_results[i - 1]
+            else:
+                result = analyze_module_unified(
+                    module_data,
+                    git_analyzer,
+                    commit_from,
+                    commit_to,
+                    return_models=True,
+                    model_cache=model_cache,
+                )
 
             if isinstance(result, tuple):
                 module_candidates, module_models = result
@@ -1399,6 +1843,10 @@ def main() -> int:
         logger.info(
             f"Analysis complete. Found {len(all_candidates)} rename candidates (filtered by confidence)"
         )
+        if model_cache is not None:
+            logger.info(
+                f"Model cache: {model_cache.hits} hits, {model_cache.misses} misses"
+            )
 
         # Early exit if no candidates found
         if not all_candidates:
@@ -1661,6 +2109,13 @@ def main() -> int:
 
         return 1
 
+    finally:
+        # Stop the persistent git cat-file session
+        if git_analyzer is not None:
+            git_analyzer.close()
+        if model_cache is not None:
+            model_cache.close()
+
 
 def generate_final_report(candidates: list[RenameCandidate]):
     """Genera reporte estadístico final"""
@@ -0,0 +1,119 @@
+"""
+Test suite for optimal rename assignment
+========================================
+
+Hungarian solvers against brute force, capacity (slack) handling and the
+"optimal" MatchingEngine strategy.
+"""
+
+import itertools
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzers import assignment
+from analyzers.assignment import (
+    _hungarian_numpy,
+    _hungarian_python,
+    assign_renames,
+    solve_assignment,
+)
+from analyzers.matching_engine import MatchingEngine
+
+
+def _brute_force_cost(cost):
+    n_rows, n_cols = len(cost), len(cost[0])
+    if n_rows <= n_cols:
+        return min(
+            sum(cost[i][j] for i, j in enumerate(cols))
+            for cols in itertools.permutations(range(n_cols), n_rows)
+        )
+    return min(
+        sum(cost[i][j] for j, i in enumerate(rows))
+        for rows in itertools.permutations(range(n_rows), n_cols)
+    )
+
+
+@pytest.mark.parametrize("shape", [(1, 1), (3, 3), (3, 5), (5, 3), (6, 6)])
+def test_solve_assignment_is_optimal(shape):
+    rng = random.Random(sum(shape))
+    for _ in range(20):
+        cost = [
+            [rng.choice([0.0, -0.5, -0.9, -1.0, rng.random()]) for _ in range(shape[1])]
+            for _ in range(shape[0])
+        ]
+
+        pairs = solve_assignment(cost)
+
+        assert len(pairs) == min(shape)
+        assert len({i for i, _ in pairs}) == len({j for _, j in pairs}) == len(pairs)
+        assert sum(cost[i][j] for i, j in pairs) == pytest.approx(
+            _brute_force_cost(cost)
+        )
+
+
+def test_numpy_and_python_solvers_agree():
+    if assignment.np is None:
+        pytest.skip("NumPy not installed")
+
+    rng = random.Random(7)
+    cost = [[-rng.random() for _ in range(12)] for _ in range(9)]
+
+    assert _hungarian_numpy(assignment.np.asarray(cost)) == _hungarian_python(cost)
+
+
+class TestAssignRenames:
+    SCORES = [
+        # X     Y
+        [0.95, 0.90],  # A
+        [0.90, 0.10],  # B
+    ]
+
+    def test_one_to_one_maximizes_total_similarity(self):
+        matches = assign_renames(["A", "B"], ["X", "Y"], self.SCORES, slack=0)
+
+        assert matches == [("A", "Y", 0.90), ("B", "X", 0.90)]
+
+    def test_slack_allows_many_to_one(self):
+        matches = assign_renames(["A", "B"], ["X"], [[0.95], [0.85]], slack=1)
+
+        assert matches == [("A", "X", 0.95), ("B", "X", 0.85)]
+
+    def test_weak_extra_match_on_high_confidence_target_is_dropped(self):
+        matches = assign_renames(["A", "B"], ["X"], [[0.95], [0.6]], slack=1)
+
+        assert matches == [("A", "X", 0.95)]
+
+    def test_scores_at_or_below_min_score_are_not_assigned(self):
+        matches = assign_renames(
+            ["A", "B"], ["X", "Y"], [[0.4, 0.0], [0.0, 0.7]], min_score=0.5
+        )
+
+        assert matches == [("B", "Y", 0.7)]
+
+
+def test_optimal_strategy_on_matching_engine():
+    engine = MatchingEngine(strategy="optimal", assignment_slack=0)
+    greedy = MatchingEngine(strategy="greedy")
+    missing = {"invoice_count", "amount_untaxed"}
+    new = {"count_invoice", "untaxed_amount"}
+
+    matches = engine._find_optimal_matches(missing, new)
+
+    assert {(old, new) for old, new, _ in matches} == {
+        ("invoice_count", "count_invoice"),
+        ("amount_untaxed", "untaxed_amount"),
+    }
+    assert {(old, new) for old, new, _ in matches} <= {
+        (old, new) for old, new, _ in greedy._find_optimal_matches(missing, new)
+    }
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError):
+        MatchingEngine(strategy="random")
@@ -7,6 +7,7 @@ works correctly end-to-end.
 """
 
 import pytest
+import random
 import tempfile
 import sys
 from pathlib import Path
@@ -14,10 +15,10 @@ from pathlib import Path
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from core.models import RenameCandidate
+from core.models import CallType, Model, Reference, RenameCandidate
 from utils.csv_manager import CSVManager
 from utils.csv_validator import CSVStructureValidator
-from analyzers.cross_reference_analyzer import CrossReferenceAnalyzer
+from analyzers.cross_reference_analyzer import CrossReferenceAnalyzer, ReferenceIndex
 
 
 class TestCrossReferenceImplementation:
@@ -226,6 +227,95 @@ class TestCrossReferenceImplementation:
             Path(csv_path).unlink(missing_ok=True)
 
 
+class TestReferenceIndex:
+    """The inverted reference index must match a full scan over all models"""
+
+    MODELS = ["sale.order", "sale.order.line", "account.move", "mail.thread"]
+    NAMES = ["amount_total", "partner_id", "action_confirm", "_compute_amount"]
+
+    def _make_models(self, seed: int) -> dict:
+        rng = random.Random(seed)
+        all_models = {}
+        for module in ["sale", "account", "stock"]:
+            models = []
+            for model_name in self.MODELS:
+                model = Model(
+                    name=model_name,
+                    class_name="Dummy",
+                    file_path=f"/addons/{module}/models/dummy.py",
+                )
+                for line in range(rng.randint(0, 30)):
+                    model.references.append(
+                        Reference(
+                            reference_type=rng.choice(["field", "method"]),
+                            reference_name=rng.choice(self.NAMES),
+                            call_type=rng.choice(list(CallType)),
+                            source_model=rng.choice(self.MODELS),
+                            source_method="some_method",
+                            source_file=model.file_path,
+                            line_number=line,
+                            target_model=rng.choice(self.MODELS + [""]),
+                        )
+                    )
+                models.append(model)
+            all_models[module] = models
+        return all_models
+
+    @staticmethod
+    def _full_scan(analyzer, primary, all_models):
+        return [
+            reference
+            for models in all_models.values()
+            for model in models
+            for reference in model.references
+            if analyzer._reference_matches_rename(reference, primary)
+        ]
+
+    def test_index_matches_full_scan(self):
+        analyzer = CrossReferenceAnalyzer()
+        all_models = self._make_models(seed=7)
+        index = ReferenceIndex(all_models)
+
+        for model_name in self.MODELS:
+            for name in self.NAMES:
+                for item_type in ["field", "method"]:
+                    primary = RenameCandidate.create_primary_declaration(
+                        change_id="1",
+                        old_name=name,
+                        new_name=f"{name}_new",
+                        item_type=item_type,
+                        module="sale",
+                        model=model_name,
+                        confidence=0.95,
+                    )
+                    expected = self._full_scan(analyzer, primary, all_models)
+                    found = analyzer._find_all_cross_references(
+                        primary, all_models, index
+                    )
+                    assert [id(r) for r in found] == [id(r) for r in expected]
+
+    def test_unmatchable_references_are_not_indexed(self):
+        reference = Reference(
+            reference_type="field",
+            reference_name="partner_id",
+            call_type=CallType.CROSS_MODEL,
+            source_model="sale.order",
+            source_method="",
+            source_file="/addons/sale/models/sale_order.py",
+        )
+        model = Model(
+            name="sale.order",
+            class_name="SaleOrder",
+            file_path=reference.source_file,
+            references=[reference],
+        )
+
+        index = ReferenceIndex({"sale": [model]})
+
+        assert index.size == 0
+        assert index.candidates("partner_id", "field", "sale.order") == []
+
+
 if __name__ == "__main__":
     # Run basic tests
     test_suite = TestCrossReferenceImplementation()
@@ -0,0 +1,368 @@
+"""
+Test suite for Git object access
+================================
+
+Verifies batched blob reads through the persistent cat-file session, that
+model registries are built straight from Git tree/blob objects without
+touching the work tree, and that parallel module analysis matches the
+sequential pipeline, reuses cached extractions and extracts unchanged blobs
+only once.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzers.git_analyzer import GitAnalyzer
+from analyzers.matching_engine import MatchingEngine
+from core.model_cache import ModelCache
+from core.models import pack_models, unpack_models
+from detect_field_method_changes import (
+    analyze_module_unified,
+    analyze_modules_parallel,
+    build_registry_for_commit,
+    non_negative_int,
+)
+
+SALE_ORDER_BEFORE = '''
+from odoo import fields, models
+
+
+class SaleOrder(models.Model):
+    _name = "sale.order"
+
+    invoice_count = fields.Integer()
+
+    def order_confirm(self):
+        return self.invoice_count
+'''
+
+SALE_ORDER_AFTER = '''
+from odoo import fields, models
+
+
+class SaleOrder(models.Model):
+    _name = "sale.order"
+
+    count_invoice = fields.Integer()
+
+    def action_order_confirm(self):
+        return self.count_invoice
+'''
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(
+        ["git", *args], cwd=repo, capture_output=True, text=True, check=True
+    )
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def odoo_repo(tmp_path):
+    """Repository with two commits touching addons/sale/models/sale_order.py"""
+    repo = tmp_path / "odoo"
+    model_file = repo / "addons" / "sale" / "models" / "sale_order.py"
+    model_file.parent.mkdir(parents=True)
+
+    _git(repo.parent, "init", "-q", str(repo))
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+
+    model_file.write_text(SALE_ORDER_BEFORE)
+    (repo / "addons" / "sale" / "README.md").write_text("sale\n")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "before")
+    commit_before = _git(repo, "rev-parse", "HEAD")
+
+    model_file.write_text(SALE_ORDER_AFTER)
+    _git(repo, "commit", "-q", "-am", "after")
+    commit_after = _git(repo, "rev-parse", "HEAD")
+
+    return repo, commit_before, commit_after
+
+
+class TestGitBlobAccess:
+    """Tree listing and batched blob reads"""
+
+    def test_list_tree_at_commit_filters_by_path(self, odoo_repo):
+        repo, commit_before, _ = odoo_repo
+        git_analyzer = GitAnalyzer(str(repo))
+
+        entries = git_analyzer.list_tree_at_commit(commit_before, ["addons/sale"])
+
+        assert set(entries) == {
+            "addons/sale/README.md",
+            "addons/sale/models/sale_order.py",
+        }
+        assert all(len(sha) == 40 for sha in entries.values())
+
+    def test_read_blobs_returns_contents_and_skips_missing(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+        git_analyzer = GitAnalyzer(str(repo))
+        path = "addons/sale/models/sale_order.py"
+
+        sha_before = git_analyzer.list_tree_at_commit(commit_before)[path]
+        sha_after = git_analyzer.list_tree_at_commit(commit_after)[path]
+        missing = "0" * 40
+
+        contents = git_analyzer.read_blobs([sha_before, sha_after, missing])
+
+        assert contents[sha_before] == SALE_ORDER_BEFORE
+        assert contents[sha_after] == SALE_ORDER_AFTER
+        assert missing not in contents
+
+
+class TestGitBatchSession:
+    """Persistent git cat-file --batch session"""
+
+    def test_get_files_at_commit_reads_in_bulk(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+        path = "addons/sale/models/sale_order.py"
+
+        with GitAnalyzer(str(repo)) as git_analyzer:
+            before = git_analyzer.get_files_at_commit([path], commit_before)
+            after = git_analyzer.get_files_at_commit(
+                [path, "addons/sale/missing.py", "addons/sale/README.md"],
+                commit_after,
+            )
+
+        assert before == {path: SALE_ORDER_BEFORE}
+        assert after == {path: SALE_ORDER_AFTER, "addons/sale/README.md": "sale\n"}
+
+    def test_session_is_reused_across_calls(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+        path = "addons/sale/models/sale_order.py"
+        git_analyzer = GitAnalyzer(str(repo))
+
+        git_analyzer.get_file_content_at_commit(path, commit_before)
+        process = git_analyzer._batch_reader._process
+        content = git_analyzer.get_file_content_at_commit(path, commit_after)
+
+        assert content == SALE_ORDER_AFTER
+        assert git_analyzer._batch_reader._process is process
+        assert git_analyzer.get_file_content_at_commit("nope.py", commit_after) is None
+
+        git_analyzer.close()
+        assert process.poll() is not None
+
+    def test_directory_paths_are_not_returned_as_files(self, odoo_repo):
+        repo, _, commit_after = odoo_repo
+
+        with GitAnalyzer(str(repo)) as git_analyzer:
+            contents = git_analyzer.get_files_at_commit(["addons/sale"], commit_after)
+
+        assert contents == {}
+
+
+class TestBuildRegistryForCommit:
+    """Registry construction from Git objects"""
+
+    def test_registry_reflects_each_commit(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+        git_analyzer = GitAnalyzer(str(repo))
+        files = ["addons/sale/models/sale_order.py"]
+
+        registry_before = build_registry_for_commit(files, git_analyzer, commit_before)
+        registry_after = build_registry_for_commit(files, git_analyzer, commit_after)
+
+        [model_before] = registry_before.get_models_for_name("sale.order")
+        [model_after] = registry_after.get_models_for_name("sale.order")
+        assert [f.name for f in model_before.fields] == ["invoice_count"]
+        assert [f.name for f in model_after.fields] == ["count_invoice"]
+        assert "invoice_count = fields.Integer()" in model_before.fields[0].definition
+
+    def test_work_tree_and_head_untouched(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+        git_analyzer = GitAnalyzer(str(repo))
+        model_file = repo / "addons" / "sale" / "models" / "sale_order.py"
+        model_file.write_text(SALE_ORDER_AFTER + "# local edit\n")
+
+        build_registry_for_commit(
+            ["addons/sale/models/sale_order.py"], git_analyzer, commit_before
+        )
+
+        assert _git(repo, "rev-parse", "HEAD") == commit_after
+        assert model_file.read_text().endswith("# local edit\n")
+
+
+class TestParallelModuleAnalysis:
+    """Process pool analysis (--jobs)"""
+
+    MODULES = [
+        {
+            "module_name": "sale",
+            "file_categories": {"models": ["addons/sale/models/sale_order.py"]},
+        },
+        {"module_name": "sale_docs", "file_categories": {"data": ["README.md"]}},
+        {
+            "module_name": "sale_extra",
+            "file_categories": {"models": ["addons/sale/models/sale_order.py"]},
+        },
+    ]
+
+    def test_pack_models_round_trip(self, odoo_repo):
+        repo, commit_before, _ = odoo_repo
+        registry = build_registry_for_commit(
+            ["addons/sale/models/sale_order.py"], GitAnalyzer(str(repo)), commit_before
+        )
+        models = registry.get_models_for_name("sale.order")
+
+        assert unpack_models(pack_models(models)) == models
+
+    def test_parallel_matches_sequential(self, odoo_repo):
+        repo, commit_before, commit_after = odoo_repo
+
+        with GitAnalyzer(str(repo)) as git_analyzer:
+            MatchingEngine(start_id=1)
+            sequential = [
+                analyze_module_unified(
+                    module, git_analyzer, commit_before, commit_after, return_models=True
+                )
+                for module in self.MODULES
+            ]
+
+            MatchingEngine(start_id=1)
+            parallel = analyze_modules_parallel(
+                self.MODULES, git_analyzer, commit_before, commit_after, jobs=2
+            )
+
+        assert parallel[1] == sequential[1] == []
+
+        for (seq_candidates, seq_models), (par_candidates, par_models) in zip(
+            [sequential[0], sequential[2]], [parallel[0], parallel[2]]
+        ):
+            assert [c.to_dict() for c in par_candidates] == [
+                c.to_dict() for c in seq_candidates
+            ]
+            assert par_models == seq_models
+
+        change_ids = [c.change_id for c in parallel[0][0] + parallel[2][0]]
+        assert change_ids and len(set(change_ids)) == len(change_ids)
+
+    def test_jobs_argument_type(self):
+        import argparse
+
+        assert non_negative_int("0") == 0
+        assert non_negative_int("4") == 4
+        for value in ("-1", "many"):
+            with pytest.raises(argparse.ArgumentTypeError):
+                non_negative_int(value)
+
+
+class TestModelCacheIntegration:
+    """Cached extractions skip parsing on later runs"""
+
+    MODULE = TestParallelModuleAnalysis.MODULES[0]
+
+    def test_second_run_parses_nothing(self, odoo_repo, tmp_path, monkeypatch):
+        import analyzers.ast_visitor as ast_visitor
+
+        repo, commit_before, commit_after = odoo_repo
+        parsed_files = []
+        real_extract_models = ast_visitor.extract_models
+
+        def counting_extract_models(content, file_path):
+            parsed_files.append(file_path)
+            return real_extract_models(content, file_path)
+
+        monkeypatch.setattr(ast_visitor, "extract_models", counting_extract_models)
+
+        def run():
+            with GitAnalyzer(str(repo)) as git_analyzer, ModelCache(
+                tmp_path / "cache"
+            ) as cache:
+                MatchingEngine(start_id=1)
+                return analyze_module_unified(
+                    self.MODULE,
+                    git_analyzer,
+                    commit_before,
+                    commit_after,
+                    return_models=True,
+                    model_cache=cache,
+                )
+
+        first_candidates, first_models = run()
+        first_run_parses, parsed_files[:] = len(parsed_files), []
+        second_candidates, second_models = run()
+
+        assert first_run_parses == 2
+        assert parsed_files == []
+        assert [c.to_dict() for c in second_candidates] == [
+            c.to_dict() for c in first_candidates
+        ]
+        assert second_models == first_models
+
+
+SALE_LINE = '''
+from odoo import fields, models
+
+
+class SaleOrderLine(models.Model):
+    _name = "sale.order.line"
+
+    price_total = fields.Float()
+'''
+
+
+class TestUnchangedBlobs:
+    """Files with the same blob at both commits are extracted once"""
+
+    MODULE = {
+        "module_name": "sale",
+        "file_categories": {
+            "models": [
+                "addons/sale/models/sale_order.py",
+                "addons/sale/models/sale_order_line.py",
+            ]
+        },
+    }
+
+    def test_unchanged_file_is_parsed_once(self, odoo_repo, monkeypatch):
+        import analyzers.ast_visitor as ast_visitor
+
+        repo, _, _ = odoo_repo
+        line_file = repo / "addons" / "sale" / "models" / "sale_order_line.py"
+        order_file = repo / "addons" / "sale" / "models" / "sale_order.py"
+
+        order_file.write_text(SALE_ORDER_BEFORE)
+        line_file.write_text(SALE_LINE)
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "add line")
+        commit_before = _git(repo, "rev-parse", "HEAD")
+        order_file.write_text(SALE_ORDER_AFTER)
+        _git(repo, "commit", "-q", "-am", "rename")
+        commit_after = _git(repo, "rev-parse", "HEAD")
+
+        parsed_files = []
+        real_extract_models = ast_visitor.extract_models
+
+        def counting_extract_models(content, file_path):
+            parsed_files.append(file_path)
+            return real_extract_models(content, file_path)
+
+        monkeypatch.setattr(ast_visitor, "extract_models", counting_extract_models)
+
+        with GitAnalyzer(str(repo)) as git_analyzer:
+            candidates, models = analyze_module_unified(
+                self.MODULE, git_analyzer, commit_before, commit_after, True
+            )
+
+        assert sorted(parsed_files) == [
+            "addons/sale/models/sale_order.py",
+            "addons/sale/models/sale_order.py",
+            "addons/sale/models/sale_order_line.py",
+        ]
+        assert {(c.old_name, c.new_name) for c in candidates} >= {
+            ("invoice_count", "count_invoice")
+        }
+
+        [line_before] = [m for m in models["sale"]["before"] if m.name.endswith("line")]
+        [line_after] = [m for m in models["sale"]["after"] if m.name.endswith("line")]
+        assert line_after == line_before
+        assert line_after is not line_before
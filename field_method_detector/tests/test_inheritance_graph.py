@@ -0,0 +1,111 @@
+"""
+Test suite for the core InheritanceGraph
+========================================
+
+The precomputed transitive closure must answer like the plain BFS walks
+over the graph, and adding a model must invalidate it.
+"""
+
+import sys
+from collections import deque
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.inheritance_graph import InheritanceGraph
+from core.models import Field, Method, Model
+
+
+def _model(name, inherits=(), fields=(), methods=()):
+    return Model(
+        name=name,
+        class_name=name.title().replace(".", ""),
+        file_path=f"/addons/test/models/{name}.py",
+        inherits_from=list(inherits),
+        fields=[Field(name=f, field_type="Char") for f in fields],
+        methods=[Method(name=m) for m in methods],
+    )
+
+
+def _graph():
+    graph = InheritanceGraph()
+    for model in [
+        _model("mail.thread", methods=["message_post"], fields=["message_ids"]),
+        _model("base.doc", fields=["name", "state"], methods=["action_done"]),
+        _model("sale.order", ["base.doc", "mail.thread"], fields=["state"]),
+        _model("sale.order.ext", ["sale.order"], methods=["action_done"]),
+        _model("loop.a", ["loop.b"], methods=["spin"]),
+        _model("loop.b", ["loop.a"]),
+        _model("orphan", ["missing.parent"], fields=["x"]),
+    ]:
+        graph.add_model(model)
+    return graph
+
+
+def _naive_chain(graph, model_name):
+    if model_name not in graph.models:
+        return []
+    chain, visited, queue = [], set(), deque([model_name])
+    while queue:
+        current = queue.popleft()
+        if current in visited:
+            continue
+        visited.add(current)
+        chain.append(current)
+        queue.extend(graph.reverse_inheritance.get(current, []))
+    return chain
+
+
+def _naive_definition(graph, model_name, item_name, attr):
+    for model in _naive_chain(graph, model_name):
+        model_obj = graph.models.get(model)
+        if model_obj and any(i.name == item_name for i in getattr(model_obj, attr)):
+            return model
+    return None
+
+
+def test_closure_matches_bfs():
+    graph = _graph()
+    names = list(graph.models) + ["missing.parent", "unknown"]
+    items = ["message_post", "message_ids", "name", "state", "action_done", "spin", "x"]
+
+    for model_name in names:
+        assert graph.get_inheritance_chain(model_name) == _naive_chain(
+            graph, model_name
+        )
+        for item in items:
+            assert graph.find_method_definition(model_name, item) == (
+                _naive_definition(graph, model_name, item, "methods")
+            )
+            assert graph.find_field_definition(model_name, item) == (
+                _naive_definition(graph, model_name, item, "fields")
+            )
+
+
+def test_descendants_and_definers():
+    graph = _graph()
+
+    assert graph.get_descendant_models("base.doc") == ["sale.order", "sale.order.ext"]
+    assert graph.get_descendant_models("loop.a") == ["loop.b"]
+    assert graph.get_children_models("base.doc") == ["sale.order"]
+    assert graph.get_defining_models("action_done", "method") == {
+        "base.doc",
+        "sale.order.ext",
+    }
+    assert graph.get_defining_models("state", "field") == {"base.doc", "sale.order"}
+
+
+def test_add_model_invalidates_closure():
+    graph = _graph()
+    assert graph.find_field_definition("sale.order.ext", "amount") is None
+
+    graph.add_model(_model("sale.order.ext2", ["sale.order.ext"], fields=["amount"]))
+    graph.add_model(_model("sale.order.ext", ["sale.order"], fields=["amount"]))
+
+    assert graph.find_field_definition("sale.order.ext", "amount") == "sale.order.ext"
+    assert graph.get_descendant_models("sale.order") == [
+        "sale.order.ext",
+        "sale.order.ext2",
+    ]
+    assert graph.find_method_definition("sale.order.ext", "action_done") == "base.doc"
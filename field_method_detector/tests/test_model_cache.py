@@ -0,0 +1,83 @@
+"""
+Test suite for the persistent model cache
+=========================================
+
+Round trips, extractor version isolation, path relocation and LRU eviction
+of ModelCache.
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzers.ast_visitor import extract_models
+from core.model_cache import ModelCache
+
+SOURCE = '''
+from odoo import api, fields, models
+
+
+class SaleOrder(models.Model):
+    _inherit = "sale.order"
+
+    amount_margin = fields.Float()
+
+    @api.depends("amount_margin")
+    def _compute_margin(self):
+        self.action_confirm()
+'''
+
+PATH = "addons/sale/models/sale_order.py"
+SHA = "a" * 40
+
+
+def test_round_trip(tmp_path):
+    models = extract_models(SOURCE, PATH)
+
+    with ModelCache(tmp_path) as cache:
+        assert cache.get(SHA, PATH) is None
+        cache.put(SHA, PATH, models)
+
+    with ModelCache(tmp_path) as cache:
+        assert cache.get(SHA, PATH) == models
+        assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_extractor_version_isolates_entries(tmp_path):
+    with ModelCache(tmp_path, extractor_version="1") as cache:
+        cache.put(SHA, PATH, extract_models(SOURCE, PATH))
+
+    with ModelCache(tmp_path, extractor_version="2") as cache:
+        assert cache.get(SHA, PATH) is None
+
+
+def test_same_blob_at_other_path_is_relocated(tmp_path):
+    other_path = "addons/sale_margin/models/sale_order.py"
+
+    with ModelCache(tmp_path) as cache:
+        cache.put(SHA, PATH, extract_models(SOURCE, PATH))
+        [model] = cache.get(SHA, other_path)
+
+    assert model == extract_models(SOURCE, other_path)[0]
+    assert {r.source_file for r in model.references} == {other_path}
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    models = extract_models(SOURCE, PATH)
+    shas = [str(i) * 40 for i in range(3)]
+
+    with ModelCache(tmp_path) as cache:
+        cache.put(shas[0], PATH, models)
+        entry_size = cache.total_size()
+        cache.max_bytes = 2 * entry_size
+
+        cache.put(shas[1], PATH, models)
+        cache.get(shas[0], PATH)  # shas[1] is now the least recently used
+        cache.put(shas[2], PATH, models)
+
+        assert cache.total_size() <= cache.max_bytes
+        assert cache.get(shas[1], PATH) is None
+        assert cache.get(shas[0], PATH) == models
+        assert cache.get(shas[2], PATH) == models
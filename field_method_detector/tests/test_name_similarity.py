@@ -0,0 +1,108 @@
+"""
+Test suite for batched name similarity
+======================================
+
+The batched scorer (pure Python and NumPy paths) must produce exactly the
+same scores as MatchingEngine._calculate_similarity().
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analyzers import name_similarity
+from analyzers.matching_engine import MatchingEngine
+from analyzers.name_similarity import BatchSimilarity
+
+NAMES = [
+    "amount_total",
+    "total_amount",
+    "invoice_count",
+    "count_invoice",
+    "qty_delivered",
+    "delivered_qty",
+    "product_qty",
+    "item_qty",
+    "sale_line_item",
+    "sale_line_product",
+    "pricelist_item_ids",
+    "pricelist_product_ids",
+    "product_tmpl_id",
+    "product_template_id",
+    "related_partner_id",
+    "partner_id",
+    "old_state",
+    "status",
+    "action_confirm",
+    "_compute_amount",
+    "action_view_invoice",
+    "open_invoice_view",
+    "api_get_data",
+    "_internal_data",
+    "_action_cancel",
+    "action_cancel",
+    "getOrderLines",
+    "order_lines",
+    "get_is",
+    "_id",
+    "x",
+    "tax_totals_json",
+    "amount_untaxed",
+    "untaxed_amount",
+    "qty_received",
+    "qty_transfered",
+    "supplier_invoice_count",
+    "count_supplier_invoice",
+    "",
+]
+
+
+def _scalar_matrix(names1, names2):
+    engine = MatchingEngine()
+    return [[engine._calculate_similarity(a, b) for b in names2] for a in names1]
+
+
+@pytest.mark.parametrize("use_predict", [False, True])
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_batch_scores_match_scalar_path(use_numpy, use_predict):
+    if use_numpy and name_similarity.np is None:
+        pytest.skip("NumPy not installed")
+
+    engine = MatchingEngine()
+    batch = BatchSimilarity(
+        engine.naming_engine.is_transformation,
+        use_numpy,
+        predict=engine.naming_engine.predict if use_predict else None,
+    )
+
+    assert batch.score_matrix(NAMES, NAMES) == _scalar_matrix(NAMES, NAMES)
+
+
+def test_scored_pairs_keep_only_positive_scores():
+    batch = MatchingEngine().batch_similarity
+    names1, names2 = ["invoice_count", "action_confirm"], [
+        "count_invoice",
+        "_compute_total",
+    ]
+
+    pairs = batch.scored_pairs(names1, names2)
+
+    expected = [
+        (score, a, b)
+        for a, row in zip(names1, _scalar_matrix(names1, names2))
+        for b, score in zip(names2, row)
+        if score > 0
+    ]
+    assert pairs == expected
+    assert ("action_confirm", "_compute_total") not in {(a, b) for _, a, b in pairs}
+
+
+def test_empty_inputs():
+    batch = BatchSimilarity()
+
+    assert batch.score_matrix([], ["amount_total"]) == []
+    assert batch.scored_pairs(["amount_total"], []) == []
@@ -0,0 +1,98 @@
+"""
+Test suite for NamingRuleEngine
+===============================
+
+The precompiled, prefix/suffix indexed engine must give the same answers as
+trying every rule pattern with re.match/re.sub.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.naming_rules import (
+    FIELD_NAMING_RULES,
+    METHOD_NAMING_RULES,
+    NamingRuleEngine,
+    _literal_anchors,
+)
+
+
+def _example_names():
+    names = {"", "x", "action_confirm", "order_confirm", "view_sale", "_id"}
+    for rule in FIELD_NAMING_RULES + METHOD_NAMING_RULES:
+        for example in rule.get("examples", []):
+            for name in re.split(r"\s*→\s*|\s*,\s*|\s+", example):
+                if re.fullmatch(r"[A-Za-z_][A-Za-z0-9_]*", name):
+                    names.add(name)
+    return sorted(names)
+
+
+def _reference_rules(rules, old_name, skip_validation_only):
+    return [
+        (re.sub(rule["pattern"], rule["replacement"], old_name), rule["description"])
+        for rule in rules
+        if not (skip_validation_only and rule.get("validation_only", False))
+        and re.match(rule["pattern"], old_name)
+    ]
+
+
+def _reference_is_transformation(old_name, new_name):
+    for rule in FIELD_NAMING_RULES + METHOD_NAMING_RULES:
+        if rule.get("validation_only", False):
+            continue
+        if re.match(rule["pattern"], old_name):
+            predicted = re.sub(rule["pattern"], rule["replacement"], old_name)
+            if predicted == new_name and rule["weight"] >= 0.9:
+                return True
+    return False
+
+
+def test_apply_rules_match_unindexed_scan():
+    engine = NamingRuleEngine()
+
+    for name in _example_names():
+        field_matches = [
+            (m["predicted_name"], m["rule"]["description"])
+            for m in engine.apply_field_rule(name)
+        ]
+        method_matches = [
+            (m["predicted_name"], m["rule"]["description"])
+            for m in engine.apply_method_rule(name)
+        ]
+
+        assert field_matches == _reference_rules(FIELD_NAMING_RULES, name, True)
+        assert method_matches == _reference_rules(METHOD_NAMING_RULES, name, False)
+
+
+def test_predict_matches_is_transformation_scan():
+    engine = NamingRuleEngine()
+    names = _example_names()
+
+    for old_name in names:
+        predicted = engine.predict(old_name)
+        for new_name in names + sorted(predicted):
+            assert engine.is_transformation(old_name, new_name) == (
+                _reference_is_transformation(old_name, new_name)
+            )
+        assert engine.predict(old_name) is predicted  # memoized
+
+
+def test_known_transformations():
+    engine = NamingRuleEngine()
+
+    assert "count_supplier_invoice" in engine.predict("supplier_invoice_count")
+    assert engine.is_transformation("qty_received", "qty_transfered")
+    assert not engine.is_transformation("qty_received", "qty_delivered")
+
+
+def test_literal_anchors():
+    assert _literal_anchors(r"^(.+)_count$") == ("", "_count")
+    assert _literal_anchors(r"^_compute_(.+)_date$") == ("_compute_", "_date")
+    assert _literal_anchors(r"^qty_received$") == ("qty_received", "qty_received")
+    assert _literal_anchors(r"^abc?d$") == ("ab", "d")
+    assert _literal_anchors(r"^(.+)\d$") == ("", "")
+    assert _literal_anchors(r"^foo|bar$") == ("", "")
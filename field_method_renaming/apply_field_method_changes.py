@@ -32,6 +32,7 @@ from processors.xml_processor import XMLProcessor
 from utils.backup_manager import BackupManager
 from utils.csv_reader import CSVReader, CSVValidationError
 from utils.file_finder import FileFinder
+from utils.model_index import default_index_file
 from utils.change_grouper import ChangeGroup, group_changes_hierarchically
 
 
@@ -95,6 +96,12 @@ Examples:
         help="Custom backup directory (default: .backups)"
     )
 
+    parser.add_argument(
+        "--no-index-cache",
+        action="store_true",
+        help="Do not load or save the model to files index; read every file to build it",
+    )
+
     # Logging options
     parser.add_argument(
         "--verbose", "-v",
@@ -109,7 +116,8 @@ class FieldMethodRenamer:
     """Aplicador de cambios con rollback automático"""
 
     def __init__(self, csv_file: str, repo_path: str, dry_run: bool = False,
-                 create_backups: bool = True, backup_dir: str = None, verbose: bool = False):
+                 create_backups: bool = True, backup_dir: str = None, verbose: bool = False,
+                 index_cache: bool = True):
         """
         Initialize the renaming tool.
 
@@ -120,6 +128,7 @@ class FieldMethodRenamer:
             create_backups: If True, create backups (required for rollback)
             backup_dir: Custom backup directory
             verbose: Enable verbose logging
+            index_cache: Persist the model to files index between runs
         """
         self.csv_file = Path(csv_file)
         self.repo_path = Path(repo_path)
@@ -127,6 +136,7 @@ class FieldMethodRenamer:
         self.create_backups = create_backups
         self.backup_dir = backup_dir
         self.verbose = verbose
+        self.index_cache = index_cache
         self.logger = logging.getLogger(__name__)
 
         # Initialize components
@@ -156,7 +166,8 @@ class FieldMethodRenamer:
         self.csv_reader = CSVReader(str(self.csv_file))
 
         # Initialize file finder
-        self.file_finder = FileFinder(str(self.repo_path))
+        index_file = default_index_file(self.repo_path) if self.index_cache else None
+        self.file_finder = FileFinder(str(self.repo_path), index_file=index_file)
 
         # Initialize backup manager
         if self.create_backups:
@@ -427,7 +438,8 @@ def main():
         dry_run=args.dry_run,
         create_backups=not args.no_backup,
         backup_dir=args.backup_dir,
-        verbose=args.verbose
+        verbose=args.verbose,
+        index_cache=not args.no_index_cache,
     )
 
     tool.initialize()
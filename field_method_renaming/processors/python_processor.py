@@ -9,6 +9,8 @@ for precise and safe modifications.
 import ast
 import logging
 import re
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 from utils.csv_reader import FieldChange
@@ -17,6 +19,125 @@ from .base_processor import BaseProcessor
 
 logger = logging.getLogger(__name__)
 
+WORD_PATTERN = re.compile(r"\w+")
+
+
+@dataclass(frozen=True)
+class RenamePattern:
+    """
+    Regex rewriting one kind of reference for many renames at once.
+
+    template holds a {names} placeholder, replaced by the alternation of the
+    old names in the "name" group; replacement and message are formatted with
+    the new name and the match groups. quoted marks patterns whose closing
+    quote is a lookahead, so that a quote closing one reference can still
+    open the reference of another name.
+    """
+
+    template: str
+    replacement: str
+    message: str
+    quoted: bool = False
+
+
+FIELD_DEFINITION_PATTERNS = [
+    RenamePattern(
+        r"\b(?P<name>{names})\b(?=\s*=\s*fields\.)",
+        "{new}",
+        "Field definition: {old} → {new}",
+    ),
+]
+METHOD_DEFINITION_PATTERNS = [
+    RenamePattern(
+        r"\bdef\s+(?P<name>{names})\b(?=\s*\()",
+        "def {new}",
+        "Method definition: {old} → {new}",
+    ),
+]
+ATTRIBUTE_ACCESS_PATTERNS = [
+    RenamePattern(
+        r"\.(?P<name>{names})\b",
+        ".{new}",
+        "Attribute access/assignment: *.{old} → *.{new}",
+    ),
+]
+METHOD_CALL_PATTERNS = [
+    RenamePattern(
+        r"\.(?P<name>{names})\b(?=\s*\()",
+        ".{new}",
+        "Method call: *.{old}() → *.{new}()",
+    ),
+]
+DICTIONARY_ACCESS_PATTERNS = [
+    RenamePattern(
+        r"\['(?P<name>{names})'\]",
+        "['{new}']",
+        "Dictionary access: ['{old}'] → ['{new}']",
+    ),
+    RenamePattern(
+        r'\["(?P<name>{names})"\]',
+        '["{new}"]',
+        'Dictionary access: ["{old}"] → ["{new}"]',
+    ),
+]
+STRING_REFERENCE_PATTERNS = [
+    RenamePattern(
+        r"'(?P<name>{names})(?=')",
+        "'{new}",
+        "String reference: '{old}' → '{new}'",
+        quoted=True,
+    ),
+    RenamePattern(
+        r'"(?P<name>{names})(?=")',
+        '"{new}',
+        'String reference: "{old}" → "{new}"',
+        quoted=True,
+    ),
+]
+METHOD_REFERENCE_PATTERNS = [
+    RenamePattern(
+        rf"{kind}\s*=\s*(?P<quote>['\"])_{kind}_(?P<name>{{names}})(?P=quote)",
+        f"{kind}={{quote}}_{kind}_{{new}}{{quote}}",
+        f"{kind} method reference: _{kind}_{{old}} → _{kind}_{{new}}",
+    )
+    for kind in ("compute", "inverse", "search")
+]
+DOMAIN_REFERENCE_PATTERNS = [
+    RenamePattern(
+        r"\(\s*(?P<quote>['\"])(?P<name>{names})(?P=quote)\s*,",
+        "({quote}{new}{quote},",
+        "Domain reference: {old} → {new}",
+    ),
+]
+METHOD_STRING_REFERENCE_PATTERNS = [
+    RenamePattern(
+        r"'(?P<name>{names})(?=')",
+        "'{new}",
+        "Method string reference: '{old}' → '{new}'",
+        quoted=True,
+    ),
+    RenamePattern(
+        r'"(?P<name>{names})(?=")',
+        '"{new}',
+        'Method string reference: "{old}" → "{new}"',
+        quoted=True,
+    ),
+]
+
+# Greedy patterns whose matches depend on the name, applied one name at a time
+COMPOUND_STRING_SQ = r"'([^']+){names}([^']+)'"
+COMPOUND_STRING_DQ = r'"([^"]+){names}([^"]+)"'
+API_DEPENDS = r"@api\.depends\(([^)]*)(['\"]){names}(['\"])([^)]*)\)"
+
+
+@lru_cache(maxsize=4096)
+def _compile_rename_pattern(template: str, names: tuple[str, ...]) -> re.Pattern:
+    """Compile a RenamePattern template for the given old names"""
+    alternation = "|".join(
+        re.escape(name) for name in sorted(names, key=len, reverse=True)
+    )
+    return re.compile(template.replace("{names}", alternation))
+
 
 class ASTFieldMethodTransformer(ast.NodeTransformer):
     """AST transformer for renaming fields and methods"""
@@ -263,95 +384,36 @@ class PythonProcessor(BaseProcessor):
         modified_content = content
         applied_changes = []
 
-        # 1. Field definitions: field_name = fields.Type(...)
-        for old_name, new_name in field_changes.items():
-            pattern = rf"\b{re.escape(old_name)}\s*=\s*fields\."
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(
-                    rf"\b{re.escape(old_name)}\b(?=\s*=\s*fields\.)",
-                    new_name,
-                    modified_content,
-                )
-                applied_changes.append(f"Field definition: {old_name} → {new_name}")
-
-        # 2. Method definitions: def method_name(self, ...):
-        for old_name, new_name in method_changes.items():
-            pattern = rf"\bdef\s+{re.escape(old_name)}\s*\("
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(
-                    rf"\bdef\s+{re.escape(old_name)}\b(?=\s*\()",
-                    f"def {new_name}",
-                    modified_content,
-                )
-                applied_changes.append(f"Method definition: {old_name} → {new_name}")
-
-        # 3. Attribute access and assignments: self.field, record.field = value, obj.field += 1
-        for old_name, new_name in field_changes.items():
-            # Pattern for attribute access/assignment (handles =, +=, -=, *=, etc.)
-            pattern = rf"\.{re.escape(old_name)}\b"
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(
-                    rf"\.{re.escape(old_name)}\b",
-                    f".{new_name}",
-                    modified_content,
-                )
-                applied_changes.append(
-                    f"Attribute access/assignment: *.{old_name} → *.{new_name}"
-                )
-
-        # 4. Method calls: self.method(...) or obj.method(...)
-        for old_name, new_name in method_changes.items():
-            pattern = rf"\.{re.escape(old_name)}\s*\("
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(
-                    rf"\.{re.escape(old_name)}\b(?=\s*\()",
-                    f".{new_name}",
-                    modified_content,
-                )
-                applied_changes.append(f"Method call: *.{old_name}() → *.{new_name}()")
-
-        # 5. Dictionary access: vals['field'], data["field"]
-        for old_name, new_name in field_changes.items():
-            # Single quotes in dictionary keys
-            pattern = rf"\['{re.escape(old_name)}'\]"
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f"['{new_name}']", modified_content)
-                applied_changes.append(
-                    f"Dictionary access: ['{old_name}'] → ['{new_name}']"
-                )
-
-            # Double quotes in dictionary keys
-            pattern = rf'\["{re.escape(old_name)}"\]'
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f'["{new_name}"]', modified_content)
-                applied_changes.append(
-                    f'Dictionary access: ["{old_name}"] → ["{new_name}"]'
-                )
-
-        # 6. String references (exact matches)
-        for old_name, new_name in field_changes.items():
-            # Single quotes - exact match
-            pattern = rf"'{re.escape(old_name)}'"
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f"'{new_name}'", modified_content)
-                applied_changes.append(f"String reference: '{old_name}' → '{new_name}'")
-
-            # Double quotes - exact match
-            pattern = rf'"{re.escape(old_name)}"'
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f'"{new_name}"', modified_content)
-                applied_changes.append(f'String reference: "{old_name}" → "{new_name}"')
+        # 1-6. Definitions, attribute access, method calls, dictionary access
+        # and exact string references: one combined scan per pattern
+        for patterns, renames in (
+            (FIELD_DEFINITION_PATTERNS, field_changes),
+            (METHOD_DEFINITION_PATTERNS, method_changes),
+            (ATTRIBUTE_ACCESS_PATTERNS, field_changes),
+            (METHOD_CALL_PATTERNS, method_changes),
+            (DICTIONARY_ACCESS_PATTERNS, field_changes),
+            (STRING_REFERENCE_PATTERNS, field_changes),
+        ):
+            modified_content, step_changes = self._apply_rename_patterns(
+                modified_content, patterns, renames
+            )
+            applied_changes.extend(step_changes)
 
         # 7. Compound strings: 'default_field_name', 'compute_field_name', etc.
-        # This handles compound strings that weren't already covered by exact matches
+        # This handles compound strings that weren't already covered by exact matches.
+        # These greedy patterns are applied per name, but only for names still
+        # present after the steps above (most were renamed there already)
         for old_name, new_name in field_changes.items():
+            if old_name not in modified_content:
+                continue
+
             # Only apply compound string replacement if it wasn't already covered
             # Single quotes compound strings (avoid already processed exact matches)
-            pattern = rf"'([^']+){re.escape(old_name)}([^']+)'"
-            matches = re.findall(pattern, modified_content)
+            pattern = _compile_rename_pattern(COMPOUND_STRING_SQ, (old_name,))
+            matches = pattern.findall(modified_content)
             if matches:
                 replacement = rf"'\g<1>{new_name}\g<2>'"
-                modified_content = re.sub(pattern, replacement, modified_content)
+                modified_content = pattern.sub(replacement, modified_content)
                 for match in matches:
                     old_full = f"{match[0]}{old_name}{match[1]}"
                     new_full = f"{match[0]}{new_name}{match[1]}"
@@ -360,11 +422,11 @@ class PythonProcessor(BaseProcessor):
                     )
 
             # Double quotes compound strings (avoid already processed exact matches)
-            pattern = rf'"([^"]+){re.escape(old_name)}([^"]+)"'
-            matches = re.findall(pattern, modified_content)
+            pattern = _compile_rename_pattern(COMPOUND_STRING_DQ, (old_name,))
+            matches = pattern.findall(modified_content)
             if matches:
                 replacement = rf'"\g<1>{new_name}\g<2>"'
-                modified_content = re.sub(pattern, replacement, modified_content)
+                modified_content = pattern.sub(replacement, modified_content)
                 for match in matches:
                     old_full = f"{match[0]}{old_name}{match[1]}"
                     new_full = f"{match[0]}{new_name}{match[1]}"
@@ -375,68 +437,101 @@ class PythonProcessor(BaseProcessor):
         # 8. Odoo-specific patterns
         # @api.depends decorators
         for old_name, new_name in field_changes.items():
-            pattern = (
-                rf"@api\.depends\(([^)]*)(['\"]){re.escape(old_name)}(['\"])([^)]*)\)"
-            )
-            if re.search(pattern, modified_content):
+            if old_name not in modified_content:
+                continue
+
+            pattern = _compile_rename_pattern(API_DEPENDS, (old_name,))
+            if pattern.search(modified_content):
                 replacement = rf"@api.depends(\g<1>\g<2>{new_name}\g<3>\g<4>)"
-                modified_content = re.sub(pattern, replacement, modified_content)
+                modified_content = pattern.sub(replacement, modified_content)
                 applied_changes.append(
                     f"@api.depends decorator: {old_name} → {new_name}"
                 )
 
-        # compute, inverse, search method references
-        for old_name, new_name in field_changes.items():
-            patterns = [
-                (
-                    rf"compute\s*=\s*(['\"])_compute_{re.escape(old_name)}\1",
-                    rf"compute=\g<1>_compute_{new_name}\g<1>",
-                ),
-                (
-                    rf"inverse\s*=\s*(['\"])_inverse_{re.escape(old_name)}\1",
-                    rf"inverse=\g<1>_inverse_{new_name}\g<1>",
-                ),
-                (
-                    rf"search\s*=\s*(['\"])_search_{re.escape(old_name)}\1",
-                    rf"search=\g<1>_search_{new_name}\g<1>",
-                ),
-            ]
+        # compute, inverse, search method references, domain references
+        # and method string references
+        for patterns, renames in (
+            (METHOD_REFERENCE_PATTERNS, field_changes),
+            (DOMAIN_REFERENCE_PATTERNS, field_changes),
+            (METHOD_STRING_REFERENCE_PATTERNS, method_changes),
+        ):
+            modified_content, step_changes = self._apply_rename_patterns(
+                modified_content, patterns, renames
+            )
+            applied_changes.extend(step_changes)
 
-            for pattern, replacement in patterns:
-                if re.search(pattern, modified_content):
-                    modified_content = re.sub(pattern, replacement, modified_content)
-                    method_type = pattern.split("\\")[0]  # compute, inverse, or search
-                    applied_changes.append(
-                        f"{method_type} method reference: _{method_type}_{old_name} → _{method_type}_{new_name}"
-                    )
+        return modified_content, applied_changes
 
-        # Domain references: [('field_name', '=', value)]
-        for old_name, new_name in field_changes.items():
-            pattern = rf"\(\s*(['\"]){re.escape(old_name)}\1\s*,"
-            if re.search(pattern, modified_content):
-                replacement = rf"(\g<1>{new_name}\g<1>,"
-                modified_content = re.sub(pattern, replacement, modified_content)
-                applied_changes.append(f"Domain reference: {old_name} → {new_name}")
-
-        # Method string references
-        for old_name, new_name in method_changes.items():
-            # Single quotes
-            pattern = rf"'{re.escape(old_name)}'"
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f"'{new_name}'", modified_content)
-                applied_changes.append(
-                    f"Method string reference: '{old_name}' → '{new_name}'"
-                )
+    def _apply_rename_patterns(
+        self,
+        content: str,
+        patterns: list[RenamePattern],
+        renames: dict[str, str],
+    ) -> tuple[str, list[str]]:
+        """
+        Apply one step of rename patterns, all renames in one scan per pattern.
 
-            # Double quotes
-            pattern = rf'"{re.escape(old_name)}"'
-            if re.search(pattern, modified_content):
-                modified_content = re.sub(pattern, f'"{new_name}"', modified_content)
-                applied_changes.append(
-                    f'Method string reference: "{old_name}" → "{new_name}"'
-                )
+        Renames are simultaneous, which gives the same result as applying
+        them one after another as long as no new name is also an old name.
+        Chained (or non-identifier) renames are therefore applied one name
+        at a time, in CSV order.
 
-        return modified_content, applied_changes
+        Args:
+            content: Python content to transform
+            patterns: Patterns of the step, applied in order
+            renames: Dict mapping old names to new names
+
+        Returns:
+            Tuple of (modified_content, list_of_applied_changes)
+        """
+        applied_changes = []
+        if not renames:
+            return content, applied_changes
+
+        batchable = renames.keys().isdisjoint(renames.values()) and all(
+            WORD_PATTERN.fullmatch(name) for name in (*renames, *renames.values())
+        )
+        batches = (
+            [renames] if batchable else [{old: new} for old, new in renames.items()]
+        )
+
+        for batch in batches:
+            hits_per_pattern = []
+            for pattern in patterns:
+                content, hits = self._sub_rename_pattern(content, pattern, batch)
+                hits_per_pattern.append(hits)
+
+            # Same accounting order as one pass per name and pattern
+            for old_name, new_name in batch.items():
+                for pattern, hits in zip(patterns, hits_per_pattern):
+                    if old_name in hits:
+                        applied_changes.append(
+                            pattern.message.format(old=old_name, new=new_name)
+                        )
+
+        return content, applied_changes
+
+    def _sub_rename_pattern(
+        self, content: str, pattern: RenamePattern, renames: dict[str, str]
+    ) -> tuple[str, set[str]]:
+        """Rewrite every match of pattern and collect the old names found"""
+        regex = _compile_rename_pattern(pattern.template, tuple(renames))
+        hits = set()
+        closing_quotes = {}
+
+        def replace(match: re.Match) -> str:
+            old_name = match.group("name")
+            if pattern.quoted:
+                # A quote that closed a reference cannot open one of the same name
+                if closing_quotes.get(old_name) == match.start():
+                    return match.group()
+                closing_quotes[old_name] = match.end()
+            hits.add(old_name)
+            return pattern.replacement.format(
+                new=renames[old_name], **match.groupdict()
+            )
+
+        return regex.sub(replace, content), hits
 
     def _filter_relevant_changes(
         self, file_path: Path, changes: list[FieldChange]
@@ -7,10 +7,10 @@ safe text replacement that preserves original formatting.
 """
 
 import logging
-import re
 from pathlib import Path
 
 from utils.csv_reader import FieldChange
+from utils.rename_engine import RenameEngine
 
 from .base_processor import BaseProcessor
 
@@ -100,6 +100,7 @@ class XMLProcessor(BaseProcessor):
         """
         Apply field and method changes using safe, minimal text replacements.
         This method preserves 100% of the original formatting, indentation, and structure.
+        All renames are applied together in a single scan (see RenameEngine).
 
         Args:
             content: XML content to modify
@@ -109,87 +110,27 @@ class XMLProcessor(BaseProcessor):
         Returns:
             Tuple of (modified_content, applied_changes)
         """
-        applied_changes = []
-        modified_content = content
-
-        # Apply field changes with safe patterns
-        for old_name, new_name in field_changes.items():
-            total_replacements = 0
-
-            # Pattern 1: Field name attributes
-            field_name_patterns = [
-                (f'name="{old_name}"', f'name="{new_name}"'),
-                (f"name='{old_name}'", f"name='{new_name}'"),
-            ]
-
-            for old_pattern, new_pattern in field_name_patterns:
-                if old_pattern in modified_content:
-                    count = modified_content.count(old_pattern)
-                    modified_content = modified_content.replace(old_pattern, new_pattern)
-                    total_replacements += count
-                    if count > 0:
-                        logger.debug(f"Applied field name replacement: {old_pattern} → {new_pattern} ({count}x)")
-
-            # Pattern 2: Field references in attribute values (invisible, readonly, context, etc.)
-            # Use word boundaries to avoid partial replacements
-            # This catches: invisible="product_count > 1", context="{'field': product_count}"
-
-            # Build regex pattern with word boundaries
-            # Matches field_name as a complete word (not part of another word)
-            field_pattern = re.compile(r'\b' + re.escape(old_name) + r'\b')
-
-            # Count matches and replace
-            matches = field_pattern.findall(modified_content)
-            if matches:
-                count = len(matches)
-                modified_content = field_pattern.sub(new_name, modified_content)
-                total_replacements += count
-                logger.debug(
-                    f"Applied field reference replacement in attributes: {old_name} → {new_name} ({count}x)"
-                )
+        # Fields take precedence over methods sharing an old name
+        renames = {**method_changes, **field_changes}
+        modified_content, hits = RenameEngine(renames).apply(content)
 
-            if total_replacements > 0:
-                applied_changes.append(
-                    f"Field: {old_name} → {new_name} ({total_replacements} occurrences)"
-                )
-
-        # Apply method changes with safe patterns
-        for old_name, new_name in method_changes.items():
-            total_replacements = 0
-
-            # Pattern 1: Method name and action attributes
-            method_attribute_patterns = [
-                (f'name="{old_name}"', f'name="{new_name}"'),
-                (f"name='{old_name}'", f"name='{new_name}'"),
-                (f'action="{old_name}"', f'action="{new_name}"'),
-                (f"action='{old_name}'", f"action='{new_name}'"),
-            ]
-
-            for old_pattern, new_pattern in method_attribute_patterns:
-                if old_pattern in modified_content:
-                    count = modified_content.count(old_pattern)
-                    modified_content = modified_content.replace(old_pattern, new_pattern)
-                    total_replacements += count
-                    if count > 0:
-                        logger.debug(f"Applied method attribute replacement: {old_pattern} → {new_pattern} ({count}x)")
-
-            # Pattern 2: Method references in attribute values (similar to fields)
-            # This catches: domain="[('id', 'in', method_name())]", etc.
-            method_pattern = re.compile(r'\b' + re.escape(old_name) + r'\b')
-
-            # Count matches and replace
-            matches = method_pattern.findall(modified_content)
-            if matches:
-                count = len(matches)
-                modified_content = method_pattern.sub(new_name, modified_content)
-                total_replacements += count
+        # Field/method name and action attributes are whole-word matches too,
+        # so one scan covers name="...", action="..." and attribute values
+        # (invisible="product_count > 1", context="{'field': product_count}")
+        applied_changes = []
+        method_only = {
+            old: new for old, new in method_changes.items() if old not in field_changes
+        }
+        for label, changes in (("Field", field_changes), ("Method", method_only)):
+            for old_name, new_name in changes.items():
+                if not hits[old_name]:
+                    continue
                 logger.debug(
-                    f"Applied method reference replacement in attributes: {old_name} → {new_name} ({count}x)"
+                    f"Applied {label.lower()} replacement: {old_name} → {new_name} "
+                    f"({hits[old_name]}x)"
                 )
-
-            if total_replacements > 0:
                 applied_changes.append(
-                    f"Method: {old_name} → {new_name} ({total_replacements} occurrences)"
+                    f"{label}: {old_name} → {new_name} ({hits[old_name]} occurrences)"
                 )
 
         return modified_content, applied_changes
@@ -0,0 +1,137 @@
+"""
+Test suite for the model to files index
+=======================================
+
+Model extraction from Python and XML files, module filtering and the
+incremental refresh of the persisted index.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.model_index import ModelFileIndex, extract_models
+
+SALE_ORDER = """
+from odoo import models
+
+
+class SaleOrder(models.Model):
+    _inherit = ["sale.order", "mail.thread"]
+"""
+
+STOCK_PICKING = """
+from odoo import models
+
+
+class StockPicking(models.Model):
+    _name = "stock.picking"
+    _inherit = ("mail.thread", 'mail.activity.mixin')
+"""
+
+SALE_VIEWS = """<odoo>
+    <record id="view_order_form" model="ir.ui.view">
+        <field name="model">sale.order</field>
+    </record>
+    <record id="action_orders" model="ir.actions.act_window">
+        <field name="res_model">sale.order.line</field>
+    </record>
+</odoo>
+"""
+
+
+def write(path: Path, content: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def repo(tmp_path):
+    write(tmp_path / "sale" / "models" / "sale_order.py", SALE_ORDER)
+    write(tmp_path / "sale" / "views" / "sale_views.xml", SALE_VIEWS)
+    write(tmp_path / "stock" / "models" / "stock_picking.py", STOCK_PICKING)
+    write(tmp_path / "stock" / "tests" / "test_picking.py", STOCK_PICKING)
+    return tmp_path
+
+
+class TestExtractModels:
+    def test_python_declarations(self):
+        assert extract_models(SALE_ORDER, ".py") == {"sale.order", "mail.thread"}
+        assert extract_models(STOCK_PICKING, ".py") == {
+            "stock.picking",
+            "mail.thread",
+            "mail.activity.mixin",
+        }
+
+    def test_python_references_are_not_declarations(self):
+        content = 'self.env["sale.order"].search([])\n'
+        assert extract_models(content, ".py") == set()
+
+    def test_xml_forms(self):
+        assert extract_models(SALE_VIEWS, ".xml") == {
+            "ir.ui.view",
+            "ir.actions.act_window",
+            "sale.order",
+            "sale.order.line",
+        }
+
+
+class TestModelFileIndex:
+    def test_files_for_model(self, repo):
+        index = ModelFileIndex(repo)
+
+        assert index.files_for_model("mail.thread") == [
+            repo / "sale" / "models" / "sale_order.py",
+            repo / "stock" / "models" / "stock_picking.py",
+        ]
+        assert index.files_for_model("sale.order") == [
+            repo / "sale" / "models" / "sale_order.py",
+            repo / "sale" / "views" / "sale_views.xml",
+        ]
+        assert index.files_for_model("unknown.model") == []
+
+    def test_module_filter(self, repo):
+        index = ModelFileIndex(repo)
+
+        assert index.files_for_model("mail.thread", "stock") == [
+            repo / "stock" / "models" / "stock_picking.py"
+        ]
+        assert index.files_for_model("sale.order", "stock") == []
+
+    def test_refresh_reads_only_changed_files(self, repo, tmp_path_factory):
+        index_file = tmp_path_factory.mktemp("cache") / "index.json"
+        assert ModelFileIndex(repo, index_file).files_read == 3
+
+        unchanged = ModelFileIndex(repo, index_file)
+        assert unchanged.files_read == 0
+        assert unchanged.files_for_model("stock.picking")
+
+        sale_order = repo / "sale" / "models" / "sale_order.py"
+        write(sale_order, SALE_ORDER.replace('"sale.order"', '"purchase.order"'))
+        stat = sale_order.stat()
+        os.utime(sale_order, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        (repo / "stock" / "models" / "stock_picking.py").unlink()
+
+        refreshed = ModelFileIndex(repo, index_file)
+        assert refreshed.files_read == 1
+        assert refreshed.files_for_model("purchase.order") == [sale_order]
+        assert refreshed.files_for_model("sale.order") == [
+            repo / "sale" / "views" / "sale_views.xml"
+        ]
+        assert refreshed.files_for_model("stock.picking") == []
+        assert ModelFileIndex(repo, index_file).files_read == 0
+
+    def test_unreadable_index_is_rebuilt(self, repo, tmp_path_factory):
+        index_file = tmp_path_factory.mktemp("cache") / "index.json"
+        index_file.write_text("not json")
+
+        index = ModelFileIndex(repo, index_file)
+
+        assert index.files_read == 3
+        assert ModelFileIndex(repo, index_file).files_read == 0
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+XML Rename Benchmark
+====================
+
+Compares the per-rename replacement loop (one count/replace/regex pass per
+rename and pattern) with the single-scan RenameEngine on synthetic view
+files: time per file size and whether both produce the same output.
+
+Usage:
+    python utils/benchmark_xml_rename.py --renames 2000 --records 2000 20000
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.rename_engine import RenameEngine
+
+WORDS = [
+    "amount", "total", "invoice", "count", "qty", "delivered", "product",
+    "sale", "line", "price", "tax", "partner", "state", "order", "move",
+    "stock", "picking", "template", "journal", "currency", "date", "payment",
+]  # fmt: skip
+
+
+def make_case(renames: int, records: int, seed: int) -> tuple[dict[str, str], str]:
+    """Renames and a view file where about half of the fields are renamed"""
+    rng = random.Random(seed)
+    old_names = set()
+    while len(old_names) < renames:
+        old_names.add("_".join(rng.sample(WORDS, rng.randint(2, 4))))
+    old_names = sorted(old_names)
+    mapping = {old: f"x_{old}" for old in old_names}
+
+    lines = ["<odoo>", '    <record id="view_form" model="ir.ui.view">']
+    for _ in range(records):
+        if rng.random() < 0.5:
+            name = rng.choice(old_names)
+        else:
+            name = "_".join(rng.sample(WORDS, 2)) + "_kept"
+        lines.append(
+            f'        <field name="{name}" invisible="state != \'draft\'" '
+            f'readonly="{name} > 1"/>'
+        )
+    lines += ["    </record>", "</odoo>", ""]
+    return mapping, "\n".join(lines)
+
+
+def sequential_rename(content: str, mapping: dict[str, str]) -> str:
+    """Previous approach: attribute replaces plus one word regex per rename"""
+    for old_name, new_name in mapping.items():
+        for quote in ('"', "'"):
+            old_pattern = f"name={quote}{old_name}{quote}"
+            if old_pattern in content:
+                content = content.replace(old_pattern, f"name={quote}{new_name}{quote}")
+        content = re.sub(r"\b" + re.escape(old_name) + r"\b", new_name, content)
+    return content
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--renames", type=int, default=2000)
+    parser.add_argument("--records", type=int, nargs="+", default=[2000, 20000])
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--skip-sequential",
+        action="store_true",
+        help="Only time the single-scan engine",
+    )
+    args = parser.parse_args()
+
+    print(
+        f"{'renames':>8} {'records':>8} {'size_kb':>8} {'sequential':>11} "
+        f"{'engine':>8} {'same':>5}"
+    )
+    for records in args.records:
+        mapping, content = make_case(args.renames, records, args.seed)
+        engine_seconds, (engine_output, _) = timed(
+            lambda: RenameEngine(mapping).apply(content)
+        )
+        if args.skip_sequential:
+            sequential_seconds, same = float("nan"), "-"
+        else:
+            sequential_seconds, sequential_output = timed(
+                sequential_rename, content, mapping
+            )
+            same = "yes" if sequential_output == engine_output else "NO"
+        print(
+            f"{len(mapping):>8} {records:>8} {len(content) // 1024:>8} "
+            f"{sequential_seconds:>11.3f} {engine_seconds:>8.3f} {same:>5}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
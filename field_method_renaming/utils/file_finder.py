@@ -7,10 +7,11 @@ efficient processing of field and method renaming operations.
 """
 
 import logging
-import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from pathlib import Path
 
+from utils.model_index import ModelFileIndex
+
 logger = logging.getLogger(__name__)
 
 
@@ -94,19 +95,34 @@ class FileFinder:
     PYTHON_EXTENSIONS = [".py"]
     XML_EXTENSIONS = [".xml"]
 
-    def __init__(self, repo_path: str):
+    def __init__(self, repo_path: str, index_file: str | None = None):
         """
         Initialize file finder.
 
         Args:
             repo_path: Path to the Odoo repository root
+            index_file: Optional file persisting the model → files index
+                between runs (refreshed using file modification times)
         """
         self.repo_path = Path(repo_path)
         if not self.repo_path.exists():
             raise FileNotFoundError(f"Repository path does not exist: {repo_path}")
 
+        self.index_file = Path(index_file) if index_file else None
+        self._model_index = None
+        # Results per (module, model): the same model is looked up for every
+        # change group, extension and cross-module reference
+        self._file_sets: dict[tuple[str, str], FileSet] = {}
+
         logger.debug(f"Initialized FileFinder for repository: {self.repo_path}")
 
+    @property
+    def model_index(self) -> ModelFileIndex:
+        """Model → files index, built with one scan of the repository on first use"""
+        if self._model_index is None:
+            self._model_index = ModelFileIndex(self.repo_path, self.index_file)
+        return self._model_index
+
     def find_files_for_model(self, module: str, model: str) -> FileSet:
         """
         Find all files related to a specific model following OCA conventions.
@@ -118,6 +134,13 @@ class FileFinder:
         Returns:
             FileSet with categorized files
         """
+        key = (module, model)
+        if key not in self._file_sets:
+            self._file_sets[key] = self._find_files_for_model(module, model)
+        return self._copy_fileset(self._file_sets[key])
+
+    def _find_files_for_model(self, module: str, model: str) -> FileSet:
+        """Search the files of a model (see find_files_for_model)"""
         module_path = self.repo_path / module
 
         if not module_path.exists():
@@ -156,12 +179,12 @@ class FileFinder:
         # Remove duplicates and sort
         self._deduplicate_and_sort_fileset(file_set)
 
-        # If still no files found, try recursive search
+        # If still no files found, look the model up in the index
         if file_set.is_empty():
             logger.info(
-                f"No files found with OCA conventions for {model}, trying recursive search..."
+                f"No files found with OCA conventions for {model}, using model index..."
             )
-            file_set = self._search_recursive_fallback(module_path, model)
+            file_set = self._search_recursive_fallback(module, model)
 
         logger.info(f"Found {len(file_set)} files for {module}.{model}")
         self._log_file_summary(file_set, model)
@@ -348,201 +371,36 @@ class FileFinder:
 
         return True
 
-    def _search_recursive_fallback(self, module_path: Path, model: str) -> FileSet:
+    def _search_recursive_fallback(self, module: str, model: str) -> FileSet:
         """
-        Fallback recursive search when OCA conventions don't match.
+        Fallback when OCA conventions don't match: files of the module that
+        declare (_name/_inherit) or reference (model="...") the model.
 
         Args:
-            module_path: Path to the module directory
+            module: Module name
             model: Model name to search for
 
         Returns:
             FileSet with found files
         """
-        logger.debug(f"Performing recursive search for model {model}")
+        logger.debug(f"Looking up model {model} in the model index")
 
         file_set = FileSet([], [], [], [], [], [], [])
 
-        # Create search patterns
-        search_terms = self._create_search_terms(model)
-
-        # Search all Python files
-        for py_file in module_path.rglob("*.py"):
-            if self._should_exclude_path(py_file):
-                continue
-
-            if self._file_contains_model(py_file, search_terms):
-                file_set.python_files.append(py_file)
-
-        # Search all XML files
-        for xml_file in module_path.rglob("*.xml"):
-            if self._should_exclude_path(xml_file):
-                continue
-
-            if self._file_contains_model_reference(xml_file, search_terms):
+        for file_path in self.model_index.files_for_model(model, module):
+            if file_path.suffix in self.PYTHON_EXTENSIONS:
+                file_set.python_files.append(file_path)
+            else:
                 # Categorize XML file by directory
-                self._categorize_xml_file(xml_file, file_set)
+                self._categorize_xml_file(file_path, file_set)
 
         # Remove duplicates and sort
         self._deduplicate_and_sort_fileset(file_set)
 
-        logger.debug(f"Recursive search found {len(file_set)} files")
+        logger.debug(f"Model index found {len(file_set)} files")
 
         return file_set
 
-    def _create_search_terms(self, model: str) -> list[str]:
-        """
-        Create search terms for a model.
-
-        Args:
-            model: Model name
-
-        Returns:
-            List of search terms
-        """
-        terms = [
-            model,  # 'sale.order'
-            model.replace(".", "_"),  # 'sale_order'
-            f"'{model}'",  # quoted version
-            f'"{model}"',  # double quoted version
-        ]
-
-        # Add class name variations
-        class_name_variations = self._model_to_class_names(model)
-        terms.extend(class_name_variations)
-
-        return terms
-
-    def _model_to_class_names(self, model: str) -> list[str]:
-        """
-        Convert model name to possible class names.
-
-        Args:
-            model: Model name (e.g., 'sale.order')
-
-        Returns:
-            List of possible class names
-        """
-        # Convert to CamelCase variations
-        parts = model.split(".")
-
-        variations = []
-
-        # CamelCase each part and join
-        camel_parts = [part.capitalize() for part in parts]
-        variations.append("".join(camel_parts))  # 'SaleOrder'
-
-        # All parts combined with underscores, then CamelCase
-        underscore_name = "_".join(parts)
-        camel_underscore = "".join(
-            word.capitalize() for word in underscore_name.split("_")
-        )
-        if camel_underscore not in variations:
-            variations.append(camel_underscore)
-
-        return variations
-
-    def _should_exclude_path(self, file_path: Path) -> bool:
-        """
-        Check if a file path should be excluded from search.
-
-        Args:
-            file_path: Path to check
-
-        Returns:
-            True if should be excluded
-        """
-        exclude_patterns = [
-            "__pycache__",
-            ".git",
-            ".pytest_cache",
-            "migrations",
-            ".pyc",
-            "tests",  # Often test files don't need renaming
-        ]
-
-        path_str = str(file_path)
-        return any(pattern in path_str for pattern in exclude_patterns)
-
-    def _file_contains_model(self, file_path: Path, search_terms: list[str]) -> bool:
-        """
-        Check if a Python file contains references to the model.
-
-        Args:
-            file_path: Path to Python file
-            search_terms: Terms to search for
-
-        Returns:
-            True if file contains model references
-        """
-        try:
-            content = file_path.read_text(encoding="utf-8")
-
-            # Look for model references
-            for term in search_terms:
-                if term in content:
-                    # Additional validation for Python files
-                    if self._validate_python_model_reference(content, term):
-                        return True
-
-            return False
-
-        except Exception as e:
-            logger.warning(f"Could not read file {file_path}: {e}")
-            return False
-
-    def _validate_python_model_reference(self, content: str, term: str) -> bool:
-        """
-        Validate that a term in Python content is actually a model reference.
-
-        Args:
-            content: File content
-            term: Search term found
-
-        Returns:
-            True if it's a valid model reference
-        """
-        # Look for common Odoo patterns
-        patterns = [
-            rf"_name\s*=\s*['\"]?{re.escape(term)}['\"]?",  # _name = 'model.name'
-            rf"_inherit\s*=\s*['\"]?{re.escape(term)}['\"]?",  # _inherit = 'model.name'
-            rf"class\s+{re.escape(term)}",  # class ModelName
-            rf"model\s*=\s*['\"]?{re.escape(term)}['\"]?",  # model = 'model.name'
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
-
-        return False
-
-    def _file_contains_model_reference(
-        self, file_path: Path, search_terms: list[str]
-    ) -> bool:
-        """
-        Check if an XML file contains references to the model.
-
-        Args:
-            file_path: Path to XML file
-            search_terms: Terms to search for
-
-        Returns:
-            True if file contains model references
-        """
-        try:
-            content = file_path.read_text(encoding="utf-8")
-
-            # Look for model references in XML
-            for term in search_terms:
-                if term in content:
-                    return True
-
-            return False
-
-        except Exception as e:
-            logger.warning(f"Could not read file {file_path}: {e}")
-            return False
-
     def _categorize_xml_file(self, xml_file: Path, file_set: FileSet):
         """
         Categorize an XML file into the appropriate list in FileSet.
@@ -584,6 +442,21 @@ class FileFinder:
             # Default to views if uncertain
             file_set.view_files.append(xml_file)
 
+    def _copy_fileset(self, file_set: FileSet) -> FileSet:
+        """
+        Copy a FileSet so that callers can extend its lists.
+
+        Args:
+            file_set: FileSet to copy
+
+        Returns:
+            FileSet with copies of every list
+        """
+        return replace(
+            file_set,
+            **{name: list(files) for name, files in vars(file_set).items()},
+        )
+
     def _deduplicate_and_sort_fileset(self, file_set: FileSet):
         """
         Remove duplicates and sort files in FileSet.
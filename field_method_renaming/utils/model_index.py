@@ -0,0 +1,192 @@
+"""
+Model to Files Index
+====================
+
+Maps every model to the Python and XML files that declare or reference it,
+built with a single scan of the repository: ``_name``/``_inherit``
+declarations in Python files, ``model="..."`` attributes and
+``<field name="model">``/``res_model`` values in XML files.
+
+The index can be persisted as JSON. On the next run only files whose
+modification time or size changed are read again; deleted files are dropped.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import defaultdict
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+DEFAULT_INDEX_DIR = Path(__file__).resolve().parent.parent / ".cache"
+
+# Directories never holding files to rename (hidden ones are skipped too)
+EXCLUDED_DIRS = {"__pycache__", ".git", ".pytest_cache", "migrations", "tests"}
+
+MODEL_NAME = r"[\w.]+"
+PYTHON_DECLARATION = re.compile(
+    rf"\b_(?:name|inherit)\s*=\s*"
+    rf"(?P<value>\[[^\]]*\]|\([^)]*\)|['\"]{MODEL_NAME}['\"])"
+)
+QUOTED_MODEL = re.compile(rf"['\"]({MODEL_NAME})['\"]")
+XML_REFERENCE = re.compile(
+    rf"\bmodel\s*=\s*['\"](?P<attribute>{MODEL_NAME})['\"]"
+    rf"|<field\s+name=['\"](?:res_)?model['\"]\s*>\s*(?P<field>{MODEL_NAME})\s*<"
+)
+
+
+def extract_models(content: str, suffix: str) -> set[str]:
+    """
+    Extract the models a file declares or references.
+
+    Args:
+        content: File content
+        suffix: File extension (".py" or ".xml")
+
+    Returns:
+        Set of model names
+    """
+    models = set()
+    if suffix == ".py":
+        for match in PYTHON_DECLARATION.finditer(content):
+            models.update(QUOTED_MODEL.findall(match.group("value")))
+    else:
+        for match in XML_REFERENCE.finditer(content):
+            models.add(match.group("attribute") or match.group("field"))
+    return models
+
+
+def default_index_file(repo_path: Path) -> Path:
+    """Index file of a repository in the tool cache directory"""
+    repo_key = hashlib.sha1(str(Path(repo_path).resolve()).encode()).hexdigest()
+    return DEFAULT_INDEX_DIR / f"model_index_{repo_key[:16]}.json"
+
+
+class ModelFileIndex:
+    """Index of model → files for a repository"""
+
+    EXTENSIONS = (".py", ".xml")
+
+    def __init__(self, repo_path: Path, index_file: Path | None = None):
+        """
+        Build (or refresh) the index.
+
+        Args:
+            repo_path: Path to the Odoo repository root
+            index_file: Optional JSON file to load the previous index from
+                and to save the refreshed one to
+        """
+        self.repo_path = Path(repo_path)
+        self.index_file = Path(index_file) if index_file else None
+        # Relative path → (mtime_ns, size, models)
+        self.entries: dict[str, tuple[int, int, list[str]]] = {}
+        self.files_by_model: dict[str, list[Path]] = {}
+        self.files_read = 0
+
+        previous = self._load()
+        changed = self._scan(previous)
+        if self.index_file and (changed or len(previous) != len(self.entries)):
+            self._save()
+
+        self._build_lookup()
+        logger.debug(
+            f"Model index: {len(self.entries)} files, {len(self.files_by_model)} "
+            f"models, {self.files_read} files read"
+        )
+
+    def files_for_model(self, model: str, module: str | None = None) -> list[Path]:
+        """
+        Get the files declaring or referencing a model.
+
+        Args:
+            model: Model name (e.g., 'sale.order')
+            module: Optional module name restricting the result
+
+        Returns:
+            Sorted list of file paths
+        """
+        files = self.files_by_model.get(model, [])
+        if module is None:
+            return list(files)
+        module_path = self.repo_path / module
+        return [path for path in files if path.is_relative_to(module_path)]
+
+    def _scan(self, previous: dict[str, tuple[int, int, list[str]]]) -> bool:
+        """Walk the repository once, reading only new or modified files"""
+        changed = False
+        pending = [self.repo_path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not (
+                                entry.name.startswith(".")
+                                or entry.name in EXCLUDED_DIRS
+                            ):
+                                pending.append(entry.path)
+                            continue
+                        if not entry.name.endswith(self.EXTENSIONS):
+                            continue
+
+                        stat = entry.stat()
+                        key = Path(entry.path).relative_to(self.repo_path).as_posix()
+                        cached = previous.get(key)
+                        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                            self.entries[key] = cached
+                            continue
+
+                        models = self._read_models(Path(entry.path))
+                        self.entries[key] = (
+                            stat.st_mtime_ns,
+                            stat.st_size,
+                            sorted(models),
+                        )
+                        changed = True
+            except OSError as e:
+                logger.warning(f"Could not scan directory: {e}")
+        return changed
+
+    def _read_models(self, file_path: Path) -> set[str]:
+        self.files_read += 1
+        try:
+            content = file_path.read_text(encoding="utf-8")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read file {file_path}: {e}")
+            return set()
+        return extract_models(content, file_path.suffix)
+
+    def _build_lookup(self):
+        files_by_model = defaultdict(list)
+        for key in sorted(self.entries):
+            for model in self.entries[key][2]:
+                files_by_model[model].append(self.repo_path / key)
+        self.files_by_model = dict(files_by_model)
+
+    def _load(self) -> dict[str, tuple[int, int, list[str]]]:
+        if not self.index_file or not self.index_file.exists():
+            return {}
+        try:
+            data = json.loads(self.index_file.read_text(encoding="utf-8"))
+            if data.get("version") != INDEX_VERSION:
+                return {}
+            return {key: tuple(entry) for key, entry in data["files"].items()}
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable model index {self.index_file}: {e}")
+            return {}
+
+    def _save(self):
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_suffix(".tmp")
+            temp_file.write_text(
+                json.dumps({"version": INDEX_VERSION, "files": self.entries}),
+                encoding="utf-8",
+            )
+            temp_file.replace(self.index_file)
+        except OSError as e:
+            logger.warning(f"Could not save model index {self.index_file}: {e}")
@@ -0,0 +1,68 @@
+"""
+Rename Engine - Multi-Pattern Single-Scan Renaming
+==================================================
+
+Applies any number of renames to a text in one left-to-right scan.
+
+All old names are compiled into one pattern plus a lookup dict: when every
+name is an identifier the pattern is simply ``\\w+`` (each word of the text is
+looked up once, so the cost does not depend on the number of renames);
+otherwise it is an alternation of all names, longest first. Replacements are
+simultaneous, so renames chained in the CSV (a → b, b → c) do not cascade,
+and the hits of every rename are counted during the same pass.
+"""
+
+import logging
+import re
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class RenameEngine:
+    """Whole-word renames of many names in a single scan"""
+
+    def __init__(self, renames: dict[str, str]):
+        """
+        Compile the renames.
+
+        Args:
+            renames: Dict mapping old names to new names
+        """
+        self.renames = {old: new for old, new in renames.items() if old and old != new}
+
+        if all(WORD_PATTERN.fullmatch(old) for old in self.renames):
+            self.pattern = WORD_PATTERN
+        else:
+            alternation = "|".join(
+                re.escape(old) for old in sorted(self.renames, key=len, reverse=True)
+            )
+            self.pattern = re.compile(rf"\b(?:{alternation})\b")
+
+    def apply(self, content: str) -> tuple[str, Counter]:
+        """
+        Rename every whole-word occurrence of the old names.
+
+        Args:
+            content: Text to modify
+
+        Returns:
+            Tuple of (modified_content, hits per old name)
+        """
+        if not self.renames:
+            return content, Counter()
+
+        renames = self.renames
+        hits = Counter()
+
+        def replace(match: re.Match) -> str:
+            word = match.group()
+            new_name = renames.get(word)
+            if new_name is None:
+                return word
+            hits[word] += 1
+            return new_name
+
+        return self.pattern.sub(replace, content), hits
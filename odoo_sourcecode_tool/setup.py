@@ -38,6 +38,7 @@ setup(
         "pandas>=2.0.0",
     ],
     extras_require={
+        "zstd": ["zstandard>=0.21.0"],
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
@@ -37,7 +37,7 @@ class DetectCommand:
         """Initialize detect command with configuration"""
         self.config = config
         self.git_manager = GitManager(config.repo_path)
-        self.ordering = Order(config)
+        self.ordering = Order.shared(config)
 
     def execute(
         self,
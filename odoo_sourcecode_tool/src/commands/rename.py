@@ -4,12 +4,20 @@ Command module for applying field/method renames
 
 import ast
 import logging
+import re
 from dataclasses import dataclass
 from pathlib import Path
 
 import pandas as pd
 from core.config import Config
-from core.path_analyzer import FileType, ProcessingStatus, ProcessResult, path_analyzer
+from core.path_analyzer import (
+    FileType,
+    PathAnalysis,
+    ProcessingStatus,
+    ProcessResult,
+    path_analyzer,
+)
+from core.xml_rename import XMLRenameEngine
 
 logger = logging.getLogger(__name__)
 
@@ -43,12 +51,18 @@ class RenameCommand:
         # Use PathAnalyzer with backup support instead of direct BackupManager
         self.analyzer = path_analyzer.with_backup(config)
 
-    def execute(self, csv_file: Path, path_info: dict = None) -> bool:
+    def execute(
+        self,
+        csv_file: Path,
+        path_info: PathAnalysis | dict = None,
+    ) -> bool:
         """
         Execute renaming operation from CSV file
 
         Args:
             csv_file: Path to CSV file containing changes
+            path_info: Optional PathAnalysis (or dict) restricting the files
+                to process, e.g. files changed in Git
 
         Returns:
             True if successful, False if errors occurred
@@ -184,35 +198,94 @@ class RenameCommand:
         return grouped
 
     def _process_changes(
-        self, changes_by_model: dict[str, list[FieldChange]], path_info: dict = None,
+        self,
+        changes_by_model: dict[str, list[FieldChange]],
+        path_info: PathAnalysis | dict = None,
     ) -> list[ProcessResult]:
-        """Process all changes grouped by model"""
+        """Process all changes, reading and writing each file once"""
         results = []
+
+        # Candidate files given by the caller replace the module walk
+        candidates = None
+        if isinstance(path_info, PathAnalysis):
+            candidates = path_info.python_files + path_info.xml_files
+        elif path_info:
+            candidates = path_info.get("python_files", []) + path_info.get(
+                "xml_files", []
+            )
+
+        changes_by_file = self._bucket_changes_by_file(changes_by_model, candidates)
+        for file_path, file_changes in changes_by_file.items():
+            results.append(self._process_file(file_path, file_changes))
+
+        return results
+
+    def _bucket_changes_by_file(
+        self,
+        changes_by_model: dict[str, list[FieldChange]],
+        candidates: list[Path] | None = None,
+    ) -> dict[Path, list[FieldChange]]:
+        """
+        Collect, for every file, the changes of all models of its module
+
+        Each module is enumerated once, however many of its models have
+        changes, so every file gets a single read, transform and write.
+
+        Args:
+            changes_by_model: Changes grouped by module.model
+            candidates: Optional files restricting the module walk
+
+        Returns:
+            Dictionary mapping file paths to the changes to apply to them
+        """
         repo_path = Path(self.config.repo_path)
+        files_by_module: dict[str, list[Path]] = {}
+        changes_by_file: dict[Path, list[FieldChange]] = {}
 
         for model_key, model_changes in changes_by_model.items():
             module_name = model_key.split(".")[0]
-            module_path = repo_path / module_name
-
-            if not module_path.exists():
-                logger.warning(f"Module path not found: {module_path}")
-                continue
+            if module_name not in files_by_module:
+                module_path = repo_path / module_name
+                if not module_path.exists():
+                    logger.warning(f"Module path not found: {module_path}")
+                    files_by_module[module_name] = []
+                else:
+                    files_by_module[module_name] = self._find_files_for_module(
+                        module_path, candidates
+                    )
 
-            # Find relevant files
-            files = self._find_files_for_module(module_path)
+            for file_path in files_by_module[module_name]:
+                changes_by_file.setdefault(file_path, []).extend(model_changes)
 
-            # Process each file
-            for file_path in files:
-                result = self._process_file(file_path, model_changes)
-                results.append(result)
+        return {
+            file_path: self._merge_changes(file_path, file_changes)
+            for file_path, file_changes in changes_by_file.items()
+        }
 
-        return results
+    def _merge_changes(
+        self,
+        file_path: Path,
+        changes: list[FieldChange],
+    ) -> list[FieldChange]:
+        """Drop repeated renames of a name, keeping the first (model order)"""
+        merged = {}
+        for change in changes:
+            key = (change.item_type, change.old_name)
+            kept = merged.setdefault(key, change)
+            if kept.new_name != change.new_name:
+                logger.warning(
+                    f"{file_path}: conflicting renames for {change.old_name} "
+                    f"({kept.model}: {kept.new_name}, {change.model}: "
+                    f"{change.new_name}), keeping {kept.new_name}"
+                )
+        return list(merged.values())
 
     def _find_files_for_module(
         self,
         module_path: Path,
+        candidates: list[Path] | None = None,
     ) -> list[Path]:
-        """Find all relevant files in a module"""
+        """Find all relevant files in a module, among candidates if given"""
         include_python = (
             self.config.renaming.file_types
             and "python" in self.config.renaming.file_types
@@ -227,6 +300,7 @@ class RenameCommand:
             include_python=include_python,
             include_xml=include_xml,
             include_data=False,
+            files=candidates,
         )
 
         # Combine all file lists
@@ -268,7 +342,7 @@ class RenameCommand:
         """Process Python file for renames using unified processing."""
 
         def python_rename_transformer(content: str) -> tuple[str, dict]:
-            """Apply Python renames using AST transformation."""
+            """Apply Python renames located with the AST."""
             # Separate field and method changes
             field_changes = {c.old_name: c.new_name for c in changes if c.is_field}
             method_changes = {c.old_name: c.new_name for c in changes if c.is_method}
@@ -279,6 +353,15 @@ class RenameCommand:
             # Parse AST
             tree = ast.parse(content)
 
+            if self.config.renaming.python_backend == "patch":
+                # Patch the located names into the original text, keeping
+                # comments and formatting
+                locator = ASTRenameLocator(field_changes, method_changes, content)
+                locator.visit(tree)
+                if not locator.changes_made:
+                    return content, {"changes_made": []}
+                return locator.apply(), {"changes_made": locator.changes_made}
+
             # Apply transformations
             transformer = ASTRenameTransformer(field_changes, method_changes)
             new_tree = transformer.visit(tree)
@@ -313,58 +396,20 @@ class RenameCommand:
             if not field_changes and not method_changes:
                 return content, {"changes_made": []}
 
-            changes_made = []
-
-            # Apply safe text replacements to preserve formatting
-            # This approach is more robust than parsing and rewriting XML
-
-            # Process field changes
-            for old_name, new_name in field_changes.items():
-                # Safe patterns for field references
-                safe_patterns = [
-                    (f'name="{old_name}"', f'name="{new_name}"'),
-                    (f"name='{old_name}'", f"name='{new_name}'"),
-                    (f'ref="{old_name}"', f'ref="{new_name}"'),
-                    (f"ref='{old_name}'", f"ref='{new_name}'"),
-                ]
-
-                for old_pattern, new_pattern in safe_patterns:
-                    if old_pattern in content:
-                        count = content.count(old_pattern)
-                        content = content.replace(old_pattern, new_pattern)
-                        if count > 0:
-                            changes_made.append(
-                                f"Field {old_name}->{new_name}: {count} refs"
-                            )
-                            logger.debug(
-                                f"Replaced {old_pattern} with {new_pattern} ({count} times)"
-                            )
-
-            # Process method changes
-            for old_name, new_name in method_changes.items():
-                # Safe patterns for method references
-                safe_patterns = [
-                    # Button names
-                    (f'<button name="{old_name}"', f'<button name="{new_name}"'),
-                    (f"<button name='{old_name}'", f"<button name='{new_name}'"),
-                    # Actions
-                    (f'action="{old_name}"', f'action="{new_name}"'),
-                    (f"action='{old_name}'", f"action='{new_name}'"),
-                    # Method calls in eval
-                    (f".{old_name}(", f".{new_name}("),
-                ]
-
-                for old_pattern, new_pattern in safe_patterns:
-                    if old_pattern in content:
-                        count = content.count(old_pattern)
-                        content = content.replace(old_pattern, new_pattern)
-                        if count > 0:
-                            changes_made.append(
-                                f"Method {old_name}->{new_name}: {count} refs"
-                            )
-                            logger.debug(
-                                f"Replaced {old_pattern} with {new_pattern} ({count} times)"
-                            )
+            # All renames and reference forms are applied in a single scan
+            # (safe text replacements preserve the original formatting)
+            engine = XMLRenameEngine(field_changes, method_changes)
+            content, field_hits, method_hits = engine.apply(content)
+
+            changes_made = [
+                f"Field {old_name}->{field_changes[old_name]}: {count} refs"
+                for old_name, count in field_hits.items()
+            ] + [
+                f"Method {old_name}->{method_changes[old_name]}: {count} refs"
+                for old_name, count in method_hits.items()
+            ]
+            for change in changes_made:
+                logger.debug(f"Replaced {change}")
 
             return content, {"changes_made": changes_made}
 
@@ -390,6 +435,16 @@ class ASTRenameTransformer(ast.NodeTransformer):
         self.changes_made = []
         self.in_class = False
 
+    def _record_change(
+        self,
+        node: ast.AST,
+        old_name: str,
+        new_name: str,
+        change: str,
+    ):
+        """Record a rename of old_name to new_name at node"""
+        self.changes_made.append(change)
+
     def visit_ClassDef(self, node):
         """Track when we're inside a class definition"""
         old_in_class = self.in_class
@@ -410,8 +465,11 @@ class ASTRenameTransformer(ast.NodeTransformer):
             name = node.targets[0].id
             if name in self.field_changes:
                 node.targets[0].id = self.field_changes[name]
-                self.changes_made.append(
-                    f"field_def:{name}->{self.field_changes[name]}"
+                self._record_change(
+                    node.targets[0],
+                    name,
+                    self.field_changes[name],
+                    f"field_def:{name}->{self.field_changes[name]}",
                 )
                 logger.debug(
                     f"Renamed field definition: {name} -> {self.field_changes[name]}"
@@ -434,7 +492,9 @@ class ASTRenameTransformer(ast.NodeTransformer):
             old_name = node.name
             new_name = self.method_changes[old_name]
             node.name = new_name
-            self.changes_made.append(f"method_def:{old_name}->{new_name}")
+            self._record_change(
+                node, old_name, new_name, f"method_def:{old_name}->{new_name}"
+            )
             logger.debug(f"Renamed method definition: {old_name} -> {new_name}")
         return self.generic_visit(node)
 
@@ -450,12 +510,12 @@ class ASTRenameTransformer(ast.NodeTransformer):
             if node.attr in self.field_changes:
                 old_attr = node.attr
                 node.attr = self.field_changes[old_attr]
-                self.changes_made.append(f"field_ref:{old_attr}")
+                self._record_change(node, old_attr, node.attr, f"field_ref:{old_attr}")
                 logger.debug(f"Renamed field reference: {old_attr} -> {node.attr}")
             elif node.attr in self.method_changes:
                 old_attr = node.attr
                 node.attr = self.method_changes[old_attr]
-                self.changes_made.append(f"method_ref:{old_attr}")
+                self._record_change(node, old_attr, node.attr, f"method_ref:{old_attr}")
                 logger.debug(f"Renamed method reference: {old_attr} -> {node.attr}")
 
         return self.generic_visit(node)
@@ -468,7 +528,9 @@ class ASTRenameTransformer(ast.NodeTransformer):
             if node.value in self.field_changes:
                 old_value = node.value
                 node.value = self.field_changes[old_value]
-                self.changes_made.append(f"field_str:{old_value}")
+                self._record_change(
+                    node, old_value, node.value, f"field_str:{old_value}"
+                )
                 logger.debug(f"Renamed field string: {old_value} -> {node.value}")
         return self.generic_visit(node)
 
@@ -484,9 +546,101 @@ class ASTRenameTransformer(ast.NodeTransformer):
             if node.func.attr in self.method_changes:
                 old_method = node.func.attr
                 node.func.attr = self.method_changes[old_method]
-                self.changes_made.append(f"super_call:{old_method}")
+                self._record_change(
+                    node.func, old_method, node.func.attr, f"super_call:{old_method}"
+                )
                 logger.debug(
                     f"Renamed super() method call: {old_method} -> {node.func.attr}"
                 )
 
         return self.generic_visit(node)
+
+
+class ASTRenameLocator(ASTRenameTransformer):
+    """
+    Locates the renames of ASTRenameTransformer in the original source
+
+    The tree is only used to find the exact span of every identifier or
+    string to rename; the renames are then applied as byte-offset patches
+    to the original text, so comments and formatting are kept and the diff
+    is limited to the renamed names.
+    """
+
+    STRING_LITERAL = re.compile(rb"(?is)([ru]?)('''|\"\"\"|'|\")(.*)\2")
+    FUNCTION_DEF = re.compile(rb"(?:async\s+)?def\s+")
+
+    def __init__(
+        self,
+        field_changes: dict[str, str],
+        method_changes: dict[str, str],
+        source: str,
+    ):
+        super().__init__(field_changes, method_changes)
+        self.source = source.encode("utf-8")
+        # AST columns are UTF-8 byte offsets within each line
+        self.line_offsets = [0] + [
+            match.end() for match in re.finditer(rb"\n", self.source)
+        ]
+        self.patches: dict[int, tuple[int, bytes]] = {}
+
+    def _offset(self, lineno: int, col_offset: int) -> int:
+        return self.line_offsets[lineno - 1] + col_offset
+
+    def _locate(self, node: ast.AST, old_name: bytes) -> tuple[int, int] | None:
+        """Byte span of old_name in the source of node, if it can be found"""
+        if isinstance(node, ast.Name):
+            start = self._offset(node.lineno, node.col_offset)
+            end = self._offset(node.end_lineno, node.end_col_offset)
+        elif isinstance(node, ast.Attribute):
+            # The attribute name ends the node
+            end = self._offset(node.end_lineno, node.end_col_offset)
+            start = end - len(old_name)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            match = self.FUNCTION_DEF.match(
+                self.source, self._offset(node.lineno, node.col_offset)
+            )
+            if not match:
+                return None
+            start = match.end()
+            end = start + len(old_name)
+        elif isinstance(node, ast.Constant):
+            # Only plain literals: no implicit concatenation or escapes
+            start = self._offset(node.lineno, node.col_offset)
+            end = self._offset(node.end_lineno, node.end_col_offset)
+            match = self.STRING_LITERAL.fullmatch(self.source, start, end)
+            if not match:
+                return None
+            start, end = match.span(3)
+        else:
+            return None
+
+        if self.source[start:end] != old_name:
+            return None
+        return start, end
+
+    def _record_change(
+        self,
+        node: ast.AST,
+        old_name: str,
+        new_name: str,
+        change: str,
+    ):
+        """Record a rename only if its span in the source was found"""
+        span = self._locate(node, old_name.encode("utf-8"))
+        if span is None:
+            logger.warning(f"Could not locate {change} in source, left unchanged")
+            return
+        start, end = span
+        self.patches[start] = (end, new_name.encode("utf-8"))
+        super()._record_change(node, old_name, new_name, change)
+
+    def apply(self) -> str:
+        """Original source with every located rename patched in"""
+        parts = []
+        position = 0
+        for start in sorted(self.patches):
+            end, replacement = self.patches[start]
+            parts += [self.source[position:start], replacement]
+            position = end
+        parts.append(self.source[position:])
+        return b"".join(parts).decode("utf-8")
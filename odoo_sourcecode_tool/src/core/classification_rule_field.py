@@ -4,11 +4,14 @@ Field classification rules for the Ordering class.
 Provides a rule-based system for classifying Odoo fields by their semantic meaning or type.
 """
 
-from collections.abc import Callable
+import functools
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import IntEnum
 from typing import Any
 
+from core.classification_rule_method import PrefixTrie
+
 
 class FieldPriority(IntEnum):
     """Priority levels for field classification rules."""
@@ -431,3 +434,118 @@ def get_default_field_rules() -> list[ClassificationRuleField]:
     rules.sort(key=lambda r: r.priority)
 
     return rules
+
+
+# ============================================================
+# Compiled Dispatch
+# ============================================================
+
+
+class CompiledFieldRules:
+    """Field rules compiled into lookup tables.
+
+    Gives the same result as checking ClassificationRuleField.matches() on
+    each rule in order: field types and exact names are dict lookups,
+    prefixes and suffixes are trie walks over the lowercased name.
+    """
+
+    def __init__(self, rules: Iterable[ClassificationRuleField]):
+        """
+        Compile rules
+
+        Args:
+            rules: Rules sorted by priority; the first match wins
+        """
+        self.rules = tuple(rules)
+        self._computed: list[int] = []
+        self._related: list[int] = []
+        self._field_types: dict[str, list[int]] = {}
+        self._exact: dict[str, list[int]] = {}
+        self._prefixes = PrefixTrie()
+        self._suffixes = PrefixTrie()  # Reversed suffixes
+        self._contains: list[tuple[str, int]] = []
+        self._custom: list[int] = []
+
+        for index, rule in enumerate(self.rules):
+            if rule.check_computed:
+                self._computed.append(index)
+            if rule.check_related:
+                self._related.append(index)
+            for field_type in rule.field_types:
+                self._field_types.setdefault(field_type, []).append(index)
+            for name in rule.exact_names:
+                self._exact.setdefault(name, []).append(index)
+            for prefix in rule.prefixes:
+                self._prefixes.add(prefix.lower(), index)
+            for suffix in rule.suffixes:
+                self._suffixes.add(suffix.lower()[::-1], index)
+            for pattern in rule.contains:
+                self._contains.append((pattern.lower(), index))
+            if rule.custom_check and not any(
+                [
+                    rule.field_types,
+                    rule.exact_names,
+                    rule.prefixes,
+                    rule.suffixes,
+                    rule.contains,
+                    rule.check_computed,
+                    rule.check_related,
+                ],
+            ):
+                self._custom.append(index)
+
+    def classify(
+        self,
+        field_name: str,
+        field_info: dict[str, Any],
+    ) -> str | None:
+        """
+        Find the category of a field
+
+        Args:
+            field_name: Name of the field
+            field_info: Field metadata as returned by get_field_info()
+
+        Returns:
+            Category of the first matching rule, None if no rule matches
+        """
+        name_lower = field_name.lower()
+        field_type = field_info.get("field_type")
+
+        flagged: set[int] = set()
+        if field_info.get("is_computed"):
+            flagged.update(self._computed)
+        if field_info.get("is_related"):
+            flagged.update(self._related)
+
+        # A matched field type decides the rule on its own (see matches())
+        typed = set(self._field_types.get(field_type, ()))
+
+        patterns = set(self._exact.get(field_name, ()))
+        patterns.update(self._exact.get(name_lower, ()))
+        self._prefixes.collect(name_lower, patterns)
+        self._suffixes.collect(name_lower[::-1], patterns)
+        for pattern, index in self._contains:
+            if pattern in name_lower:
+                patterns.add(index)
+
+        for index in sorted(flagged.union(typed, patterns, self._custom)):
+            rule = self.rules[index]
+            if index in flagged:
+                return rule.category
+            if index in typed:
+                if not rule.custom_check or rule.custom_check(
+                    field_name, field_type, field_info
+                ):
+                    return rule.category
+            elif index in patterns or rule.custom_check(
+                field_name, field_info.get("field_type", ""), field_info
+            ):
+                return rule.category
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_field_rules() -> CompiledFieldRules:
+    """Default field rules, compiled once per process"""
+    return CompiledFieldRules(get_default_field_rules())
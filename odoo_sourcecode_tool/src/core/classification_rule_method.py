@@ -4,7 +4,8 @@ Method classification rules for the Ordering class.
 Separate file to keep the rules organized and maintainable.
 """
 
-from collections.abc import Callable
+import functools
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from enum import IntEnum
 
@@ -437,3 +438,109 @@ def get_default_method_rules() -> list[ClassificationRuleMethod]:
     rules.sort(key=lambda r: r.priority)
 
     return rules
+
+
+# ============================================================
+# Compiled Dispatch
+# ============================================================
+
+
+class PrefixTrie:
+    """Character trie mapping prefixes to the indices of the rules using them."""
+
+    def __init__(self):
+        self._root: dict = {}
+
+    def add(self, prefix: str, index: int):
+        """Register a rule index under a prefix"""
+        node = self._root
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(index)
+
+    def collect(self, text: str, found: set[int]):
+        """Add to found the indices of every registered prefix of text"""
+        node = self._root
+        for char in text:
+            node = node.get(char)
+            if node is None:
+                return
+            found.update(node.get(None, ()))
+
+
+class CompiledMethodRules:
+    """Method rules compiled into lookup tables.
+
+    Gives the same result as checking ClassificationRuleMethod.matches() on
+    each rule in order, but only the rules that can match a name are tried:
+    exact names and decorators are dict lookups, prefixes are a trie walk.
+    """
+
+    def __init__(self, rules: Iterable[ClassificationRuleMethod]):
+        """
+        Compile rules
+
+        Args:
+            rules: Rules sorted by priority; the first match wins
+        """
+        self.rules = tuple(rules)
+        self._exact: dict[str, list[int]] = {}
+        self._prefixes = PrefixTrie()
+        self._contains: list[tuple[str, int]] = []
+        self._decorators: dict[str, list[int]] = {}
+        self._custom: list[int] = []
+
+        for index, rule in enumerate(self.rules):
+            for name in rule.exact_matches:
+                self._exact.setdefault(name, []).append(index)
+            for prefix in rule.prefixes:
+                self._prefixes.add(prefix, index)
+            for pattern in rule.contains:
+                self._contains.append((pattern, index))
+            for decorator in rule.decorators:
+                self._decorators.setdefault(decorator, []).append(index)
+            if rule.custom_check and not rule.decorators:
+                self._custom.append(index)
+
+    def classify(
+        self,
+        method_name: str,
+        decorator_list: list[str],
+    ) -> str | None:
+        """
+        Find the category of a method
+
+        Args:
+            method_name: Name of the method
+            decorator_list: Decorators as returned by extract_decorators()
+
+        Returns:
+            Category of the first matching rule, None if no rule matches
+        """
+        # A matched decorator decides the rule on its own (see matches())
+        decorated: set[int] = set()
+        for decorator in decorator_list:
+            decorated.update(self._decorators.get(decorator.strip("@"), ()))
+
+        patterns = set(self._exact.get(method_name, ()))
+        self._prefixes.collect(method_name, patterns)
+        for pattern, index in self._contains:
+            if pattern in method_name:
+                patterns.add(index)
+
+        for index in sorted(decorated.union(patterns, self._custom)):
+            rule = self.rules[index]
+            if index in decorated:
+                if not rule.custom_check or rule.custom_check(
+                    method_name, decorator_list
+                ):
+                    return rule.category
+            elif index in patterns or rule.custom_check(method_name, decorator_list):
+                return rule.category
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_compiled_method_rules() -> CompiledMethodRules:
+    """Default method rules, compiled once per process"""
+    return CompiledMethodRules(get_default_method_rules())
@@ -10,6 +10,8 @@ from pathlib import Path
 from typing import Any
 
 import yaml
+from core.file_scanner import DEFAULT_IGNORE_DIRS
+from core.path_analyzer import COMPRESSION_LEVELS, valid_compression_level
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +30,10 @@ class OrderingConfig:
     # XML
     consolidate_menus: bool = True  # Enforce all menus in single menu.xml file
     menu_file_name: str = "menu.xml"  # Standard name for menu file
+    # Execution
+    max_workers: int = 1  # Worker processes for reorder (0 = one per CPU)
+    incremental: bool = True  # Skip files unchanged since the last reorder
+    cache_dir: str = ".odoo-tools/cache"  # Manifest location, relative to repo
 
     # isort configuration
     isort_sections: list[str] = field(
@@ -92,6 +98,8 @@ class RenamingConfig:
     file_types: list[str] = field(default_factory=lambda: ["python", "xml", "yaml"])
     parallel_processing: bool = False
     max_workers: int = 4
+    # patch: rename in place, keeping formatting; unparse: regenerate the file
+    python_backend: str = "patch"
 
 
 @dataclass
@@ -100,8 +108,15 @@ class BackupConfig:
 
     enabled: bool = True
     directory: str = ".backups"
-    compression: bool = True
+    compression: str = "gzip"  # none, gzip or zstd (gzip if zstandard is missing)
     keep_sessions: int = 10
+    compression_level: int | None = None  # Codec default when None
+    compression_threads: int = 0  # zstd worker threads (0 = none, -1 = all CPUs)
+
+    def __post_init__(self):
+        # Older configurations used a boolean
+        if isinstance(self.compression, bool):
+            self.compression = "gzip" if self.compression else "none"
 
 
 @dataclass
@@ -118,6 +133,10 @@ class Config:
     # Module filtering
     modules: list[str] = field(default_factory=list)
 
+    # Directory scanning
+    ignore_dirs: list[str] = field(default_factory=lambda: list(DEFAULT_IGNORE_DIRS))
+    respect_gitignore: bool = True  # Also skip paths ignored by .gitignore
+
     # Sub-configurations
     ordering: OrderingConfig = field(default_factory=OrderingConfig)
     detection: DetectionConfig = field(default_factory=DetectionConfig)
@@ -163,6 +182,8 @@ class Config:
             "verbose",
             "quiet",
             "output_dir",
+            "ignore_dirs",
+            "respect_gitignore",
         ]:
             if key in data:
                 setattr(config, key, data[key])
@@ -215,6 +236,10 @@ class Config:
             self.modules = other.modules
         if other.config_file:
             self.config_file = other.config_file
+        if other.ignore_dirs != DEFAULT_IGNORE_DIRS:
+            self.ignore_dirs = other.ignore_dirs
+        if not other.respect_gitignore:
+            self.respect_gitignore = False
 
         # Merge boolean flags (only if explicitly set to True)
         for flag in ["interactive", "dry_run", "verbose", "quiet"]:
@@ -266,6 +291,32 @@ class Config:
         if not 0 <= self.detection.auto_approve_threshold <= 1:
             errors.append("Auto-approve threshold must be between 0 and 1")
 
+        # Validate worker counts
+        if self.ordering.max_workers < 0:
+            errors.append("Ordering max_workers must be 0 (all CPUs) or greater")
+
+        # Validate backup compression
+        if self.backup.compression not in ["none", "gzip", "zstd"]:
+            errors.append(
+                f"Invalid backup compression: {self.backup.compression} "
+                "(use none, gzip or zstd)"
+            )
+        elif not valid_compression_level(
+            self.backup.compression, self.backup.compression_level
+        ):
+            low, high = COMPRESSION_LEVELS[self.backup.compression]
+            errors.append(
+                f"Invalid {self.backup.compression} compression level: "
+                f"{self.backup.compression_level} (use {low} to {high})"
+            )
+
+        # Validate Python rename backend
+        if self.renaming.python_backend not in ["patch", "unparse"]:
+            errors.append(
+                f"Invalid Python rename backend: {self.renaming.python_backend} "
+                "(use patch or unparse)"
+            )
+
         # Validate file types
         valid_file_types = ["python", "xml", "yaml", "csv", "javascript"]
         for ft in self.renaming.file_types:
@@ -284,6 +335,8 @@ class Config:
             "quiet": self.quiet,
             "modules": self.modules,
             "output_dir": self.output_dir,
+            "ignore_dirs": self.ignore_dirs,
+            "respect_gitignore": self.respect_gitignore,
             "ordering": asdict(self.ordering),
             "detection": asdict(self.detection),
             "renaming": asdict(self.renaming),
@@ -0,0 +1,328 @@
+"""
+Single-pass directory scanner with ignore rules.
+
+Walks a tree with os.scandir, classifying entries from the DirEntry type
+information (no extra stat per entry), pruning ignored directories before
+descending into them and detecting Odoo modules from the listings it already
+has. Ignored directories come from a configurable list of names or relative
+paths (e.g. "node_modules", "static/lib") and, optionally, from .gitignore
+files of the scanned tree and of its ancestors up to the repository root.
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_IGNORE_DIRS = [
+    ".git",
+    ".hg",
+    ".svn",
+    "__pycache__",
+    "node_modules",
+    ".venv",
+    "venv",
+    ".tox",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".odoo-tools",
+    ".backups",
+    "static/lib",
+]
+
+MANIFEST_FILES = ("__manifest__.py", "__openerp__.py")
+
+
+# ============================================================
+# .gitignore Rules
+# ============================================================
+
+
+def _translate_glob(pattern: str) -> str:
+    """Translate a gitignore glob into a regular expression body"""
+    result = []
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            result.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("/**", i) and i + 3 == len(pattern):
+            result.append("/.*")
+            i += 3
+        elif pattern.startswith("**", i):
+            result.append(".*")
+            i += 2
+        elif char == "*":
+            result.append("[^/]*")
+            i += 1
+        elif char == "?":
+            result.append("[^/]")
+            i += 1
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                result.append(re.escape(char))
+                i += 1
+            else:
+                body = pattern[i + 1 : end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                result.append(f"[{body}]")
+                i = end + 1
+        elif char == "\\" and i + 1 < len(pattern):
+            result.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            result.append(re.escape(char))
+            i += 1
+    return "".join(result)
+
+
+class GitignoreRules:
+    """Patterns of one .gitignore file, relative to its directory"""
+
+    def __init__(self, base: str, lines: list[str]):
+        """
+        Compile gitignore patterns
+
+        Args:
+            base: Absolute directory of the .gitignore file
+            lines: Lines of the file
+        """
+        self.base = base.rstrip(os.sep)
+        self.rules: list[tuple[re.Pattern, bool, bool]] = []
+
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            # Patterns with an inner slash are anchored to the .gitignore dir
+            anchored = "/" in line
+            line = line.lstrip("/")
+            prefix = "" if anchored else "(?:.*/)?"
+            regex = re.compile(f"{prefix}{_translate_glob(line)}")
+            self.rules.append((regex, negate, dir_only))
+
+    @classmethod
+    def from_file(cls, path: Path) -> "GitignoreRules | None":
+        """Load rules from a .gitignore file, None if unreadable or empty"""
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError as e:
+            logger.debug(f"Could not read {path}: {e}")
+            return None
+        rules = cls(str(path.parent), lines)
+        return rules if rules.rules else None
+
+    def match(self, path: str, is_dir: bool) -> bool | None:
+        """
+        Decide whether a path is ignored by these rules.
+
+        Args:
+            path: Absolute path of the entry
+            is_dir: Whether the entry is a directory
+
+        Returns:
+            True if ignored, False if re-included, None if no rule matches
+        """
+        if not path.startswith(self.base + os.sep):
+            return None
+        relative = path[len(self.base) + 1 :].replace(os.sep, "/")
+
+        decision = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(relative):
+                decision = not negate
+        return decision
+
+
+def is_gitignored(rules: list[GitignoreRules], path: str, is_dir: bool) -> bool:
+    """Apply rule sets from outermost to innermost; the last match wins"""
+    ignored = False
+    for rule_set in rules:
+        decision = rule_set.match(path, is_dir)
+        if decision is not None:
+            ignored = decision
+    return ignored
+
+
+# ============================================================
+# Scanner
+# ============================================================
+
+
+@dataclass
+class ModuleLayout:
+    """Odoo module markers seen while scanning a directory"""
+
+    path: Path
+    has_manifest: bool = False
+    has_models: bool = False
+    has_views: bool = False
+    has_security: bool = False
+
+    @property
+    def is_module(self) -> bool:
+        """Same criterion as PathAnalyzer._is_odoo_module()"""
+        return self.has_manifest or (self.has_models and self.has_views)
+
+
+@dataclass
+class ScanResult:
+    """Files and Odoo modules found by one scan"""
+
+    root: Path
+    files: list[Path] = field(default_factory=list)
+    modules: dict[Path, ModuleLayout] = field(default_factory=dict)
+    pruned: int = 0  # Ignored directories not descended into
+
+
+class FileScanner:
+    """Walk a directory tree once, pruning ignored directories"""
+
+    def __init__(
+        self,
+        ignore_dirs: list[str] | None = None,
+        respect_gitignore: bool = True,
+        module_depth: int = 1,
+    ):
+        """
+        Initialize the scanner
+
+        Args:
+            ignore_dirs: Directory names (or relative paths like "static/lib")
+                to skip; defaults to DEFAULT_IGNORE_DIRS
+            respect_gitignore: Also skip entries ignored by .gitignore files
+            module_depth: Depth up to which directories are checked for being
+                Odoo modules (0 = root only)
+        """
+        entries = DEFAULT_IGNORE_DIRS if ignore_dirs is None else ignore_dirs
+        self.ignore_names = {e.strip("/") for e in entries if "/" not in e.strip("/")}
+        self.ignore_paths = [e.strip("/") for e in entries if "/" in e.strip("/")]
+        self.respect_gitignore = respect_gitignore
+        self.module_depth = module_depth
+
+    def _is_ignored_dir(self, name: str, relative: str) -> bool:
+        """Check the configured ignore list"""
+        if name in self.ignore_names:
+            return True
+        return any(
+            relative == ignored or relative.endswith("/" + ignored)
+            for ignored in self.ignore_paths
+        )
+
+    def _ancestor_rules(self, root: Path) -> list[GitignoreRules]:
+        """Rules of .gitignore files above root, up to the repository root"""
+        root = Path(os.path.abspath(root))
+        if (root / ".git").exists():
+            # root is a repository: enclosing repositories do not apply
+            return []
+
+        ancestors = []
+        for directory in root.parents:
+            ancestors.append(directory)
+            if (directory / ".git").exists():
+                break
+        else:
+            # Not inside a repository: parent ignore files do not apply
+            return []
+
+        rules = []
+        for directory in reversed(ancestors):
+            gitignore = directory / ".gitignore"
+            if gitignore.is_file() and (loaded := GitignoreRules.from_file(gitignore)):
+                rules.append(loaded)
+        return rules
+
+    def scan(self, root: Path) -> ScanResult:
+        """
+        Scan a directory tree.
+
+        Args:
+            root: Directory to scan
+
+        Returns:
+            ScanResult with files (sorted by path within each directory,
+            depth-first) and the Odoo modules found up to module_depth
+        """
+        root = Path(root)
+        result = ScanResult(root=root)
+        base_rules = self._ancestor_rules(root) if self.respect_gitignore else []
+
+        # Walk absolute paths (gitignore bases are absolute) but report paths
+        # under root as given by the caller, like Path.rglob() does
+        absolute_root = os.path.abspath(root)
+        shown_root = str(root)
+
+        def shown(path: str) -> Path:
+            if shown_root == absolute_root:
+                return Path(path)
+            return Path(shown_root + path[len(absolute_root) :])
+
+        # (directory, path relative to root, depth, active gitignore rules)
+        stack = [(absolute_root, "", 0, base_rules)]
+        while stack:
+            directory, relative_dir, depth, rules = stack.pop()
+            try:
+                with os.scandir(directory) as iterator:
+                    entries = sorted(iterator, key=lambda entry: entry.name)
+            except OSError as e:
+                logger.debug(f"Cannot scan {directory}: {e}")
+                continue
+
+            if self.respect_gitignore and any(
+                entry.name == ".gitignore" for entry in entries
+            ):
+                loaded = GitignoreRules.from_file(Path(directory) / ".gitignore")
+                if loaded:
+                    rules = rules + [loaded]
+
+            layout = ModuleLayout(path=shown(directory))
+            subdirs = []
+            for entry in entries:
+                relative = (
+                    f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+                )
+                if entry.is_dir(follow_symlinks=False):
+                    if self._is_ignored_dir(entry.name, relative) or (
+                        rules and is_gitignored(rules, entry.path, True)
+                    ):
+                        result.pruned += 1
+                        continue
+                    subdirs.append((entry.path, relative, depth + 1, rules))
+                    if entry.name == "models":
+                        layout.has_models = True
+                    elif entry.name == "views":
+                        layout.has_views = True
+                    elif entry.name == "security":
+                        layout.has_security = True
+                elif entry.is_file():
+                    if rules and is_gitignored(rules, entry.path, False):
+                        continue
+                    result.files.append(shown(entry.path))
+                    if entry.name in MANIFEST_FILES:
+                        layout.has_manifest = True
+
+            if depth <= self.module_depth and layout.is_module:
+                result.modules[layout.path] = layout
+
+            # Reversed so that directories are visited in name order
+            stack.extend(reversed(subdirs))
+
+        return result
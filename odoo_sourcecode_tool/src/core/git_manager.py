@@ -259,6 +259,55 @@ class GitManager:
 
         return result
 
+    def get_changed_files(
+        self,
+        since: str | None = None,
+        staged: bool = False,
+        paths: list[str] | None = None,
+    ) -> list[Path]:
+        """
+        Get files changed in the working tree, without walking it
+
+        Args:
+            since: Commit reference to compare against (default HEAD)
+            staged: Only consider changes staged in the index
+            paths: Limit the diff to these paths
+
+        Returns:
+            Sorted absolute paths of changed files that still exist
+            (deleted files are left out; untracked files are included
+            unless staged is set)
+        """
+        args = ["--name-only", "--diff-filter=d", "-z"]
+        if staged:
+            args.append("--cached")
+        if since:
+            args.append(self.resolve_commit(since))
+        if paths:
+            args.append("--")
+            args.extend(str(p) for p in paths)
+
+        try:
+            output = self.repo.git.diff(*args)
+        except GitCommandError as e:
+            logger.error(f"Error listing changed files: {e}")
+            raise ValueError(f"Could not list changed files: {e}")
+
+        names = {name for name in output.split("\0") if name}
+        if not staged:
+            names.update(
+                self.repo.git.ls_files(
+                    "--others", "--exclude-standard", "-z", "--", *(paths or [])
+                ).split("\0")
+            )
+
+        files = []
+        for name in names:
+            file_path = self.repo_path / name
+            if name and file_path.is_file():
+                files.append(file_path)
+        return sorted(files)
+
     def stash_changes(
         self,
         message: str | None = None,
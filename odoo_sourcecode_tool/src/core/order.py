@@ -17,8 +17,11 @@ The module provides:
 """
 
 import ast
+import functools
 import logging
+import sys
 import xml.etree.ElementTree as ET
+from dataclasses import asdict
 from pathlib import Path
 from typing import Any
 
@@ -34,11 +37,13 @@ from blueprint.blueprint import (
 )
 from core.classification_rule_field import (
     ClassificationRuleField,
-    get_default_field_rules,
+    CompiledFieldRules,
+    get_compiled_field_rules,
 )
 from core.classification_rule_method import (
     ClassificationRuleMethod,
-    get_default_method_rules,
+    CompiledMethodRules,
+    get_compiled_method_rules,
 )
 from core.config import Config
 from core.path_analyzer import (
@@ -48,13 +53,129 @@ from core.path_analyzer import (
     ProcessResult,
     path_analyzer,
 )
+from core.transform_manifest import (
+    MANIFEST_VERSION,
+    TransformManifest,
+    find_repo_root,
+    make_fingerprint,
+    source_digest,
+)
+
+# Ordering settings that do not affect the reordered output
+EXECUTION_SETTINGS = {"max_workers", "incremental", "cache_dir"}
+
+# Implementation of the reordering (relative to src/): any change to these
+# files invalidates the incremental manifests
+ORDERING_SOURCES = (
+    "blueprint/*.py",
+    "core/order.py",
+    "core/classification_rule_*.py",
+)
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def ordering_logic_digest() -> str:
+    """Hash of the reordering implementation (see ORDERING_SOURCES)"""
+    return source_digest(Path(__file__).resolve().parent.parent, ORDERING_SOURCES)
+
+
+@functools.lru_cache(maxsize=256)
+def format_python_source(
+    source: str,
+    use_black: bool = True,
+    use_isort: bool = True,
+) -> str:
+    """Run black then isort over Python source.
+
+    Results are memoized on the unformatted source, so sources that come out
+    of the reorganization byte-identical to an earlier one (re-runs, repeated
+    boilerplate files) are not re-tokenized by either formatter.
+
+    Args:
+        source: Python source code
+        use_black: Apply black formatting
+        use_isort: Apply isort import sorting
+
+    Returns:
+        str: Formatted source (unchanged parts where a formatter fails)
+    """
+    if use_black:
+        try:
+            mode_obj = black.Mode(line_length=88, target_versions=set())
+            source = black.format_str(source, mode=mode_obj)
+        except Exception as e:
+            logger.warning(f"Black formatting failed: {e}")
+
+    if use_isort:
+        try:
+            source = isort.code(source)
+        except Exception as e:
+            logger.warning(f"isort formatting failed: {e}")
+
+    return source
+
+
+def _dispatch_to_order(method_name: str, *args, **kwargs):
+    """Call a handler method on the Order that registered the handlers last"""
+    return getattr(Order._handler_target, method_name)(*args, **kwargs)
+
+
+# (file type, action, Order method) registered with path_analyzer
+_ORDER_HANDLERS = [
+    (FileType.PYTHON, "order", "_process_single_python_file"),
+    (FileType.PYTHON, "order_attributes", "_process_python_attributes_only"),
+    (FileType.XML, "order", "_process_single_xml_file"),
+    (FileType.XML, "order_attributes", "_process_xml_attributes_only"),
+]
+_order_handlers = {
+    method_name: functools.partial(_dispatch_to_order, method_name)
+    for _, _, method_name in _ORDER_HANDLERS
+}
+
+
+class OrderTransformFactory:
+    """Picklable factory of per-file Order transformers for worker processes.
+
+    Each worker process builds its own Order instance once and reuses it for
+    every file it transforms.
+    """
+
+    def __init__(self, config: Config, kind: str, modes: list[str]):
+        """Initialize the factory.
+
+        Args:
+            config: Configuration for the Order instances
+            kind: "python" or "xml"
+            modes: List of processing modes to apply
+        """
+        self.config = config
+        self.kind = kind
+        self.modes = modes
+        self._order = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_order"] = None
+        return state
+
+    def __call__(self, file_path: Path):
+        if self._order is None:
+            self._order = Order.shared(self.config)
+        if self.kind == "python":
+            return self._order.python_transformer(self.modes)
+        return self._order.xml_transformer(self.modes)
+
+
 class Order:
     """Python/AST-specific ordering and reorganization logic for Odoo files."""
 
+    # Most recent Order, target of the path_analyzer handlers
+    _handler_target: "Order | None" = None
+    # Last instance handed out by shared(), with its configuration
+    _shared: "tuple[Config, Order] | None" = None
+
     def __init__(self, config=None):
         """Initialize Ordering with configuration.
 
@@ -65,36 +186,44 @@ class Order:
             config = Config()
 
         self.config = config
-        self._method_rules = get_default_method_rules()
-        self._field_rules = get_default_field_rules()
+        # Compiled once per process; replaced per instance only by add_*_rule
+        self._method_dispatch = get_compiled_method_rules()
+        self._field_dispatch = get_compiled_field_rules()
         self.attribute_orders = XML_ATTRIBUTE_ORDER
         self._register_handlers()
 
+    @classmethod
+    def shared(cls, config=None) -> "Order":
+        """
+        Get an Order for a configuration, reusing the last one built by shared().
+
+        Order keeps no per-file state, so callers that only need its
+        transformations or get_inventory() can share one instance.
+
+        Args:
+            config: Configuration object (None for the defaults)
+
+        Returns:
+            Order instance bound to config
+        """
+        if cls._shared is not None and cls._shared[0] is config:
+            return cls._shared[1]
+        order = cls(config)
+        cls._shared = (config, order)
+        return order
+
     def _register_handlers(self):
-        """Register file type handlers with the registry"""
-        # Register Python handlers
-        path_analyzer.register_handler(
-            FileType.PYTHON,
-            "order",
-            self._process_single_python_file,
-        )
-        path_analyzer.register_handler(
-            FileType.PYTHON,
-            "order_attributes",
-            self._process_python_attributes_only,
-        )
+        """Register file type handlers with the registry.
 
-        # Register XML handlers
-        path_analyzer.register_handler(
-            FileType.XML,
-            "order",
-            self._process_single_xml_file,
-        )
-        path_analyzer.register_handler(
-            FileType.XML,
-            "order_attributes",
-            self._process_xml_attributes_only,
-        )
+        Handlers are registered once per process and dispatch to the most
+        recently created Order, so building an Order does not rewrite the
+        global registry.
+        """
+        Order._handler_target = self
+        for file_type, action, method_name in _ORDER_HANDLERS:
+            handler = _order_handlers[method_name]
+            if path_analyzer.get_handler(file_type, action) is not handler:
+                path_analyzer.register_handler(file_type, action, handler)
 
     # ========================================================================
     # MAIN ENTRY POINTS - Called by CLI via getattr
@@ -145,10 +274,7 @@ class Order:
                 modes,
             )
         elif python_files:
-            return self._process_file_list(
-                python_files,
-                lambda f: self._process_single_python_file(f, modes),
-            )
+            return self._process_file_list(python_files, "python", modes)
         else:
             return ProcessResult(
                 file_path=path,
@@ -198,9 +324,7 @@ class Order:
         if is_file:
             return self._process_single_xml_file(path, modes)
         elif xml_files:
-            return self._process_file_list(
-                xml_files, lambda f: self._process_single_xml_file(f, modes)
-            )
+            return self._process_file_list(xml_files, "xml", modes)
         else:
             return ProcessResult(
                 file_path=path,
@@ -268,49 +392,79 @@ class Order:
         Returns:
             ProcessResult with status and changes
         """
+        # Use PathAnalyzer's unified file processing
+        manifest = self._load_manifest(file_path, "python", modes)
+        analyzer = path_analyzer.with_backup(self.config).with_manifest(manifest)
+        try:
+            result = analyzer.process_file_with_transform(
+                file_path,
+                self.python_transformer(modes),
+                dry_run=self.config.dry_run,
+                backup=getattr(self.config.backup, "enabled", True),
+            )
+        finally:
+            analyzer.with_manifest(None)
+        self._save_manifest(manifest)
+        return result
+
+    def python_transformer(self, modes: list[str]):
+        """Build the content transformer for Python files.
+
+        Args:
+            modes: List of processing modes to apply
+
+        Returns:
+            Callable taking file content and returning (new_content, metadata)
+        """
 
         def python_transformer(content: str) -> tuple[str, dict]:
-            """Transform Python content with specified modes."""
-            original_content = content
-            ordered_content = content
+            """Transform Python content with specified modes.
+
+            AST passes share one parsed tree; the source is unparsed once and
+            formatted once at the end.
+            """
+            source = content  # Latest text, None while the tree is ahead of it
+            tree = None  # Latest tree, None while it must be parsed from source
+            parse_failed = False
             changes_made = []
 
             # Apply each mode in sequence
             for mode in modes:
+                if mode not in ("field_attributes", "module"):
+                    logger.warning(f"Unknown Python processing mode: {mode}")
+                    continue
+
+                if tree is None and not parse_failed:
+                    try:
+                        tree = ast.parse(source)
+                    except SyntaxError as e:
+                        logger.error(f"Failed to parse content: {e}")
+                        parse_failed = True
+                if tree is None:
+                    continue
+
                 if mode == "field_attributes":
                     # Field attributes only
-                    ordered_content = self.reorganize_node(
-                        ordered_content, level="field_attributes"
-                    )
-                    if ordered_content != content:
+                    if self.reorder_field_attributes(tree):
                         changes_made.append("field_attributes")
-                        content = ordered_content
-                elif mode == "module":
-                    # Full module reorganization
-                    ordered_content = self.reorganize_node(
-                        ordered_content, level="module"
-                    )
-                    if ordered_content != content:
+                    source = None
+                else:
+                    # Full module reorganization, rendered straight to text
+                    source = self.reorganize_node(tree, level="module")
+                    tree = None
+                    if source != content:
                         changes_made.append("module")
-                        content = ordered_content
 
-                    # Apply formatting if configured (only for module level)
-                    if getattr(self.config, "use_black", True):
-                        try:
-                            mode_obj = black.Mode(line_length=88, target_versions=set())
-                            ordered_content = black.format_str(
-                                ordered_content, mode=mode_obj
-                            )
-                        except Exception as e:
-                            logger.warning(f"Black formatting failed: {e}")
+            if source is None:
+                source = self.unparse_node(tree)
 
-                    if getattr(self.config, "use_isort", True):
-                        try:
-                            ordered_content = isort.code(ordered_content)
-                        except Exception as e:
-                            logger.warning(f"isort formatting failed: {e}")
-                else:
-                    logger.warning(f"Unknown Python processing mode: {mode}")
+            # Apply formatting once (only for module level)
+            if "module" in modes:
+                source = format_python_source(
+                    source,
+                    use_black=getattr(self.config, "use_black", True),
+                    use_isort=getattr(self.config, "use_isort", True),
+                )
 
             metadata = {
                 "changes_made": changes_made,
@@ -318,16 +472,9 @@ class Order:
                     " and ".join(changes_made) if changes_made else "formatting"
                 ),
             }
-            return ordered_content, metadata
+            return source, metadata
 
-        # Use PathAnalyzer's unified file processing
-        analyzer = path_analyzer.with_backup(self.config)
-        return analyzer.process_file_with_transform(
-            file_path,
-            python_transformer,
-            dry_run=self.config.dry_run,
-            backup=getattr(self.config.backup, "enabled", True),
-        )
+        return python_transformer
 
     def _process_single_xml_file(
         self,
@@ -343,30 +490,53 @@ class Order:
         Returns:
             ProcessResult with status and changes
         """
+        # Use PathAnalyzer's unified file processing
+        manifest = self._load_manifest(file_path, "xml", modes)
+        analyzer = path_analyzer.with_backup(self.config).with_manifest(manifest)
+        try:
+            result = analyzer.process_file_with_transform(
+                file_path,
+                self.xml_transformer(modes),
+                dry_run=self.config.dry_run,
+                backup=getattr(self.config.backup, "enabled", True),
+            )
+        finally:
+            analyzer.with_manifest(None)
+        self._save_manifest(manifest)
+        return result
+
+    def xml_transformer(self, modes: list[str]):
+        """Build the content transformer for XML files.
+
+        Args:
+            modes: List of processing modes to apply
+
+        Returns:
+            Callable taking file content and returning (new_content, metadata)
+        """
 
         def xml_transformer(content: str) -> tuple[str, dict]:
-            """Transform XML content with specified modes."""
-            original_content = content
-            ordered_content = content
-            changes_made = []
+            """Transform XML content with specified modes.
 
-            # Apply each mode in sequence
+            The content is parsed once, every mode is applied to the same
+            element tree and the result is serialized once.
+            """
+            levels = []
             for mode in modes:
-                if mode == "structure":
-                    # Full structural reorganization
-                    ordered_content = self.reorganize_xml(file_path, "structure")
-                    if ordered_content != content:
-                        changes_made.append("structure")
-                        content = ordered_content
-                elif mode == "attributes":
-                    # Attribute-only reordering
-                    ordered_content = self.reorganize_xml(file_path, "attributes")
-                    if ordered_content != content:
-                        changes_made.append("attributes")
-                        content = ordered_content
+                if mode in ("structure", "attributes"):
+                    levels.append(mode)
                 else:
                     logger.warning(f"Unknown XML processing mode: {mode}")
 
+            if not levels:
+                return content, {"changes_made": [], "modes_str": "no changes"}
+
+            root = self.reorganize_xml_tree(ET.fromstring(content), levels)
+            ordered_content = ET.tostring(
+                root, encoding="unicode", xml_declaration=True
+            )
+
+            changes_made = levels if ordered_content != content else []
             metadata = {
                 "changes_made": changes_made,
                 "modes_str": (
@@ -375,14 +545,7 @@ class Order:
             }
             return ordered_content, metadata
 
-        # Use PathAnalyzer's unified file processing
-        analyzer = path_analyzer.with_backup(self.config)
-        return analyzer.process_file_with_transform(
-            file_path,
-            xml_transformer,
-            dry_run=self.config.dry_run,
-            backup=getattr(self.config.backup, "enabled", True),
-        )
+        return xml_transformer
 
     def _process_single_xml_file_error_handler(
         self, file_path: Path, e: Exception
@@ -430,36 +593,39 @@ class Order:
     def _process_file_list(
         self,
         file_list: list[Path],
-        processor_func=None,
-        action: str = "order",
+        kind: str,
+        modes: list[str],
     ) -> ProcessResult:
-        """Process a list of files using batch processing with backup support."""
-        # Use PathAnalyzer's batch processing with backup session management
-        analyzer = path_analyzer.with_backup(self.config)
+        """Process a list of files in a worker pool with backup support.
 
-        # If we have a processor function, use batch processing
-        if processor_func:
-            results = analyzer.process_files(
-                file_list,
-                processor_func,
-                session_type=f"order_{action}",
-            )
-        else:
-            # Process files individually using registry
-            results = []
-            for file_path in file_list:
-                file_type = path_analyzer.get_file_type(file_path)
-                if file_type == FileType.UNKNOWN:
-                    logger.debug(f"Skipping unknown file type: {file_path}")
-                    continue
+        Transformations run in up to ``config.ordering.max_workers`` processes;
+        backups and writes stay in this process. Files recorded as canonical
+        by a previous run (see _load_manifest) are skipped.
 
-                handler = path_analyzer.get_handler(file_type, action)
-                if not handler:
-                    logger.debug(f"No handler for {file_type.value}:{action}")
-                    continue
+        Args:
+            file_list: Files to process
+            kind: "python" or "xml"
+            modes: List of processing modes to apply
 
-                result = handler(file_path)
-                results.append(result)
+        Returns:
+            Aggregate ProcessResult
+        """
+        manifest = self._load_manifest(file_list[0], kind, modes)
+        analyzer = path_analyzer.with_backup(self.config).with_manifest(manifest)
+        try:
+            results = analyzer.process_files_parallel(
+                file_list,
+                OrderTransformFactory(self.config, kind, modes),
+                jobs=self.config.ordering.max_workers,
+                dry_run=self.config.dry_run,
+                backup=getattr(self.config.backup, "enabled", True),
+                session_description=f"order_{kind}",
+            )
+        finally:
+            analyzer.with_manifest(None)
+        self._save_manifest(manifest)
+        if manifest and manifest.skipped:
+            logger.info(f"Skipped {manifest.skipped} files unchanged since last run")
 
         # Count results
         success_count = sum(1 for r in results if r.status == ProcessingStatus.SUCCESS)
@@ -479,6 +645,52 @@ class Order:
             changes_applied=success_count,
         )
 
+    def _load_manifest(
+        self,
+        path: Path,
+        kind: str,
+        modes: list[str],
+    ) -> TransformManifest | None:
+        """Load the manifest of files already reordered with these settings.
+
+        Args:
+            path: A processed path, used to locate the repository root
+            kind: "python" or "xml"
+            modes: List of processing modes to apply
+
+        Returns:
+            TransformManifest, or None when incremental reordering is disabled
+        """
+        ordering = self.config.ordering
+        if not getattr(ordering, "incremental", False):
+            return None
+
+        settings = {
+            key: value
+            for key, value in asdict(ordering).items()
+            if key not in EXECUTION_SETTINGS
+        }
+        fingerprint = make_fingerprint(
+            kind,
+            list(modes),
+            settings,
+            sys.version_info[:2],  # ast.unparse output depends on it
+            black.__version__,
+            isort.__version__,
+            ordering_logic_digest(),
+        )
+        return TransformManifest(
+            find_repo_root(Path(path)),
+            fingerprint,
+            tool_version=MANIFEST_VERSION,
+            cache_dir=ordering.cache_dir,
+        )
+
+    def _save_manifest(self, manifest: TransformManifest | None) -> None:
+        """Persist the manifest after a real (non dry-run) reorder"""
+        if manifest and not self.config.dry_run:
+            manifest.save()
+
     def _print_summary(
         self,
         results: list[tuple[str, bool]],
@@ -788,14 +1000,10 @@ class Order:
             Field category as string
         """
         field_info = self.get_field_info(node)
+        category = self._field_dispatch.classify(field_info["field_name"], field_info)
 
-        # Check rules in priority order (they're already sorted)
-        for rule in self._field_rules:
-            if rule.matches(field_info["field_name"], field_info):
-                return rule.category
-
-        # This should never happen if rules are complete
-        return "UNCATEGORIZED"
+        # None should never happen if rules are complete
+        return category or "UNCATEGORIZED"
 
     def classify_method(
         self,
@@ -812,14 +1020,10 @@ class Order:
         """
         method_name = self.get_node_name(node)
         decorators = self.extract_decorators(node)
+        category = self._method_dispatch.classify(method_name, decorators)
 
-        # Check rules in priority order (they're already sorted)
-        for rule in self._method_rules:
-            if rule.matches(method_name, decorators):
-                return rule.category
-
-        # This should never happen if rules are complete
-        return "UNCATEGORIZED"
+        # None should never happen if rules are complete
+        return category or "UNCATEGORIZED"
 
     def group_fields_by_category(
         self,
@@ -1110,8 +1314,9 @@ class Order:
         Args:
             rule: ClassificationRuleMethod to add
         """
-        self._method_rules.append(rule)
-        self._method_rules.sort(key=lambda r: r.priority)
+        # Recompile a copy: the default dispatch is shared by every Order
+        rules = sorted([*self._method_dispatch.rules, rule], key=lambda r: r.priority)
+        self._method_dispatch = CompiledMethodRules(rules)
 
     def add_field_classification_rule(
         self,
@@ -1124,8 +1329,9 @@ class Order:
         Args:
             rule: ClassificationRuleField to add
         """
-        self._field_rules.append(rule)
-        self._field_rules.sort(key=lambda r: r.priority)
+        # Recompile a copy: the default dispatch is shared by every Order
+        rules = sorted([*self._field_dispatch.rules, rule], key=lambda r: r.priority)
+        self._field_dispatch = CompiledFieldRules(rules)
 
     @staticmethod
     def get_decorator_name(
@@ -1397,23 +1603,8 @@ class Order:
             except SyntaxError:
                 return content
 
-            # Create a transformer to reorder field attributes
-            class FieldAttributeReorderer(ast.NodeTransformer):
-                def __init__(self, ordering):
-                    self.ordering = ordering
-
-                def visit_Assign(self, node):
-                    if self.ordering.is_odoo_field(node):
-                        reordered = self.ordering.sort_field_attributes(node)
-                        if reordered:
-                            return reordered
-                    return node
-
-            # Apply the transformer
-            transformer = FieldAttributeReorderer(self)
-            tree = transformer.visit(tree)
-
-            # Return the unparsed tree
+            # Reorder field attributes and return the unparsed tree
+            self.reorder_field_attributes(tree)
             return self.unparse_node(tree)
 
         # Handle string content for module level
@@ -1574,6 +1765,37 @@ class Order:
         else:
             return result_lines
 
+    def reorder_field_attributes(
+        self,
+        tree: ast.AST,
+    ) -> int:
+        """Reorder the attributes of every Odoo field declaration in place.
+
+        Args:
+            tree: AST tree to modify
+
+        Returns:
+            int: Number of field declarations whose attribute order changed
+        """
+        ordering = self
+        changed = 0
+
+        class FieldAttributeReorderer(ast.NodeTransformer):
+            def visit_Assign(self, node):
+                nonlocal changed
+                if ordering.is_odoo_field(node):
+                    reordered = ordering.sort_field_attributes(node)
+                    if reordered:
+                        if [k.arg for k in reordered.value.keywords] != [
+                            k.arg for k in node.value.keywords
+                        ]:
+                            changed += 1
+                        return reordered
+                return node
+
+        FieldAttributeReorderer().visit(tree)
+        return changed
+
     def reorganize_xml(
         self,
         file_path: Path,
@@ -1588,29 +1810,45 @@ class Order:
         Returns:
             Reorganized XML content as string
         """
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        if level == "structure":
-            # Full structural reorganization
-            view_type = self.detect_view_type(root)
-
-            if view_type == "form":
-                root = self.reorganize_form_view(root)
-            elif view_type == "tree":
-                root = self.reorganize_tree_view(root)
-            elif view_type == "search":
-                root = self.reorganize_search_view(root)
-            elif view_type == "kanban":
-                root = self.reorganize_kanban_view(root)
+        root = ET.parse(file_path).getroot()
+        root = self.reorganize_xml_tree(root, [level])
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+    def reorganize_xml_tree(
+        self,
+        root: ET.Element,
+        levels: list[str],
+    ) -> ET.Element:
+        """Apply XML reorganization passes in sequence to one element tree.
+
+        Args:
+            root: Root element of the parsed XML
+            levels: "structure" and/or "attributes", applied in order
+
+        Returns:
+            Reorganized root element (may be a new element)
+        """
+        for level in levels:
+            if level == "structure":
+                # Full structural reorganization
+                view_type = self.detect_view_type(root)
+
+                if view_type == "form":
+                    root = self.reorganize_form_view(root)
+                elif view_type == "tree":
+                    root = self.reorganize_tree_view(root)
+                elif view_type == "search":
+                    root = self.reorganize_search_view(root)
+                elif view_type == "kanban":
+                    root = self.reorganize_kanban_view(root)
+                else:
+                    # Unknown type - just reorder attributes
+                    self.reorder_element_attributes(root)
             else:
-                # Unknown type - just reorder attributes
+                # Attributes only
                 self.reorder_element_attributes(root)
-        else:
-            # Attributes only
-            self.reorder_element_attributes(root)
 
-        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+        return root
 
     def reorder_element_attributes(
         self,
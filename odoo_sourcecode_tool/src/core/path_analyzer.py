@@ -10,16 +10,30 @@ providing a single source of truth for:
 - Standardized file processing with backup support
 """
 
+import gzip
+import hashlib
+import io
 import json
 import logging
+import os
 import shutil
 import tarfile
-from dataclasses import asdict, dataclass, field
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Callable
 
+from core.file_scanner import DEFAULT_IGNORE_DIRS, FileScanner, ModuleLayout
+from core.transform_manifest import content_hash
+
+try:
+    import zstandard
+except ImportError:  # Optional: zstd backups fall back to gzip
+    zstandard = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -147,6 +161,8 @@ class PathAnalyzer:
         self._extension_map: dict[str, FileType] = {}
         self._handlers: dict[FileType, dict[str, Callable]] = {}
         self._backup_manager: Any | None = None  # Lazy-initialized BackupManager
+        self._manifest: Any | None = None  # TransformManifest of canonical files
+        self._scanner = FileScanner()  # Directory walker with ignore rules
         self._initialize_registry()
 
     def _initialize_registry(self):
@@ -334,9 +350,40 @@ class PathAnalyzer:
                 backup_dir=config.backup.directory,
                 compression=config.backup.compression,
                 keep_sessions=config.backup.keep_sessions,
+                compression_level=config.backup.compression_level,
+                compression_threads=config.backup.compression_threads,
             )
         return self
 
+    def with_ignore(self, config: Any | None = None) -> "PathAnalyzer":
+        """
+        Configure the directories skipped when scanning.
+
+        Args:
+            config: Configuration object with ignore_dirs and respect_gitignore
+
+        Returns:
+            Self for method chaining
+        """
+        self._scanner = FileScanner(
+            ignore_dirs=getattr(config, "ignore_dirs", DEFAULT_IGNORE_DIRS),
+            respect_gitignore=getattr(config, "respect_gitignore", True),
+        )
+        return self
+
+    def with_manifest(self, manifest: Any | None) -> "PathAnalyzer":
+        """
+        Skip files a TransformManifest knows to be canonical already.
+
+        Args:
+            manifest: TransformManifest to consult and update, or None to disable
+
+        Returns:
+            Self for method chaining
+        """
+        self._manifest = manifest
+        return self
+
     def process_file_with_transform(
         self,
         file_path: Path,
@@ -349,11 +396,12 @@ class PathAnalyzer:
         Standard file processing pattern with transformation.
 
         Provides a unified way to:
-        1. Backup files (if enabled)
-        2. Read file content
+        1. Read file content
+        2. Skip it if the manifest (if enabled) knows it is canonical
         3. Apply transformation
         4. Check for changes
-        5. Write changes (or preview in dry-run)
+        5. Backup the original content (if enabled) and write changes,
+           or preview in dry-run
         6. Return standardized result
 
         Args:
@@ -361,7 +409,8 @@ class PathAnalyzer:
             transformer: Function that takes content and returns new content
                         Can return (content, metadata) tuple for ProcessResult
             dry_run: If True, don't write changes
-            backup: If True and backup_manager exists, backup file first
+            backup: If True and backup_manager exists, backup the file
+                    before writing it (only files that change are backed up)
             encoding: File encoding (default: utf-8)
 
         Returns:
@@ -378,12 +427,18 @@ class PathAnalyzer:
             ... )
         """
         try:
-            # 1. Backup if enabled
-            if backup and self._backup_manager and not dry_run:
-                self._backup_manager.backup_file(file_path)
-
-            # 2. Read
-            original_content = file_path.read_text(encoding=encoding)
+            # 1. Read (bytes are kept for the backup, text as read_text() does)
+            raw_content = file_path.read_bytes()
+            original_content = _decode_text(raw_content, encoding)
+
+            # 2. Skip files the manifest knows to be canonical already
+            if self._manifest and self._manifest.is_canonical(
+                file_path, original_content, encoding
+            ):
+                logger.debug(f"Unchanged since last run: {file_path}")
+                return ProcessResult(
+                    file_path=file_path, status=ProcessingStatus.NO_CHANGES
+                )
 
             # 3. Transform
             result = transformer(original_content)
@@ -395,16 +450,35 @@ class PathAnalyzer:
             # 4. Check for changes
             if new_content == original_content:
                 logger.debug(f"No changes needed for {file_path}")
+                if self._manifest:
+                    self._manifest.record(
+                        file_path, content_hash(original_content, encoding)
+                    )
                 return ProcessResult(
                     file_path=file_path, status=ProcessingStatus.NO_CHANGES
                 )
 
-            # 5. Write or dry-run
+            # 5. Backup and write, or dry-run
             if dry_run:
                 logger.info(f"[DRY RUN] Would modify {file_path}")
             else:
+                if (
+                    backup
+                    and self._backup_manager
+                    and self._backup_manager.backup_content(file_path, raw_content)
+                    is None
+                ):
+                    return ProcessResult(
+                        file_path=file_path,
+                        status=ProcessingStatus.ERROR,
+                        error_message="Backup failed, file left unchanged",
+                    )
                 file_path.write_text(new_content, encoding=encoding)
                 logger.info(f"Modified {file_path}")
+                if self._manifest:
+                    self._manifest.record(
+                        file_path, content_hash(new_content, encoding)
+                    )
 
             # 6. Return result with metadata
             return ProcessResult(
@@ -415,6 +489,8 @@ class PathAnalyzer:
 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
+            if self._manifest:
+                self._manifest.forget(file_path)
             return ProcessResult(
                 file_path=file_path, status=ProcessingStatus.ERROR, error_message=str(e)
             )
@@ -487,16 +563,162 @@ class PathAnalyzer:
 
         return results
 
+    def process_files_parallel(
+        self,
+        files: list[Path],
+        transformer_factory: Callable[[Path], Callable[[str], str | tuple[str, dict]]],
+        jobs: int = 1,
+        dry_run: bool = False,
+        backup: bool = True,
+        session_description: str = None,
+        encoding: str = "utf-8",
+    ) -> list[ProcessResult]:
+        """
+        Process multiple files, running the transformations in worker processes.
+
+        Reading and transforming happen in the workers; backups and writes stay
+        in this process, so a single backup session covers every file and no
+        file is written concurrently.
+
+        Args:
+            files: List of file paths to process
+            transformer_factory: Picklable callable returning the transformer
+                                 for a given file path
+            jobs: Number of worker processes (0 = one per CPU, 1 = in-process)
+            dry_run: If True, don't write changes
+            backup: If True and backup_manager exists, backup files
+            session_description: Description for backup session
+            encoding: File encoding (default: utf-8)
+
+        Returns:
+            List of ProcessResult objects, in the same order as files
+        """
+        jobs = resolve_jobs(jobs)
+
+        if backup and self._backup_manager and not dry_run:
+            self.start_backup_session(session_description)
+
+        # Files the manifest knows to be canonical are not sent to workers
+        results: dict[Path, ProcessResult] = {}
+        pending = []
+        for file_path in files:
+            manifest = self._manifest
+            if manifest and manifest.is_canonical_file(file_path, encoding):
+                logger.debug(f"Unchanged since last run: {file_path}")
+                results[file_path] = ProcessResult(
+                    file_path=file_path, status=ProcessingStatus.NO_CHANGES
+                )
+            else:
+                pending.append(file_path)
+
+        try:
+            if jobs <= 1 or len(pending) <= 1:
+                transformed = (
+                    _transform_file(transformer_factory, file_path, encoding)
+                    for file_path in pending
+                )
+                for file_path, outcome in zip(pending, transformed):
+                    results[file_path] = self._apply_transformed(
+                        file_path, outcome, dry_run, backup, encoding
+                    )
+            else:
+                workers = min(jobs, len(pending))
+                logger.info(
+                    f"Transforming {len(pending)} files with {workers} workers"
+                )
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_transform_worker,
+                    initargs=(transformer_factory,),
+                ) as executor:
+                    transformed = executor.map(
+                        _transform_file_in_worker,
+                        pending,
+                        [encoding] * len(pending),
+                        chunksize=max(1, len(pending) // (workers * 4)),
+                    )
+                    for file_path, outcome in zip(pending, transformed):
+                        results[file_path] = self._apply_transformed(
+                            file_path, outcome, dry_run, backup, encoding
+                        )
+
+        finally:
+            if backup and self._backup_manager and not dry_run:
+                self.finalize_backup_session()
+
+        return [results[file_path] for file_path in files if file_path in results]
+
+    def _apply_transformed(
+        self,
+        file_path: Path,
+        outcome: tuple[str | None, dict, str | None, str | None, bytes | None],
+        dry_run: bool,
+        backup: bool,
+        encoding: str,
+    ) -> ProcessResult:
+        """Backup and write the outcome of _transform_file() for one file"""
+        new_content, metadata, error, original_hash, raw_content = outcome
+        if error is not None:
+            logger.error(f"Error processing {file_path}: {error}")
+            if self._manifest:
+                self._manifest.forget(file_path)
+            return ProcessResult(
+                file_path=file_path, status=ProcessingStatus.ERROR, error_message=error
+            )
+
+        if new_content is None:
+            logger.debug(f"No changes needed for {file_path}")
+            if self._manifest:
+                self._manifest.record(file_path, original_hash)
+            return ProcessResult(
+                file_path=file_path, status=ProcessingStatus.NO_CHANGES
+            )
+
+        try:
+            if dry_run:
+                logger.info(f"[DRY RUN] Would modify {file_path}")
+            else:
+                if (
+                    backup
+                    and self._backup_manager
+                    and self._backup_manager.backup_content(file_path, raw_content)
+                    is None
+                ):
+                    return ProcessResult(
+                        file_path=file_path,
+                        status=ProcessingStatus.ERROR,
+                        error_message="Backup failed, file left unchanged",
+                    )
+                file_path.write_text(new_content, encoding=encoding)
+                logger.info(f"Modified {file_path}")
+                if self._manifest:
+                    self._manifest.record(
+                        file_path, content_hash(new_content, encoding)
+                    )
+        except Exception as e:
+            logger.error(f"Error processing {file_path}: {e}")
+            return ProcessResult(
+                file_path=file_path, status=ProcessingStatus.ERROR, error_message=str(e)
+            )
+
+        return ProcessResult(
+            file_path=file_path,
+            status=ProcessingStatus.SUCCESS,
+            changes_applied=metadata.get("changes_count", 1),
+        )
+
     # ========================================================================
     # PATH ANALYSIS METHODS
     # ========================================================================
 
-    def analyze(self, path: Path) -> PathAnalysis:
+    def analyze(self, path: Path, files: list[Path] | None = None) -> PathAnalysis:
         """
         Analyze a path and return detailed information.
 
         Args:
             path: File or directory path to analyze
+            files: Explicit candidate files (e.g. changed in Git). When given,
+                only those inside path are considered and the tree is not walked
 
         Returns:
             PathAnalysis object with detailed information
@@ -508,6 +730,9 @@ class PathAnalyzer:
                 description=f"Path does not exist: {path}",
             )
 
+        if files is not None:
+            return self._analyze_file_list(path, files)
+
         if path.is_file():
             return self._analyze_file(path)
         else:
@@ -567,12 +792,16 @@ class PathAnalyzer:
             other_files=[],
         )
 
+        # One pass collects files and detects modules (root and children)
+        scan = self._scanner.scan(path)
+
         # Check if it's an Odoo module
-        if self._is_odoo_module(path):
-            return self._analyze_odoo_module(path, analysis)
+        root_layout = scan.modules.get(Path(path))
+        if root_layout:
+            return self._analyze_odoo_module(path, analysis, scan.files, root_layout)
 
         # Check if it contains Odoo modules
-        odoo_modules = self._find_odoo_modules(path)
+        odoo_modules = sorted(scan.modules)
         if odoo_modules:
             analysis.path_type = PathType.ODOO_MODULES_DIR
             analysis.is_odoo_modules_dir = True
@@ -583,6 +812,12 @@ class PathAnalyzer:
             analysis.recommended_targets = ["all"]
 
             # Collect files from all modules
+            files_by_module = {module: [] for module in odoo_modules}
+            for file_path in scan.files:
+                parts = file_path.relative_to(path).parts
+                if len(parts) > 1 and (path / parts[0]) in files_by_module:
+                    files_by_module[path / parts[0]].append(file_path)
+
             for module in odoo_modules:
                 module_analysis = self._analyze_odoo_module(
                     module,
@@ -592,6 +827,8 @@ class PathAnalyzer:
                         is_directory=True,
                         is_file=False,
                     ),
+                    files_by_module[module],
+                    scan.modules[module],
                 )
                 analysis.python_files.extend(module_analysis.python_files)
                 analysis.xml_files.extend(module_analysis.xml_files)
@@ -599,35 +836,47 @@ class PathAnalyzer:
                 analysis.total_files += module_analysis.total_files
         else:
             # Regular directory
-            return self._analyze_regular_directory(path, analysis)
+            return self._analyze_regular_directory(path, analysis, scan.files)
 
         return analysis
 
-    def _analyze_odoo_module(self, path: Path, analysis: PathAnalysis) -> PathAnalysis:
-        """Analyze an Odoo module directory"""
+    def _classify_files(self, files: list[Path], analysis: PathAnalysis) -> None:
+        """Append files to the analysis lists by type (suffix lookup only)"""
+        for file_path in files:
+            file_type = self.get_file_type(file_path)
+            if file_type == FileType.PYTHON:
+                analysis.python_files.append(file_path)
+            elif file_type == FileType.XML:
+                analysis.xml_files.append(file_path)
+            else:
+                analysis.other_files.append(file_path)
+
+    def _analyze_odoo_module(
+        self,
+        path: Path,
+        analysis: PathAnalysis,
+        files: list[Path] | None = None,
+        layout: ModuleLayout | None = None,
+    ) -> PathAnalysis:
+        """Analyze an Odoo module directory (scanning it unless files are given)"""
+        if files is None or layout is None:
+            scan = self._scanner.scan(path)
+            files = scan.files
+            layout = scan.modules.get(Path(path)) or ModuleLayout(path=Path(path))
+
         analysis.path_type = PathType.ODOO_MODULE
         analysis.is_odoo_module = True
         analysis.description = f"Odoo module: {path.name}"
         analysis.recommended_targets = ["all", "python_code", "xml_code"]
 
-        # Check for standard Odoo directories and files
-        analysis.has_manifest = (path / "__manifest__.py").exists() or (
-            path / "__openerp__.py"
-        ).exists()
-        analysis.has_models = (path / "models").is_dir()
-        analysis.has_views = (path / "views").is_dir()
-        analysis.has_security = (path / "security").is_dir()
+        # Standard Odoo directories and files, as seen by the scan
+        analysis.has_manifest = layout.has_manifest
+        analysis.has_models = layout.has_models
+        analysis.has_views = layout.has_views
+        analysis.has_security = layout.has_security
 
         # Collect files by type
-        for file_path in path.rglob("*"):
-            if file_path.is_file():
-                file_type = self.get_file_type(file_path)
-                if file_type == FileType.PYTHON:
-                    analysis.python_files.append(file_path)
-                elif file_type == FileType.XML:
-                    analysis.xml_files.append(file_path)
-                else:
-                    analysis.other_files.append(file_path)
+        self._classify_files(files, analysis)
 
         analysis.total_files = (
             len(analysis.python_files)
@@ -638,23 +887,18 @@ class PathAnalyzer:
         return analysis
 
     def _analyze_regular_directory(
-        self, path: Path, analysis: PathAnalysis
+        self,
+        path: Path,
+        analysis: PathAnalysis,
+        files: list[Path] | None = None,
     ) -> PathAnalysis:
         """Analyze a regular (non-Odoo) directory"""
         # Collect all files
-        all_files = list(path.rglob("*"))
-
-        for file_path in all_files:
-            if file_path.is_file():
-                file_type = self.get_file_type(file_path)
-                if file_type == FileType.PYTHON:
-                    analysis.python_files.append(file_path)
-                elif file_type == FileType.XML:
-                    analysis.xml_files.append(file_path)
-                else:
-                    analysis.other_files.append(file_path)
+        if files is None:
+            files = self._scanner.scan(path).files
 
-        analysis.total_files = len(all_files)
+        self._classify_files(files, analysis)
+        analysis.total_files = len(files)
 
         # Determine directory type based on content
         has_python = len(analysis.python_files) > 0
@@ -677,6 +921,64 @@ class PathAnalyzer:
 
         return analysis
 
+    def _analyze_file_list(self, path: Path, files: list[Path]) -> PathAnalysis:
+        """Analyze only the given files that are inside path"""
+        root = path.resolve()
+        selected = []
+        for file_path in files:
+            resolved = Path(file_path).resolve()
+            if resolved == root or root in resolved.parents:
+                selected.append(resolved)
+
+        if path.is_file():
+            analysis = self._analyze_file(path)
+            if not selected:
+                analysis.python_files = []
+                analysis.xml_files = []
+                analysis.other_files = []
+                analysis.total_files = 0
+                analysis.recommended_targets = []
+                analysis.description = "File has no changes"
+            return analysis
+
+        analysis = PathAnalysis(
+            path=path, path_type=PathType.UNKNOWN, is_directory=True
+        )
+        for file_path in selected:
+            file_type = self.get_file_type(file_path)
+            if file_type == FileType.PYTHON:
+                analysis.python_files.append(file_path)
+            elif file_type == FileType.XML:
+                analysis.xml_files.append(file_path)
+            else:
+                analysis.other_files.append(file_path)
+        analysis.total_files = len(selected)
+
+        if self._is_odoo_module(path):
+            analysis.path_type = PathType.ODOO_MODULE
+            analysis.is_odoo_module = True
+            analysis.has_manifest = (path / "__manifest__.py").exists() or (
+                path / "__openerp__.py"
+            ).exists()
+            analysis.has_models = (path / "models").is_dir()
+            analysis.has_views = (path / "views").is_dir()
+            analysis.has_security = (path / "security").is_dir()
+        else:
+            analysis.path_type = PathType.MIXED_PROJECT
+        analysis.description = f"{len(selected)} changed files in {path.name or path}"
+
+        if analysis.python_files and analysis.xml_files:
+            analysis.recommended_targets = ["all"]
+        elif analysis.python_files:
+            analysis.recommended_targets = ["python_code"]
+        elif analysis.xml_files:
+            analysis.recommended_targets = ["xml_code"]
+        else:
+            analysis.path_type = PathType.EMPTY_DIR
+            analysis.description = f"No changed files in {path.name or path}"
+
+        return analysis
+
     def _is_odoo_module(self, path: Path) -> bool:
         """Check if a directory is an Odoo module"""
         if not path.is_dir():
@@ -702,17 +1004,6 @@ class PathAnalyzer:
         except Exception:
             return False
 
-    def _find_odoo_modules(self, path: Path) -> list[Path]:
-        """Find all Odoo modules in a directory"""
-        modules = []
-
-        # Check immediate subdirectories
-        for subdir in path.iterdir():
-            if subdir.is_dir() and self._is_odoo_module(subdir):
-                modules.append(subdir)
-
-        return modules
-
     # ========================================================================
     # UTILITY METHODS
     # ========================================================================
@@ -760,8 +1051,22 @@ class PathAnalyzer:
         include_python: bool = True,
         include_xml: bool = True,
         include_data: bool = False,
+        files: list[Path] | None = None,
     ) -> dict[str, list[Path]]:
-        """Find Odoo-specific files in a directory"""
+        """
+        Find Odoo-specific files in a directory
+
+        Args:
+            path: Module directory
+            include_python: Include models and wizards
+            include_xml: Include views
+            include_data: Include data and security XML (with include_xml)
+            files: Explicit candidate files; when given they are classified
+                instead of walking the module
+
+        Returns:
+            Dict of file lists by category
+        """
         result = {
             "models": [],
             "wizards": [],
@@ -773,6 +1078,31 @@ class PathAnalyzer:
         if not path.exists():
             return result
 
+        if files is not None:
+            wanted = {}
+            if include_python:
+                wanted.update(models=".py", wizards=".py")
+            if include_xml:
+                wanted["views"] = ".xml"
+                if include_data:
+                    wanted.update(data=".xml", security=".xml")
+
+            root = path.resolve()
+            for file_path in files:
+                try:
+                    relative = Path(file_path).resolve().relative_to(root)
+                except ValueError:
+                    continue
+                category = relative.parts[0] if len(relative.parts) > 1 else None
+                suffix = wanted.get(category)
+                if (
+                    suffix
+                    and relative.suffix == suffix
+                    and relative.name != "__init__.py"
+                ):
+                    result[category].append(Path(file_path))
+            return result
+
         # Find model files
         if include_python:
             models_dir = path / "models"
@@ -862,63 +1192,396 @@ class PathAnalyzer:
         return info.is_odoo_specific
 
 
+# ============================================================
+# Parallel Transformation Workers
+# ============================================================
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Normalize a worker count: 0 or None means one worker per CPU"""
+    if not jobs:
+        return os.cpu_count() or 1
+    return max(1, jobs)
+
+
+def _transform_file(
+    transformer_factory: Callable[[Path], Callable],
+    file_path: Path,
+    encoding: str,
+) -> tuple[str | None, dict, str | None, str | None, bytes | None]:
+    """
+    Read and transform one file without writing it.
+
+    Returns:
+        (new_content or None when unchanged, metadata, error message or None,
+        content hash of the original file when unchanged, original bytes to
+        back up when changed)
+    """
+    try:
+        raw_content = file_path.read_bytes()
+        original_content = _decode_text(raw_content, encoding)
+        result = transformer_factory(file_path)(original_content)
+        if isinstance(result, tuple):
+            new_content, metadata = result
+        else:
+            new_content, metadata = result, {}
+    except Exception as e:
+        return None, {}, str(e), None, None
+
+    if new_content == original_content:
+        return None, metadata, None, content_hash(original_content, encoding), None
+    return new_content, metadata, None, None, raw_content
+
+
+def _decode_text(content: bytes, encoding: str) -> str:
+    """Decode bytes with universal newlines, as Path.read_text() does"""
+    return content.decode(encoding).replace("\r\n", "\n").replace("\r", "\n")
+
+
+_worker_transformer_factory: Callable | None = None
+
+
+def _init_transform_worker(transformer_factory: Callable) -> None:
+    """Process pool initializer: keep the factory for the worker's lifetime"""
+    global _worker_transformer_factory
+    _worker_transformer_factory = transformer_factory
+
+
+def _transform_file_in_worker(
+    file_path: Path, encoding: str
+) -> tuple[str | None, dict, str | None, str | None, bytes | None]:
+    """Process pool task: transform one file with the worker's factory"""
+    return _transform_file(_worker_transformer_factory, file_path, encoding)
+
+
 # ============================================================
 # Backup Management
 # ============================================================
 
 
+# Blob codecs by compression setting, and their file suffix
+COMPRESSION_SUFFIXES = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+# Valid compression levels (inclusive) by codec
+COMPRESSION_LEVELS = {"gzip": (0, 9), "zstd": (-131072, 22)}
+
+
+def valid_compression_level(codec: str, level: int | None) -> bool:
+    """Whether a compression level can be used with a codec"""
+    if level is None or codec not in COMPRESSION_LEVELS:
+        return True
+    low, high = COMPRESSION_LEVELS[codec]
+    return low <= level <= high
+
+
+def resolve_compression(compression: str | bool | None) -> str:
+    """
+    Normalize a compression setting to an available codec name.
+
+    Args:
+        compression: "none", "gzip" or "zstd"; booleans are accepted for
+            older configurations (True = gzip)
+
+    Returns:
+        Codec name; "gzip" when zstd is requested but zstandard is missing
+    """
+    if compression is True:
+        return "gzip"
+    if not compression:
+        return "none"
+
+    codec = str(compression).lower()
+    if codec not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown backup compression: {compression}")
+    if codec == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed, compressing backups with gzip")
+        return "gzip"
+    return codec
+
+
+def open_compressed(
+    path: Path,
+    mode: str,
+    level: int | None = None,
+    threads: int = 0,
+):
+    """
+    Open a file for binary streaming, (de)compressing by its suffix.
+
+    Args:
+        path: File path; .gz is gzip, .zst is zstd, anything else is raw
+        mode: "rb" or "wb"
+        level: Compression level (codec default when None)
+        threads: zstd worker threads (0 = none, -1 = one per CPU)
+
+    Returns:
+        Binary file object
+    """
+    suffix = Path(path).suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode, compresslevel=6 if level is None else level)
+
+    if suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"zstandard is required to read or write {path}")
+        raw = open(path, mode)
+        if "w" in mode:
+            compressor = zstandard.ZstdCompressor(
+                level=3 if level is None else level, threads=threads
+            )
+            return compressor.stream_writer(raw)
+        return zstandard.ZstdDecompressor().stream_reader(raw)
+
+    return open(path, mode)
+
+
 @dataclass
 class BackupSession:
     """Information about a backup session"""
 
     session_id: str
     timestamp: str
-    directory: Path
+    directory: Path  # Blob store shared by all sessions
     files_backed_up: list[str] = field(default_factory=list)
     total_size: int = 0
     compressed: bool = False
+    compression: str = "none"  # Codec of the blobs written by this session
+    manifest: Path | None = None  # JSON Lines manifest of the session
+    files: dict[str, str] = field(default_factory=dict)  # path -> blob
 
 
 class BackupManager:
-    """Unified backup manager for file operations"""
+    """
+    Content-addressed backup manager for file operations.
+
+    Layout of the backup directory:
+
+        objects/ab/cdef...[.gz]   one blob per distinct content (SHA-256)
+        session_<id>.jsonl        one manifest per session: a header line,
+                                  one line per backed-up file (path -> blob)
+                                  and a closing line written on finalize
+
+    Blobs are written once, compressed as they are written (none, gzip or
+    zstd; see resolve_compression()), and shared by all sessions. Each blob
+    is read back with the codec its suffix names, whatever the current
+    setting. Manifest lines are appended as files are backed up, so an
+    interrupted session can still be restored. Sessions that backed up
+    nothing leave no trace. Sessions from earlier versions (plain directories
+    and .tar.gz archives) can still be listed and restored.
+    """
+
+    MANIFEST_SUFFIX = ".jsonl"
+    BLOB_SUFFIXES = tuple(COMPRESSION_SUFFIXES.values())  # Known blob codecs
+    CHUNK_SIZE = 1024 * 1024
+    # Blobs written or reused more recently are never garbage collected:
+    # a concurrent session may not have recorded them in its manifest yet
+    BLOB_GRACE_SECONDS = 3600
 
     def __init__(
         self,
         backup_dir: str = ".backups",
-        compression: bool = False,
+        compression: str | bool = "none",
         keep_sessions: int = 10,
+        compression_level: int | None = None,
+        compression_threads: int = 0,
     ):
         """
         Initialize backup manager
 
         Args:
             backup_dir: Directory to store backups
-            compression: Whether to compress backups
+            compression: Codec for new backups: "none", "gzip" or "zstd"
+                (True/False are read as "gzip"/"none")
             keep_sessions: Number of backup sessions to keep
+            compression_level: Codec level (codec default when None)
+            compression_threads: zstd worker threads (0 = none, -1 = all CPUs)
         """
         self.backup_dir = Path(backup_dir)
-        self.compression = compression
+        self.objects_dir = self.backup_dir / "objects"
+        self.compression = resolve_compression(compression)
+        if not valid_compression_level(self.compression, compression_level):
+            # e.g. a zstd level after falling back to gzip
+            logger.warning(
+                f"Compression level {compression_level} is not valid for "
+                f"{self.compression}, using the codec default"
+            )
+            compression_level = None
+        self.compression_level = compression_level
+        self.compression_threads = compression_threads
         self.keep_sessions = keep_sessions
         self.current_session: BackupSession | None = None
         # Create backup directory if it doesn't exist
         self.backup_dir.mkdir(parents=True, exist_ok=True)
 
+    # ------------------------------------------------------------------
+    # Blob store
+    # ------------------------------------------------------------------
+
+    @property
+    def _blob_suffix(self) -> str:
+        """Suffix (codec) of newly written blobs"""
+        return COMPRESSION_SUFFIXES[self.compression]
+
+    def _open_blob(self, path: Path, mode: str):
+        """Open a blob for binary reading or writing, by its codec suffix"""
+        return open_compressed(
+            path, mode, self.compression_level, self.compression_threads
+        )
+
+    def _find_blob(self, digest: str) -> Path | None:
+        """Existing blob for a digest, in any codec"""
+        base = self.objects_dir / digest[:2] / digest[2:]
+        for suffix in self.BLOB_SUFFIXES:
+            candidate = base.with_name(base.name + suffix)
+            if candidate.exists():
+                return candidate
+        return None
+
+    def _reuse_blob(self, blob_path: Path) -> Path:
+        """Refresh the mtime of an existing blob so GC keeps it"""
+        try:
+            os.utime(blob_path)
+        except OSError as e:
+            logger.debug(f"Could not touch blob {blob_path}: {e}")
+        return blob_path
+
+    def _store_blob(self, chunks: Any) -> tuple[Path, int]:
+        """
+        Stream chunks into the blob store.
+
+        Content is hashed and compressed in the same pass into a temporary
+        file, which becomes the blob unless that content is already stored.
+
+        Args:
+            chunks: Iterable of bytes
+
+        Returns:
+            Tuple of (blob path, content size)
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix="tmp_", suffix=self._blob_suffix, dir=self.objects_dir
+        )
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        hasher = hashlib.sha256()
+        size = 0
+        try:
+            with self._open_blob(tmp_path, "wb") as blob:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    blob.write(chunk)
+                    size += len(chunk)
+
+            digest = hasher.hexdigest()
+            existing = self._find_blob(digest)
+            if existing:
+                tmp_path.unlink()
+                return self._reuse_blob(existing), size
+
+            blob_path = self.objects_dir / digest[:2] / (digest[2:] + self._blob_suffix)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_path, blob_path)
+            return blob_path, size
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+    def _store_content(self, content: bytes) -> tuple[Path, int]:
+        """Store in-memory content, skipping the write if already stored"""
+        existing = self._find_blob(hashlib.sha256(content).hexdigest())
+        if existing:
+            return self._reuse_blob(existing), len(content)
+        return self._store_blob([content])
+
+    def read_blob(self, blob_path: Path) -> bytes:
+        """Read (and decompress) a blob"""
+        with self._open_blob(blob_path, "rb") as blob:
+            content = io.BytesIO()
+            shutil.copyfileobj(blob, content, self.CHUNK_SIZE)
+            return content.getvalue()
+
+    def _copy_blob(self, blob_path: Path, target: Path) -> None:
+        """Stream a blob back to a file"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._open_blob(blob_path, "rb") as blob, open(target, "wb") as out:
+            shutil.copyfileobj(blob, out, self.CHUNK_SIZE)
+
+    # ------------------------------------------------------------------
+    # Sessions
+    # ------------------------------------------------------------------
+
+    def _manifest_path(self, session_id: str) -> Path:
+        return self.backup_dir / f"{session_id}{self.MANIFEST_SUFFIX}"
+
+    def _append_manifest(self, record: dict[str, Any]) -> None:
+        """Append one record to the current session manifest"""
+        with open(self.current_session.manifest, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+
     def start_session(self, description: str | None = None) -> Path:
-        """Start a new backup session"""
+        """
+        Start a new backup session
+
+        Nothing is written until the first file is backed up.
+
+        Returns:
+            Path of the session manifest
+        """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         session_id = f"session_{timestamp}"
         if description:
             session_id = f"{session_id}_{description}"
-        session_dir = self.backup_dir / session_id
-        session_dir.mkdir(parents=True, exist_ok=True)
+
+        # Several sessions may start within the same second
+        base_id, counter = session_id, 1
+        while (
+            self._manifest_path(session_id).exists()
+            or (self.backup_dir / session_id).exists()
+        ):
+            session_id = f"{base_id}_{counter}"
+            counter += 1
+
         self.current_session = BackupSession(
-            session_id=session_id, timestamp=timestamp, directory=session_dir
+            session_id=session_id,
+            timestamp=timestamp,
+            directory=self.objects_dir,
+            compressed=self.compression != "none",
+            compression=self.compression,
+            manifest=self._manifest_path(session_id),
         )
         logger.info(f"Started backup session: {session_id}")
-        return session_dir
+        return self.current_session.manifest
+
+    def _record_backup(self, file_path: Path, blob_path: Path, size: int) -> None:
+        """Add a backed-up file to the current session"""
+        session = self.current_session
+        key = str(Path(file_path).absolute())
+        if key in session.files:
+            return  # Keep the content from before the first change
+
+        if not session.manifest.exists():
+            self._append_manifest(
+                {
+                    "session_id": session.session_id,
+                    "timestamp": session.timestamp,
+                    "compression": session.compression,
+                    "format": 2,
+                }
+            )
+        blob = blob_path.relative_to(self.objects_dir).as_posix()
+        self._append_manifest({"path": key, "blob": blob, "size": size})
+
+        session.files[key] = blob
+        session.files_backed_up.append(key)
+        session.total_size += size
 
     def backup_file(self, file_path: Path) -> Path | None:
-        """Backup a single file"""
+        """
+        Backup a single file, streaming it into the blob store
+
+        Returns:
+            Path of the blob holding the file content, or None on error
+        """
         if not self.current_session:
             self.start_session()
 
@@ -926,31 +1589,48 @@ class BackupManager:
             logger.warning(f"File does not exist: {file_path}")
             return None
 
+        key = str(Path(file_path).absolute())
+        if key in self.current_session.files:
+            return self.objects_dir / self.current_session.files[key]
+
         try:
-            # Create relative path structure in backup
-            if file_path.is_absolute():
-                # For absolute paths, create a safe relative structure
-                rel_path = (
-                    Path(*file_path.parts[1:])
-                    if len(file_path.parts) > 1
-                    else file_path.name
+            with open(file_path, "rb") as f:
+                blob_path, size = self._store_blob(
+                    iter(lambda: f.read(self.CHUNK_SIZE), b"")
                 )
-            else:
-                rel_path = file_path
+            self._record_backup(file_path, blob_path, size)
+            logger.debug(f"Backed up: {file_path} -> {blob_path}")
+            return blob_path
 
-            backup_path = self.current_session.directory / rel_path
-            backup_path.parent.mkdir(parents=True, exist_ok=True)
+        except Exception as e:
+            logger.error(f"Error backing up {file_path}: {e}")
+            return None
+
+    def backup_content(self, file_path: Path, content: bytes) -> Path | None:
+        """
+        Backup the original content of a file already read into memory
 
-            # Copy file
-            shutil.copy2(file_path, backup_path)
+        Used to back up lazily, right before a changed file is written.
+
+        Args:
+            file_path: Path of the file
+            content: Its current (original) bytes
 
-            # Update session info
-            self.current_session.files_backed_up.append(str(file_path))
-            self.current_session.total_size += file_path.stat().st_size
+        Returns:
+            Path of the blob holding the content, or None on error
+        """
+        if not self.current_session:
+            self.start_session()
 
-            logger.debug(f"Backed up: {file_path} -> {backup_path}")
-            return backup_path
+        key = str(Path(file_path).absolute())
+        if key in self.current_session.files:
+            return self.objects_dir / self.current_session.files[key]
 
+        try:
+            blob_path, size = self._store_content(content)
+            self._record_backup(file_path, blob_path, size)
+            logger.debug(f"Backed up: {file_path} -> {blob_path}")
+            return blob_path
         except Exception as e:
             logger.error(f"Error backing up {file_path}: {e}")
             return None
@@ -961,21 +1641,18 @@ class BackupManager:
         """Restore a file from backup"""
         try:
             if backup_path and backup_path.exists():
-                # Restore from specific backup path
-                shutil.copy2(backup_path, original_path)
+                # Restore from specific backup (blob or legacy copy)
+                self._copy_blob(backup_path, original_path)
                 logger.info(f"Restored {original_path} from {backup_path}")
                 return True
 
             # Try to find in current session
             if self.current_session:
-                rel_path = (
-                    Path(*original_path.parts[1:])
-                    if original_path.is_absolute()
-                    else original_path
+                blob = self.current_session.files.get(
+                    str(Path(original_path).absolute())
                 )
-                session_backup = self.current_session.directory / rel_path
-                if session_backup.exists():
-                    shutil.copy2(session_backup, original_path)
+                if blob:
+                    self._copy_blob(self.objects_dir / blob, original_path)
                     logger.info(f"Restored {original_path} from current session")
                     return True
 
@@ -987,35 +1664,35 @@ class BackupManager:
             return False
 
     def finalize_session(self) -> Path | None:
-        """Finalize current backup session"""
+        """
+        Finalize current backup session
+
+        Returns:
+            Path of the session manifest, or None if nothing was backed up
+        """
         if not self.current_session:
             logger.warning("No active backup session")
             return None
 
+        session = self.current_session
         try:
-            # Save session metadata
-            metadata_file = self.current_session.directory / "session_metadata.json"
-            with open(metadata_file, "w") as f:
-                json.dump(asdict(self.current_session), f, indent=2, default=str)
-
-            # Compress if requested
-            if self.compression:
-                archive_path = self._compress_session()
-                if archive_path:
-                    # Remove uncompressed directory
-                    shutil.rmtree(self.current_session.directory)
-                    self.current_session.compressed = True
-                    logger.info(f"Compressed backup session to {archive_path}")
-                    result = archive_path
-                else:
-                    result = self.current_session.directory
+            result = None
+            if session.files:
+                self._append_manifest(
+                    {
+                        "finalized": True,
+                        "files": len(session.files),
+                        "total_size": session.total_size,
+                    }
+                )
+                result = session.manifest
             else:
-                result = self.current_session.directory
+                logger.debug(f"Backup session {session.session_id} is empty")
 
             # Clean old sessions
             self._cleanup_old_sessions()
 
-            logger.info(f"Finalized backup session: {self.current_session.session_id}")
+            logger.info(f"Finalized backup session: {session.session_id}")
             self.current_session = None
             return result
 
@@ -1023,56 +1700,116 @@ class BackupManager:
             logger.error(f"Error finalizing backup session: {e}")
             return None
 
-    def _compress_session(self) -> Path | None:
-        """Compress current session directory"""
-        if not self.current_session:
-            return None
+    def _read_manifest(self, manifest: Path) -> dict[str, Any]:
+        """
+        Read a session manifest
 
-        try:
-            archive_path = self.backup_dir / f"{self.current_session.session_id}.tar.gz"
-            with tarfile.open(archive_path, "w:gz") as tar:
-                tar.add(
-                    self.current_session.directory,
-                    arcname=self.current_session.session_id,
-                )
-            return archive_path
-        except Exception as e:
-            logger.error(f"Error compressing session: {e}")
-            return None
+        Returns:
+            Header fields plus "files" (path -> blob), "total_size" and
+            "finalized"; a truncated last line is ignored
+        """
+        info = {"files": {}, "total_size": 0, "finalized": False}
+        with open(manifest, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                if "path" in record:
+                    info["files"].setdefault(record["path"], record["blob"])
+                    info["total_size"] += record.get("size", 0)
+                elif record.get("finalized"):
+                    info["finalized"] = True
+                else:
+                    info.update(record)
+        return info
+
+    def _session_items(self) -> list[Path]:
+        """Manifests, directories and archives of all sessions"""
+        sessions = []
+        for item in self.backup_dir.iterdir():
+            if not item.name.startswith("session_"):
+                continue
+            if item.is_dir() or item.suffix in [
+                self.MANIFEST_SUFFIX,
+                ".tar",
+                ".gz",
+            ]:
+                sessions.append(item)
+        return sessions
 
     def _cleanup_old_sessions(self) -> None:
         """Remove old backup sessions beyond keep_sessions limit"""
         try:
-            # Get all session directories and archives
-            sessions = []
-            for item in self.backup_dir.iterdir():
-                if item.is_dir() and item.name.startswith("session_"):
-                    sessions.append(item)
-                elif item.suffix in [".tar", ".gz"] and item.stem.startswith(
-                    "session_"
-                ):
-                    sessions.append(item)
-
             # Sort by modification time
+            sessions = self._session_items()
             sessions.sort(key=lambda x: x.stat().st_mtime, reverse=True)
 
             # Remove old sessions
+            removed = False
             for session in sessions[self.keep_sessions :]:
                 if session.is_dir():
                     shutil.rmtree(session)
                 else:
                     session.unlink()
+                removed = removed or session.suffix == self.MANIFEST_SUFFIX
                 logger.debug(f"Removed old backup: {session}")
 
+            if removed:
+                self._collect_garbage()
+
         except Exception as e:
             logger.error(f"Error cleaning up old sessions: {e}")
 
+    def _collect_garbage(self) -> None:
+        """
+        Delete blobs no remaining session refers to.
+
+        Temporary files and blobs written or reused within
+        BLOB_GRACE_SECONDS are kept: another process may be between storing
+        a blob and appending it to its session manifest.
+        """
+        if not self.objects_dir.exists():
+            return
+
+        referenced = set()
+        for manifest in self.backup_dir.glob(f"session_*{self.MANIFEST_SUFFIX}"):
+            referenced.update(self._read_manifest(manifest)["files"].values())
+        if self.current_session:
+            referenced.update(self.current_session.files.values())
+
+        cutoff = datetime.now().timestamp() - self.BLOB_GRACE_SECONDS
+        for blob in self.objects_dir.glob("*/*"):
+            if blob.name.startswith("tmp_"):
+                continue
+            if blob.relative_to(self.objects_dir).as_posix() in referenced:
+                continue
+            try:
+                if blob.stat().st_mtime > cutoff:
+                    continue
+                blob.unlink()
+            except FileNotFoundError:
+                continue
+            logger.debug(f"Removed unreferenced blob: {blob}")
+
     def list_sessions(self) -> list[dict[str, Any]]:
         """List all backup sessions"""
         sessions = []
 
-        for item in self.backup_dir.iterdir():
-            if item.is_dir() and item.name.startswith("session_"):
+        for item in self._session_items():
+            if item.suffix == self.MANIFEST_SUFFIX:
+                info = self._read_manifest(item)
+                sessions.append(
+                    {
+                        "session_id": item.name[: -len(self.MANIFEST_SUFFIX)],
+                        "timestamp": info.get("timestamp", ""),
+                        "manifest": str(item),
+                        "files_backed_up": sorted(info["files"]),
+                        "total_size": info["total_size"],
+                        "finalized": info["finalized"],
+                    }
+                )
+            elif item.is_dir():
                 # Try to load metadata
                 metadata_file = item / "session_metadata.json"
                 if metadata_file.exists():
@@ -1089,10 +1826,10 @@ class BackupManager:
                             ).isoformat(),
                         }
                     )
-            elif item.suffix in [".tar", ".gz"] and item.stem.startswith("session_"):
+            else:
                 sessions.append(
                     {
-                        "session_id": item.stem,
+                        "session_id": item.name.split(".")[0],
                         "archive": str(item),
                         "compressed": True,
                         "timestamp": datetime.fromtimestamp(
@@ -1105,6 +1842,159 @@ class BackupManager:
 
     def restore_session(self, session_id: str) -> bool:
         """Restore all files from a backup session"""
+        manifest = self._manifest_path(session_id)
+        if manifest.exists():
+            try:
+                files = self._read_manifest(manifest)["files"]
+                for file_path, blob in files.items():
+                    self._copy_blob(self.objects_dir / blob, Path(file_path))
+                    logger.info(f"Restored: {file_path}")
+                return True
+            except Exception as e:
+                logger.error(f"Error restoring session {session_id}: {e}")
+                return False
+
+        return self._restore_legacy_session(session_id)
+
+    def _match_session_paths(
+        self, session_files: list[str], file_paths: list[Path]
+    ) -> tuple[dict[str, str], list[Path]]:
+        """
+        Map requested paths to paths recorded in a session.
+
+        A request matches the recorded absolute path, or else the single
+        recorded path ending with it (e.g. "models/sale.py"). Requests going
+        up with ".." only match their normalized absolute path.
+
+        Returns:
+            Tuple of ({requested: recorded}, requested paths without a match)
+        """
+        recorded = set(session_files)
+        matches, missing = {}, []
+        for file_path in file_paths:
+            key = str(Path(file_path).absolute())
+            if key in recorded:
+                matches[str(file_path)] = key
+                continue
+            if ".." in Path(file_path).parts:
+                key = os.path.abspath(file_path)
+                if key in recorded:
+                    matches[str(file_path)] = key
+                else:
+                    missing.append(Path(file_path))
+                continue
+            suffix = "/" + Path(file_path).as_posix()
+            candidates = [p for p in recorded if Path(p).as_posix().endswith(suffix)]
+            if len(candidates) == 1:
+                matches[str(file_path)] = candidates[0]
+            else:
+                if candidates:
+                    logger.error(f"Ambiguous path {file_path}: {sorted(candidates)}")
+                missing.append(Path(file_path))
+        return matches, missing
+
+    def restore_files(
+        self,
+        session_id: str,
+        file_paths: list[Path],
+    ) -> list[Path]:
+        """
+        Restore selected files from a backup session.
+
+        Only the blobs of the requested files are read: the session manifest
+        indexes every file by path, so nothing else is decompressed.
+        Sessions from earlier versions are read as a stream and stop at
+        the last requested member.
+
+        Args:
+            session_id: Backup session ID
+            file_paths: Files to restore (absolute, relative to the current
+                directory, or a unique trailing part of the recorded path)
+
+        Returns:
+            Paths of the restored files
+        """
+        manifest = self._manifest_path(session_id)
+        if not manifest.exists():
+            return self._restore_legacy_files(session_id, file_paths)
+
+        try:
+            files = self._read_manifest(manifest)["files"]
+            matches, missing = self._match_session_paths(list(files), file_paths)
+            for file_path in missing:
+                logger.warning(f"{file_path} is not in session {session_id}")
+
+            restored = []
+            for recorded in matches.values():
+                self._copy_blob(self.objects_dir / files[recorded], Path(recorded))
+                logger.info(f"Restored: {recorded}")
+                restored.append(Path(recorded))
+            return restored
+
+        except Exception as e:
+            logger.error(f"Error restoring files from session {session_id}: {e}")
+            return []
+
+    def _restore_legacy_files(
+        self,
+        session_id: str,
+        file_paths: list[Path],
+    ) -> list[Path]:
+        """Restore selected files from a directory or .tar.gz session"""
+        session_path = self.backup_dir / session_id
+        archive_path = self.backup_dir / f"{session_id}.tar.gz"
+
+        def member_name(original: str) -> str:
+            path = Path(original)
+            rel_path = Path(*path.parts[1:]) if path.is_absolute() else path
+            return rel_path.as_posix()
+
+        try:
+            if session_path.is_dir():
+                metadata_file = session_path / "session_metadata.json"
+                metadata = json.loads(metadata_file.read_text())
+                matches, _ = self._match_session_paths(
+                    metadata.get("files_backed_up", []), file_paths
+                )
+                restored = []
+                for original in matches.values():
+                    backup = session_path / member_name(original)
+                    if backup.exists():
+                        Path(original).parent.mkdir(parents=True, exist_ok=True)
+                        shutil.copy2(backup, original)
+                        restored.append(Path(original))
+                return restored
+
+            if not archive_path.exists():
+                logger.error(f"Backup session not found: {session_id}")
+                return []
+
+            # gzip tar has no index: stream members in order, stop when done
+            wanted = {
+                member_name(str(Path(p).absolute())): Path(p).absolute()
+                for p in file_paths
+            }
+            restored = []
+            with tarfile.open(archive_path, "r|gz") as tar:
+                for member in tar:
+                    original = wanted.pop(member.name.split("/", 1)[-1], None)
+                    if original and member.isfile():
+                        original.parent.mkdir(parents=True, exist_ok=True)
+                        with tar.extractfile(member) as source, open(
+                            original, "wb"
+                        ) as target:
+                            shutil.copyfileobj(source, target, self.CHUNK_SIZE)
+                        restored.append(original)
+                    if not wanted:
+                        break
+            return restored
+
+        except Exception as e:
+            logger.error(f"Error restoring files from session {session_id}: {e}")
+            return []
+
+    def _restore_legacy_session(self, session_id: str) -> bool:
+        """Restore a session stored as a directory or .tar.gz archive"""
         try:
             session_path = self.backup_dir / session_id
             archive_path = self.backup_dir / f"{session_id}.tar.gz"
@@ -1154,11 +2044,17 @@ class BackupManager:
     def get_backup_for_file(
         self, file_path: Path, session_id: str | None = None
     ) -> Path | None:
-        """Get backup path for a specific file"""
+        """Get the blob (or legacy copy) holding the backup of a file"""
+        key = str(Path(file_path).absolute())
         if session_id:
+            manifest = self._manifest_path(session_id)
+            if manifest.exists():
+                blob = self._read_manifest(manifest)["files"].get(key)
+                return self.objects_dir / blob if blob else None
             session_path = self.backup_dir / session_id
         elif self.current_session:
-            session_path = self.current_session.directory
+            blob = self.current_session.files.get(key)
+            return self.objects_dir / blob if blob else None
         else:
             return None
 
@@ -0,0 +1,223 @@
+"""
+Persistent manifest of files already in canonical form.
+
+After a successful run, the hash of every file a transformation left (or
+made) canonical is recorded, together with a fingerprint of everything that
+can change the output: tool and formatter versions, configuration and the
+requested modes. On the next run, files whose content still hashes to the
+recorded value are skipped without being parsed or formatted.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = ".odoo-tools/cache"
+MANIFEST_VERSION = "1"  # Manifest file format; bump to discard older manifests
+MAX_FINGERPRINTS = 8  # Transform variants kept per manifest
+
+
+def find_repo_root(path: Path) -> Path:
+    """
+    Find the repository a path belongs to.
+
+    Args:
+        path: File or directory inside the repository
+
+    Returns:
+        Nearest ancestor containing .git, or the directory of path if none
+    """
+    start = path.resolve()
+    if not start.is_dir():
+        start = start.parent
+
+    for candidate in (start, *start.parents):
+        if (candidate / ".git").exists():
+            return candidate
+    return start
+
+
+def make_fingerprint(*parts: Any) -> str:
+    """Stable hash of JSON-serializable parts describing a transformation"""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def source_digest(root: Path, patterns: tuple[str, ...]) -> str:
+    """
+    Hash of the source files implementing a transformation.
+
+    Args:
+        root: Directory the patterns are relative to
+        patterns: Glob patterns of the implementation files
+
+    Returns:
+        Hash over the relative paths and contents of the matching files
+    """
+    digest = hashlib.sha256()
+    files = sorted({path for pattern in patterns for path in root.glob(pattern)})
+    for path in files:
+        digest.update(path.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def content_hash(content: str | bytes, encoding: str = "utf-8") -> str:
+    """Hash of file content as stored in the manifest"""
+    if isinstance(content, str):
+        content = content.encode(encoding)
+    return hashlib.sha256(content).hexdigest()
+
+
+class TransformManifest:
+    """Content hashes of files known to be canonical for one transformation"""
+
+    def __init__(
+        self,
+        root: Path,
+        fingerprint: str,
+        tool_version: str,
+        name: str = "reorder",
+        cache_dir: str = DEFAULT_CACHE_DIR,
+    ):
+        """
+        Initialize and load the manifest
+
+        Args:
+            root: Repository root; entries are stored relative to it
+            fingerprint: Fingerprint of the transformation (see make_fingerprint)
+            tool_version: Tool version; a manifest from another version is discarded
+            name: Manifest name (one file per name)
+            cache_dir: Cache directory, relative to root unless absolute
+        """
+        self.root = Path(root).resolve()
+        self.fingerprint = fingerprint
+        self.tool_version = tool_version
+        cache_path = Path(cache_dir)
+        if not cache_path.is_absolute():
+            cache_path = self.root / cache_path
+        self.path = cache_path / f"{name}_manifest.json"
+
+        self.skipped = 0
+        self._transforms: dict[str, dict[str, str]] = {}
+        self._dirty = False
+        self.load()
+
+    @property
+    def entries(self) -> dict[str, str]:
+        """Entries (relative path -> content hash) for this fingerprint"""
+        return self._transforms.setdefault(self.fingerprint, {})
+
+    def load(self) -> None:
+        """Load the manifest from disk, ignoring missing or stale files"""
+        self._transforms = {}
+        if not self.path.exists():
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable manifest {self.path}: {e}")
+            return
+
+        if data.get("tool_version") != self.tool_version:
+            logger.debug(f"Discarding manifest of version {data.get('tool_version')}")
+            return
+
+        self._transforms = data.get("transforms", {})
+
+    def save(self) -> None:
+        """Write the manifest atomically if it changed"""
+        if not self._dirty:
+            return
+
+        # Keep the current transformation last so it survives trimming
+        transforms = {
+            key: value
+            for key, value in self._transforms.items()
+            if key != self.fingerprint
+        }
+        transforms[self.fingerprint] = self.entries
+        transforms = dict(list(transforms.items())[-MAX_FINGERPRINTS:])
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            gitignore = self.path.parent / ".gitignore"
+            if not gitignore.exists():
+                gitignore.write_text("*\n", encoding="utf-8")
+
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps(
+                    {"tool_version": self.tool_version, "transforms": transforms},
+                    sort_keys=True,
+                ),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, self.path)
+            self._transforms = transforms
+            self._dirty = False
+            logger.debug(f"Saved manifest with {len(self.entries)} entries")
+        except OSError as e:
+            logger.warning(f"Could not save manifest {self.path}: {e}")
+
+    def _key(self, file_path: Path) -> str:
+        """Manifest key of a file: path relative to the root when possible"""
+        resolved = Path(file_path).resolve()
+        try:
+            return resolved.relative_to(self.root).as_posix()
+        except ValueError:
+            return resolved.as_posix()
+
+    def is_canonical(
+        self,
+        file_path: Path,
+        content: str | bytes,
+        encoding: str = "utf-8",
+    ) -> bool:
+        """
+        Check whether content is what the transformation left last time.
+
+        Args:
+            file_path: Path of the file
+            content: Current file content
+            encoding: Encoding used to hash text content
+
+        Returns:
+            True if the file can be skipped
+        """
+        recorded = self.entries.get(self._key(file_path))
+        if recorded is not None and recorded == content_hash(content, encoding):
+            self.skipped += 1
+            return True
+        return False
+
+    def is_canonical_file(self, file_path: Path, encoding: str = "utf-8") -> bool:
+        """Same as is_canonical(), reading the file content from disk"""
+        if self._key(file_path) not in self.entries:
+            return False
+        try:
+            # Read as text, like the transformations do, so hashes agree
+            content = Path(file_path).read_text(encoding=encoding)
+        except (OSError, UnicodeDecodeError):
+            return False
+        return self.is_canonical(file_path, content, encoding)
+
+    def record(self, file_path: Path, digest: str) -> None:
+        """Remember the content hash a file has after the transformation"""
+        key = self._key(file_path)
+        if self.entries.get(key) != digest:
+            self.entries[key] = digest
+            self._dirty = True
+
+    def forget(self, file_path: Path) -> None:
+        """Drop a file from the manifest (e.g. after a failed transformation)"""
+        if self.entries.pop(self._key(file_path), None) is not None:
+            self._dirty = True
@@ -0,0 +1,87 @@
+"""
+Single-scan field/method renaming for XML files.
+
+All reference forms the rename command rewrites (name/ref/action attributes,
+button names and ``.method(`` calls in evaluated expressions) are matched by
+one compiled pattern whose captured names are looked up in the rename dicts,
+so the text is scanned once whatever the number of renames, and the hits of
+every rename are counted during the same pass. Replacements are simultaneous:
+renames chained in the CSV (a -> b, b -> c) do not cascade.
+"""
+
+import logging
+import re
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_PATTERN = re.compile(
+    r"(?P<attr>name|ref|action)=(?P<quote>[\"'])(?P<value>[^\"'\n]*)(?P=quote)"
+    r"|\.(?P<call>\w+)(?=\()"
+)
+
+
+class XMLRenameEngine:
+    """Applies many field and method renames to XML content in one scan"""
+
+    def __init__(
+        self,
+        field_changes: dict[str, str],
+        method_changes: dict[str, str],
+    ):
+        """
+        Compile the renames.
+
+        Args:
+            field_changes: Dict mapping old field names to new names
+            method_changes: Dict mapping old method names to new names
+        """
+        self.field_changes = field_changes
+        self.method_changes = method_changes
+
+    def apply(self, content: str) -> tuple[str, Counter, Counter]:
+        """
+        Rename field and method references.
+
+        Fields are renamed in name="..." and ref="..." attributes, methods in
+        <button name="...">, action="..." and ``.method(`` calls. A name that
+        is both a field and a method rename is treated as a field.
+
+        Args:
+            content: XML content to modify
+
+        Returns:
+            Tuple of (modified_content, field hits, method hits) where hits
+            count the replacements per old name
+        """
+        field_hits = Counter()
+        method_hits = Counter()
+        if not self.field_changes and not self.method_changes:
+            return content, field_hits, method_hits
+
+        fields = self.field_changes
+        methods = self.method_changes
+
+        def replace(match: re.Match) -> str:
+            call = match.group("call")
+            if call is not None:
+                if call in methods:
+                    method_hits[call] += 1
+                    return f".{methods[call]}"
+                return match.group()
+
+            attr, quote, value = match.group("attr", "quote", "value")
+            if attr != "action" and value in fields:
+                field_hits[value] += 1
+                new_name = fields[value]
+            elif value in methods and (
+                attr == "action"
+                or (attr == "name" and content.endswith("<button ", 0, match.start()))
+            ):
+                method_hits[value] += 1
+                new_name = methods[value]
+            else:
+                return match.group()
+            return f"{attr}={quote}{new_name}{quote}"
+
+        return REFERENCE_PATTERN.sub(replace, content), field_hits, method_hits
@@ -13,6 +13,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from commands.detect import DetectCommand
 from commands.rename import RenameCommand
 from core.config import Config
+from core.git_manager import GitManager
 from core.order import Order
 from core.path_analyzer import BackupManager, ProcessingStatus, path_analyzer
 from odoo_tools import __version__
@@ -70,6 +71,9 @@ def cli(
     else:
         ctx.obj["config"] = Config.load_hierarchy(Path.cwd())
 
+    # Directories skipped when scanning paths
+    path_analyzer.with_ignore(ctx.obj["config"])
+
     # Apply CLI flags
     if verbose:
         ctx.obj["config"].verbose = True
@@ -80,12 +84,41 @@ def cli(
         logging.getLogger().setLevel(logging.WARNING)
 
 
+def get_changed_files(
+    path: Path,
+    changed_since: str | None,
+    staged: bool,
+) -> list[Path] | None:
+    """Files changed in Git under path, or None when no Git filter was given"""
+    if not changed_since and not staged:
+        return None
+
+    try:
+        git_manager = GitManager(str(path if path.is_dir() else path.parent))
+        return git_manager.get_changed_files(
+            since=changed_since, staged=staged, paths=[str(path.resolve())]
+        )
+    except ValueError as e:
+        click.echo(f"❌ {e}", err=True)
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument(
     "path",
     type=click.Path(exists=True),
 )
-def analyze(path: str):
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Only consider files changed since a Git reference",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Only consider files staged in Git",
+)
+def analyze(path: str, changed_since: str | None, staged: bool):
     """Analyze a path to determine its type and recommended processing.
 
     This command inspects a file or directory to determine:
@@ -96,9 +129,11 @@ def analyze(path: str):
     Examples:
         odoo-tools analyze ./my_module
         odoo-tools analyze ./src/models.py
+        odoo-tools analyze ./addons --changed-since origin/main
     """
     analyzer = path_analyzer
-    analysis = analyzer.analyze(Path(path))
+    changed_files = get_changed_files(Path(path), changed_since, staged)
+    analysis = analyzer.analyze(Path(path), files=changed_files)
 
     # Display analysis results
     click.echo(f"\nPath Analysis: {path}")
@@ -178,6 +213,28 @@ def analyze(path: str):
     is_flag=True,
     help="Skip confirmation prompts",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    type=click.IntRange(min=0),
+    default=None,
+    help="Worker processes for reordering (0 = one per CPU, default from config)",
+)
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Reprocess files already reordered by a previous run",
+)
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Only consider files changed since a Git reference",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Only consider files staged in Git",
+)
 @click.pass_context
 def reorder(
     ctx,
@@ -187,6 +244,10 @@ def reorder(
     dry_run: bool,
     no_backup: bool,
     force: bool,
+    jobs: int | None,
+    no_cache: bool,
+    changed_since: str | None,
+    staged: bool,
 ):
     """Smart reordering command for Python and XML files
 
@@ -209,16 +270,27 @@ def reorder(
         odoo-tools reorder ./models.py python_fields # Fields only
         odoo-tools reorder ./views xml          # Reorder XML structure and attributes
         odoo-tools reorder ./views xml_structure # Structure only
+        odoo-tools reorder ./addons all -j 8     # Use 8 worker processes
+        odoo-tools reorder ./addons --staged -f  # Staged files only (pre-commit)
     """
     config = ctx.obj["config"]
     config.dry_run = dry_run
     config.backup.enabled = not no_backup
+    if jobs is not None:
+        config.ordering.max_workers = jobs
+    if no_cache:
+        config.ordering.incremental = False
 
     path_obj = Path(path)
 
     # Always analyze the path to avoid redundant checks
     analyzer = path_analyzer
-    analysis = analyzer.analyze(path_obj)
+    changed_files = get_changed_files(path_obj, changed_since, staged)
+    analysis = analyzer.analyze(path_obj, files=changed_files)
+
+    if changed_files is not None and not (analysis.python_files or analysis.xml_files):
+        click.echo("No changed Python or XML files to reorder.")
+        sys.exit(0)
 
     # If target is auto, use path_analyzer's recommendations
     if target == "auto":
@@ -274,13 +346,15 @@ def reorder(
             backup_dir=config.backup.directory,
             compression=config.backup.compression,
             keep_sessions=config.backup.keep_sessions,
+            compression_level=config.backup.compression_level,
+            compression_threads=config.backup.compression_threads,
         )
         # Start backup session
         session_type = f"reorder_{target}"
         backup_manager.start_session(session_type)
 
     # Execute the reordering using Order directly
-    ordering = Order(config)
+    ordering = Order.shared(config)
     options = {}
 
     click.echo(f"\n🔧 Processing with target: {target}")
@@ -427,6 +501,16 @@ def detect(
     "-m",
     help="Process only specific module",
 )
+@click.option(
+    "--changed-since",
+    metavar="REF",
+    help="Only consider files changed since a Git reference",
+)
+@click.option(
+    "--staged",
+    is_flag=True,
+    help="Only consider files staged in Git",
+)
 @click.pass_context
 def rename(
     ctx,
@@ -436,6 +520,8 @@ def rename(
     dry_run: bool,
     no_backup: bool,
     module: str | None,
+    changed_since: str | None,
+    staged: bool,
 ):
     """Apply field/method name changes from CSV
 
@@ -451,8 +537,14 @@ def rename(
     if module:
         config.modules = [module]
 
+    # Restrict to files changed in Git when requested
+    path_info = None
+    changed_files = get_changed_files(Path(repo), changed_since, staged)
+    if changed_files is not None:
+        path_info = path_analyzer.analyze(Path(repo), files=changed_files)
+
     command = RenameCommand(config)
-    result = command.execute(Path(csv_file))
+    result = command.execute(Path(csv_file), path_info)
 
     sys.exit(0 if result.status == ProcessingStatus.SUCCESS else 1)
 
@@ -488,6 +580,13 @@ def init(ctx):
     "--restore",
     help="Restore from backup session ID",
 )
+@click.option(
+    "--file",
+    "files",
+    multiple=True,
+    type=click.Path(),
+    help="With --restore, restore only this file (repeatable)",
+)
 @click.option(
     "--clean",
     is_flag=True,
@@ -498,11 +597,17 @@ def backup(
     ctx,
     sessions: bool,
     restore: str | None,
+    files: tuple[str, ...],
     clean: bool,
 ):
     """Manage backup sessions
 
     View, restore, or clean backup sessions created during tool operations.
+
+    Examples:
+        odoo-tools backup --sessions
+        odoo-tools backup --restore <session-id>
+        odoo-tools backup --restore <session-id> --file models/sale.py
     """
     config = ctx.obj["config"]
 
@@ -510,6 +615,8 @@ def backup(
         backup_dir=config.backup.directory,
         compression=config.backup.compression,
         keep_sessions=config.backup.keep_sessions,
+        compression_level=config.backup.compression_level,
+        compression_threads=config.backup.compression_threads,
     )
 
     if sessions:
@@ -524,6 +631,18 @@ def backup(
                 if "files_backed_up" in session:
                     click.echo(f"    Files: {len(session['files_backed_up'])}")
 
+    elif restore and files:
+        # Restore only the requested files, reading just their blobs
+        restored = manager.restore_files(restore, [Path(f) for f in files])
+        for file_path in restored:
+            click.echo(f"Restored: {file_path}")
+        if len(restored) != len(files):
+            click.echo(
+                f"Restored {len(restored)} of {len(files)} files from {restore}",
+                err=True,
+            )
+            sys.exit(1)
+
     elif restore:
         # Restore specific session
         click.confirm(f"Restore all files from session {restore}?", abort=True)
@@ -0,0 +1,351 @@
+"""
+Unit tests for content-addressed backup sessions
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from core.path_analyzer import BackupManager, PathAnalyzer, ProcessingStatus
+
+
+@pytest.fixture
+def manager(temp_dir) -> BackupManager:
+    return BackupManager(backup_dir=str(temp_dir / ".backups"), compression=True)
+
+
+def blobs(manager: BackupManager) -> list[Path]:
+    return sorted(manager.objects_dir.glob("*/*"))
+
+
+def backdate_blobs(manager: BackupManager) -> None:
+    """Age all blobs past the garbage collection grace period"""
+    for blob in blobs(manager):
+        mtime = blob.stat().st_mtime - manager.BLOB_GRACE_SECONDS - 1
+        os.utime(blob, (mtime, mtime))
+
+
+class TestBackupStore:
+    """Test the blob store and session manifests"""
+
+    def test_backup_and_restore_session(self, manager, temp_dir):
+        """Test that a session restores the exact original bytes"""
+        file_path = temp_dir / "model.py"
+        file_path.write_bytes(b"x = 1\r\n")
+
+        manager.start_session("test")
+        blob = manager.backup_file(file_path)
+        manifest = manager.finalize_session()
+
+        assert blob.suffix == ".gz"
+        assert manager.read_blob(blob) == b"x = 1\r\n"
+        assert manifest.exists()
+
+        file_path.write_text("changed")
+        (session,) = manager.list_sessions()
+        assert session["finalized"]
+        assert manager.restore_session(session["session_id"])
+        assert file_path.read_bytes() == b"x = 1\r\n"
+
+    def test_identical_content_is_stored_once(self, manager, temp_dir):
+        """Test deduplication across files and sessions"""
+        for name in ["a.py", "b.py"]:
+            (temp_dir / name).write_text("same")
+
+        for _ in range(2):
+            manager.start_session()
+            manager.backup_file(temp_dir / "a.py")
+            manager.backup_file(temp_dir / "b.py")
+            manager.finalize_session()
+
+        assert len(blobs(manager)) == 1
+        assert len(manager.list_sessions()) == 2
+
+    def test_first_backup_of_a_file_wins(self, manager, temp_dir):
+        """Test that a file changed twice restores its original content"""
+        file_path = temp_dir / "a.py"
+        file_path.write_text("original")
+        manager.start_session()
+        manager.backup_file(file_path)
+        file_path.write_text("intermediate")
+        manager.backup_file(file_path)
+
+        file_path.write_text("final")
+        assert manager.restore_file(file_path)
+        assert file_path.read_text() == "original"
+
+    def test_empty_session_writes_nothing(self, manager):
+        """Test that a session without backups leaves no manifest"""
+        manager.start_session("noop")
+
+        assert manager.finalize_session() is None
+        assert manager.list_sessions() == []
+        assert not manager.objects_dir.exists()
+
+    def test_unfinalized_session_can_be_restored(self, manager, temp_dir):
+        """Test that manifest lines are written as files are backed up"""
+        file_path = temp_dir / "a.py"
+        file_path.write_text("original")
+        manager.start_session("crash")
+        manager.backup_file(file_path)
+        file_path.write_text("changed")
+
+        other = BackupManager(backup_dir=str(manager.backup_dir))
+        (session,) = other.list_sessions()
+        assert not session["finalized"]
+        assert other.restore_session(session["session_id"])
+        assert file_path.read_text() == "original"
+
+    def test_old_sessions_release_their_blobs(self, temp_dir):
+        """Test that cleanup deletes blobs only removed sessions used"""
+        manager = BackupManager(backup_dir=str(temp_dir / ".backups"), keep_sessions=1)
+        file_path = temp_dir / "a.py"
+        for content in ["first", "second"]:
+            file_path.write_text(content)
+            manager.start_session(content)
+            manager.backup_file(file_path)
+            manager.finalize_session()
+            backdate_blobs(manager)
+        manager._cleanup_old_sessions()
+
+        (session,) = manager.list_sessions()
+        assert "second" in session["session_id"]
+        assert [manager.read_blob(blob) for blob in blobs(manager)] == [b"second"]
+
+    def test_recent_unreferenced_blobs_are_kept(self, manager, temp_dir):
+        """Test that GC spares blobs a concurrent session may not have recorded"""
+        file_path = temp_dir / "a.py"
+        file_path.write_text("shared")
+        manager.start_session("reused")
+        manager.backup_file(file_path)
+        manager.finalize_session()
+        backdate_blobs(manager)
+
+        recent, _ = manager._store_content(b"not recorded yet")
+        reused, _ = manager._store_content(b"shared")
+        for manifest in manager.backup_dir.glob("session_*.jsonl"):
+            manifest.unlink()
+        tmp_file = manager.objects_dir / "ab" / "tmp_partial"
+        tmp_file.parent.mkdir(exist_ok=True)
+        tmp_file.write_bytes(b"")
+        os.utime(tmp_file, (0, 0))
+        manager._collect_garbage()
+
+        assert recent.exists() and reused.exists() and tmp_file.exists()
+
+        backdate_blobs(manager)
+        manager._collect_garbage()
+
+        assert blobs(manager) == [tmp_file]
+
+
+class TestLazyBackup:
+    """Test that PathAnalyzer backs up only files it changes"""
+
+    def test_only_changed_files_are_backed_up(self, temp_dir):
+        """Test that unchanged files cost no backup"""
+        analyzer = PathAnalyzer()
+        analyzer._backup_manager = BackupManager(backup_dir=str(temp_dir / ".backups"))
+        changed = temp_dir / "changed.txt"
+        changed.write_text("lower")
+        unchanged = temp_dir / "unchanged.txt"
+        unchanged.write_text("UPPER")
+
+        results = analyzer.process_files(
+            [changed, unchanged], str.upper, session_description="lazy"
+        )
+
+        assert [r.status for r in results] == [
+            ProcessingStatus.SUCCESS,
+            ProcessingStatus.NO_CHANGES,
+        ]
+        (session,) = analyzer._backup_manager.list_sessions()
+        assert session["files_backed_up"] == [str(changed.absolute())]
+        assert len(blobs(analyzer._backup_manager)) == 1
+
+    def test_failed_backup_leaves_file_unchanged(self, temp_dir, monkeypatch):
+        """Test that a file is not written when its backup fails"""
+        analyzer = PathAnalyzer()
+        analyzer._backup_manager = BackupManager(backup_dir=str(temp_dir / ".backups"))
+        monkeypatch.setattr(
+            analyzer._backup_manager, "backup_content", lambda *args: None
+        )
+        file_path = temp_dir / "a.txt"
+        file_path.write_text("lower")
+
+        (result,) = analyzer.process_files([file_path], str.upper)
+
+        assert result.status == ProcessingStatus.ERROR
+        assert file_path.read_text() == "lower"
+
+
+class TestBackupCompression:
+    """Test the configurable blob codecs"""
+
+    @pytest.mark.parametrize("compression,suffix", [("none", ""), ("gzip", ".gz")])
+    def test_codecs(self, temp_dir, compression, suffix):
+        """Test that blobs are written with the configured codec"""
+        manager = BackupManager(
+            backup_dir=str(temp_dir / ".backups"), compression=compression
+        )
+        file_path = temp_dir / "a.py"
+        file_path.write_text("content")
+
+        manager.start_session()
+        blob = manager.backup_file(file_path)
+
+        assert blob.suffix == suffix
+        assert manager.read_blob(blob) == b"content"
+
+    def test_zstd_falls_back_to_gzip(self, temp_dir, monkeypatch):
+        """Test the stdlib fallback when zstandard is not installed"""
+        import core.path_analyzer as path_analyzer_module
+
+        monkeypatch.setattr(path_analyzer_module, "zstandard", None)
+        manager = BackupManager(
+            backup_dir=str(temp_dir / ".backups"), compression="zstd"
+        )
+
+        assert manager.compression == "gzip"
+
+    def test_zstd_level_dropped_on_gzip_fallback(self, temp_dir, monkeypatch):
+        """Test that a zstd-only level is not passed to gzip"""
+        import core.path_analyzer as path_analyzer_module
+
+        monkeypatch.setattr(path_analyzer_module, "zstandard", None)
+        manager = BackupManager(
+            backup_dir=str(temp_dir / ".backups"),
+            compression="zstd",
+            compression_level=19,
+        )
+        file_path = temp_dir / "a.py"
+        file_path.write_text("content")
+        manager.start_session()
+
+        assert manager.compression_level is None
+        assert manager.backup_content(file_path, b"content").suffix == ".gz"
+
+    def test_zstd(self, temp_dir):
+        """Test zstd blobs when zstandard is available"""
+        pytest.importorskip("zstandard")
+        manager = BackupManager(
+            backup_dir=str(temp_dir / ".backups"),
+            compression="zstd",
+            compression_level=10,
+            compression_threads=2,
+        )
+        file_path = temp_dir / "a.py"
+        file_path.write_text("content" * 1000)
+
+        manager.start_session()
+        blob = manager.backup_file(file_path)
+
+        assert blob.suffix == ".zst"
+        assert manager.read_blob(blob) == b"content" * 1000
+
+    def test_mixed_codecs_restore(self, temp_dir):
+        """Test that a session reads blobs of any codec"""
+        backup_dir = str(temp_dir / ".backups")
+        file_a = temp_dir / "a.py"
+        file_b = temp_dir / "b.py"
+        file_a.write_text("a")
+        file_b.write_text("b")
+
+        raw = BackupManager(backup_dir=backup_dir, compression="none")
+        raw.start_session()
+        raw.backup_file(file_a)
+        gz = BackupManager(backup_dir=backup_dir, compression="gzip")
+        gz.current_session = raw.current_session
+        gz.backup_file(file_b)
+        gz.finalize_session()
+
+        file_a.write_text("changed")
+        file_b.write_text("changed")
+        (session,) = gz.list_sessions()
+        assert BackupManager(backup_dir=backup_dir).restore_session(
+            session["session_id"]
+        )
+        assert (file_a.read_text(), file_b.read_text()) == ("a", "b")
+
+    def test_unknown_codec(self, temp_dir):
+        """Test that unknown codecs are rejected"""
+        with pytest.raises(ValueError):
+            BackupManager(backup_dir=str(temp_dir / ".backups"), compression="rar")
+
+
+class TestSelectiveRestore:
+    """Test restoring single files from a session"""
+
+    @pytest.fixture
+    def session(self, manager, temp_dir) -> str:
+        for module in ["sale", "stock"]:
+            file_path = temp_dir / module / "models" / "model.py"
+            file_path.parent.mkdir(parents=True)
+            file_path.write_text(f"{module} original")
+        (temp_dir / "sale" / "models" / "order.py").write_text("order original")
+
+        manager.start_session("selective")
+        for file_path in sorted(temp_dir.glob("*/models/*.py")):
+            manager.backup_file(file_path)
+            file_path.write_text("changed")
+        manager.finalize_session()
+        return manager.list_sessions()[0]["session_id"]
+
+    def test_restores_only_requested_file(self, manager, temp_dir, session):
+        """Test that other files of the session are left alone"""
+        target = temp_dir / "sale" / "models" / "model.py"
+
+        restored = manager.restore_files(session, [target])
+
+        assert restored == [target.absolute()]
+        assert target.read_text() == "sale original"
+        assert (temp_dir / "stock" / "models" / "model.py").read_text() == "changed"
+
+    def test_unique_suffix_and_ambiguity(self, manager, temp_dir, session):
+        """Test matching by a trailing part of the recorded path"""
+        assert manager.restore_files(session, [Path("models/order.py")]) == [
+            (temp_dir / "sale" / "models" / "order.py").absolute()
+        ]
+        assert manager.restore_files(session, [Path("models/model.py")]) == []
+
+    def test_dotted_relative_paths(self, manager, temp_dir):
+        """Test hidden directories and ".." in requested paths"""
+        hidden = temp_dir / ".github" / "setup.py"
+        hidden.parent.mkdir()
+        hidden.write_text("original")
+        manager.start_session("dotted")
+        manager.backup_file(hidden)
+        hidden.write_text("changed")
+        manager.finalize_session()
+        session = manager.list_sessions()[0]["session_id"]
+
+        assert manager.restore_files(session, [Path(".github/setup.py")]) == [
+            hidden.absolute()
+        ]
+        assert manager.restore_files(session, [Path("./.github/setup.py")]) == [
+            hidden.absolute()
+        ]
+        assert manager.restore_files(session, [Path("../github/setup.py")]) == []
+        assert hidden.read_text() == "original"
+
+    def test_legacy_archive(self, temp_dir):
+        """Test selective restore from a .tar.gz session of earlier versions"""
+        import tarfile
+
+        backup_dir = temp_dir / ".backups"
+        session_dir = backup_dir / "session_20240101_000000"
+        target = temp_dir / "a.py"
+        copy = session_dir / Path(*target.absolute().parts[1:])
+        copy.parent.mkdir(parents=True)
+        copy.write_text("original")
+        with tarfile.open(backup_dir / f"{session_dir.name}.tar.gz", "w:gz") as tar:
+            tar.add(session_dir, arcname=session_dir.name)
+        shutil.rmtree(session_dir)
+        target.write_text("changed")
+
+        manager = BackupManager(backup_dir=str(backup_dir))
+        restored = manager.restore_files(session_dir.name, [target])
+
+        assert restored == [target.absolute()]
+        assert target.read_text() == "original"
@@ -0,0 +1,190 @@
+"""
+Unit tests for the compiled classification rule dispatch
+"""
+
+import itertools
+
+from core.classification_rule_field import (
+    ClassificationRuleField,
+    CompiledFieldRules,
+    get_compiled_field_rules,
+    get_default_field_rules,
+)
+from core.classification_rule_method import (
+    ClassificationRuleMethod,
+    CompiledMethodRules,
+    get_compiled_method_rules,
+    get_default_method_rules,
+)
+from core.config import Config
+from core.order import Order
+
+METHOD_NAMES = [
+    "create",
+    "write",
+    "name_search",
+    "action_confirm",
+    "action_open_wizard",
+    "action_add_from_catalog",
+    "_compute_amount",
+    "_compute_balance_total",
+    "_inverse_name",
+    "_search_partner",
+    "_onchange_partner_id",
+    "_check_access_rights",
+    "_check_dates",
+    "_prepare_invoice",
+    "_prepare_portal_layout",
+    "_get_report_values",
+    "_get_default_journal",
+    "get_lines",
+    "_product_catalog_helper",
+    "_send_notify_mail",
+    "do_transfer",
+    "is_valid",
+    "_message_post_hook",
+    "button_validate",
+    "_private_helper",
+    "public_helper",
+]
+
+DECORATOR_LISTS = [
+    [],
+    ["@depends"],
+    ["@model"],
+    ["@model_create_multi"],
+    ["@onchange", "@depends_context"],
+    ["@constrains"],
+    ["@ondelete"],
+    ["@autovacuum"],
+]
+
+FIELD_NAMES = [
+    "name",
+    "ean13",
+    "default_code",
+    "state",
+    "is_active",
+    "parent_id",
+    "child_ids",
+    "total_weight",
+    "amount_total",
+    "date_order",
+    "create_date",
+    "note",
+    "html_description",
+    "company_id",
+    "user_id",
+    "currency_id",
+    "line_ids",
+    "report_file",
+    "_technical_flag",
+    "debug_info",
+    "Reference_Code",
+    "sequence",
+]
+
+FIELD_INFOS = [
+    {},
+    {"field_type": "Char"},
+    {"field_type": "Many2one"},
+    {"field_type": "Monetary"},
+    {"field_type": "Date"},
+    {"field_type": "Html"},
+    {"field_type": "Binary"},
+    {"field_type": "Float", "is_computed": True},
+    {"field_type": "Char", "is_related": True},
+]
+
+
+def linear_method_category(rules, name, decorators):
+    for rule in rules:
+        if rule.matches(name, decorators):
+            return rule.category
+    return None
+
+
+def linear_field_category(rules, name, info):
+    for rule in rules:
+        if rule.matches(name, info):
+            return rule.category
+    return None
+
+
+class TestCompiledMethodRules:
+    """Test that the method dispatch matches the linear rule scan"""
+
+    def test_matches_linear_scan(self):
+        """Test every name and decorator combination against the rule scan"""
+        rules = get_default_method_rules()
+        compiled = CompiledMethodRules(rules)
+
+        for name, decorators in itertools.product(METHOD_NAMES, DECORATOR_LISTS):
+            assert compiled.classify(name, decorators) == linear_method_category(
+                rules, name, decorators
+            ), (name, decorators)
+
+    def test_failed_custom_check_falls_through(self):
+        """Test that a decorated rule rejected by its check does not match"""
+        compiled = get_compiled_method_rules()
+
+        assert compiled.classify("create", ["@model"]) == "CRUD"
+        assert compiled.classify("_default_stage", ["@model"]) == "API_MODEL"
+
+    def test_compiled_once(self):
+        """Test that the default dispatch is built once per process"""
+        assert get_compiled_method_rules() is get_compiled_method_rules()
+
+
+class TestCompiledFieldRules:
+    """Test that the field dispatch matches the linear rule scan"""
+
+    def test_matches_linear_scan(self):
+        """Test every name and field info combination against the rule scan"""
+        rules = get_default_field_rules()
+        compiled = CompiledFieldRules(rules)
+
+        for name, info in itertools.product(FIELD_NAMES, FIELD_INFOS):
+            info = {"field_name": name, **info}
+            assert compiled.classify(name, info) == linear_field_category(
+                rules, name, info
+            ), (name, info)
+
+    def test_compiled_once(self):
+        """Test that the default dispatch is built once per process"""
+        assert get_compiled_field_rules() is get_compiled_field_rules()
+
+
+class TestOrderRules:
+    """Test rule sharing between Order instances"""
+
+    def test_orders_share_compiled_rules(self):
+        """Test that new Order instances do not rebuild the rules"""
+        first, second = Order(Config()), Order(Config())
+
+        assert first._method_dispatch is second._method_dispatch
+        assert first._field_dispatch is second._field_dispatch
+
+    def test_added_rule_stays_local(self):
+        """Test that a custom rule does not leak into the shared dispatch"""
+        order = Order(Config())
+        order.add_method_classification_rule(
+            ClassificationRuleMethod(
+                category="CUSTOM", priority=0, prefixes={"_custom_"}
+            )
+        )
+        order.add_field_classification_rule(
+            ClassificationRuleField(category="CUSTOM", priority=0, suffixes={"_x"})
+        )
+
+        assert order._method_dispatch.classify("_custom_run", []) == "CUSTOM"
+        assert order._field_dispatch.classify("foo_x", {}) == "CUSTOM"
+        assert get_compiled_method_rules().classify("_custom_run", []) == "PRIVATE"
+        assert Order(Config())._field_dispatch.classify("foo_x", {}) != "CUSTOM"
+
+    def test_shared_reuses_instance_per_config(self):
+        """Test that shared() builds one Order per configuration"""
+        config = Config()
+
+        assert Order.shared(config) is Order.shared(config)
+        assert Order.shared(Config()) is not Order.shared(config)
@@ -46,6 +46,7 @@ class TestConfig:
         assert config.black_line_length == 88
         assert config.magic_trailing_comma is True
         assert config.preserve_comments is True
+        assert config.max_workers == 1
 
     def test_detection_config_defaults(self):
         """Test detection configuration defaults"""
@@ -72,8 +73,15 @@ class TestConfig:
 
         assert config.enabled is True
         assert config.directory == ".backups"
-        assert config.compression is True
+        assert config.compression == "gzip"
         assert config.keep_sessions == 10
+        assert config.compression_level is None
+        assert config.compression_threads == 0
+
+    def test_backup_config_legacy_compression_flag(self):
+        """Test that boolean compression settings still load"""
+        assert BackupConfig(compression=True).compression == "gzip"
+        assert BackupConfig(compression=False).compression == "none"
 
     def test_load_from_yaml(self, tmp_path):
         """Test loading configuration from YAML file"""
@@ -176,6 +184,18 @@ class TestConfig:
         errors = config.validate()
         assert any("Invalid file type: invalid_type" in e for e in errors)
 
+        # Invalid worker count
+        config.ordering.max_workers = -1
+        errors = config.validate()
+        assert any("max_workers" in e for e in errors)
+
+        # Compression level outside the codec range
+        config.backup.compression = "gzip"
+        config.backup.compression_level = 19
+        assert any("gzip compression level" in e for e in config.validate())
+        config.backup.compression = "zstd"
+        assert not any("compression level" in e for e in config.validate())
+
     def test_save_config(self, tmp_path):
         """Test saving configuration to file"""
         config = Config()
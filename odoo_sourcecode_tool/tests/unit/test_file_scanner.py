@@ -0,0 +1,150 @@
+"""
+Unit tests for the pruned directory scanner
+"""
+
+from pathlib import Path
+
+import pytest
+from core.file_scanner import FileScanner, GitignoreRules
+from core.path_analyzer import PathAnalyzer, PathType
+
+
+def touch(path: Path, content: str = "") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+@pytest.fixture
+def tree(temp_dir) -> Path:
+    """Two modules with directories that must be pruned"""
+    for module in ["sale_ext", "stock_ext"]:
+        touch(temp_dir / module / "__manifest__.py", "{}")
+        touch(temp_dir / module / "models" / "model.py")
+        touch(temp_dir / module / "views" / "views.xml", "<odoo/>")
+        touch(temp_dir / module / "static" / "lib" / "vendor.js")
+        touch(temp_dir / module / "static" / "src" / "app.js")
+        touch(temp_dir / module / "__pycache__" / "model.cpython-311.pyc")
+    touch(temp_dir / "node_modules" / "pkg" / "index.js")
+    touch(temp_dir / "README.md")
+    return temp_dir
+
+
+class TestFileScanner:
+    """Test scanning, pruning and module detection"""
+
+    def test_prunes_ignored_dirs(self, tree):
+        """Test that default ignore names and paths are not descended into"""
+        scan = FileScanner().scan(tree)
+        relative = sorted(p.relative_to(tree).as_posix() for p in scan.files)
+
+        assert relative == [
+            "README.md",
+            "sale_ext/__manifest__.py",
+            "sale_ext/models/model.py",
+            "sale_ext/static/src/app.js",
+            "sale_ext/views/views.xml",
+            "stock_ext/__manifest__.py",
+            "stock_ext/models/model.py",
+            "stock_ext/static/src/app.js",
+            "stock_ext/views/views.xml",
+        ]
+        assert scan.pruned == 5
+
+    def test_custom_ignore_dirs(self, tree):
+        """Test that the ignore list is configurable"""
+        scan = FileScanner(ignore_dirs=["static"], respect_gitignore=False).scan(tree)
+        names = {p.name for p in scan.files}
+
+        assert "app.js" not in names and "vendor.js" not in names
+        assert "index.js" in names
+        assert "model.cpython-311.pyc" in names
+
+    def test_detects_modules(self, tree):
+        """Test that modules are detected from the listings of the walk"""
+        scan = FileScanner().scan(tree)
+
+        assert sorted(scan.modules) == [tree / "sale_ext", tree / "stock_ext"]
+        layout = scan.modules[tree / "sale_ext"]
+        assert layout.has_manifest and layout.has_models and layout.has_views
+        assert not layout.has_security
+
+    def test_gitignore(self, tree):
+        """Test .gitignore rules, including nested files and negation"""
+        (tree / ".git").mkdir()
+        touch(tree / ".gitignore", "*.md\n/stock_ext/static/\n")
+        touch(tree / "sale_ext" / ".gitignore", "views/*.xml\n!views/keep.xml\n")
+        touch(tree / "sale_ext" / "views" / "keep.xml", "<odoo/>")
+
+        scan = FileScanner().scan(tree)
+        relative = {p.relative_to(tree).as_posix() for p in scan.files}
+
+        assert "README.md" not in relative
+        assert "stock_ext/static/src/app.js" not in relative
+        assert "sale_ext/static/src/app.js" in relative
+        assert "sale_ext/views/views.xml" not in relative
+        assert "sale_ext/views/keep.xml" in relative
+
+        # Rules of parent directories apply when scanning a subdirectory
+        sub_scan = FileScanner().scan(tree / "stock_ext")
+        assert not any("static" in p.parts for p in sub_scan.files)
+
+        assert len(FileScanner(respect_gitignore=False).scan(tree).files) > len(
+            scan.files
+        )
+
+    def test_nested_repository(self, tree):
+        """Test that an enclosing repository's .gitignore does not apply"""
+        (tree / ".git").mkdir()
+        touch(tree / ".gitignore", "*\n")
+        inner = tree / "inner"
+        (inner / ".git").mkdir(parents=True)
+        touch(inner / "sale_ext" / "__manifest__.py", "{}")
+        touch(inner / "sale_ext" / "models" / "model.py")
+
+        scan = FileScanner().scan(inner)
+
+        assert {p.relative_to(inner).as_posix() for p in scan.files} == {
+            "sale_ext/__manifest__.py",
+            "sale_ext/models/model.py",
+        }
+
+    @pytest.mark.parametrize(
+        "pattern,path,is_dir,expected",
+        [
+            ("*.pyc", "a/b/c.pyc", False, True),
+            ("build/", "x/build", True, True),
+            ("build/", "x/build", False, None),
+            ("/build", "x/build", True, None),
+            ("docs/**/*.md", "docs/a/b/c.md", False, True),
+            ("file[0-9].txt", "file3.txt", False, True),
+        ],
+    )
+    def test_gitignore_patterns(self, pattern, path, is_dir, expected):
+        """Test translation of gitignore patterns"""
+        rules = GitignoreRules("/repo", [pattern])
+
+        assert rules.match(f"/repo/{path}", is_dir) is expected
+
+
+class TestPathAnalyzerScan:
+    """Test that PathAnalyzer uses the pruned scan"""
+
+    def test_modules_directory(self, tree):
+        """Test analysis of a directory of modules"""
+        analysis = PathAnalyzer().analyze(tree)
+
+        assert analysis.path_type == PathType.ODOO_MODULES_DIR
+        assert analysis.odoo_modules == [tree / "sale_ext", tree / "stock_ext"]
+        assert len(analysis.python_files) == 4
+        assert len(analysis.xml_files) == 2
+        assert not any("node_modules" in p.parts for p in analysis.other_files)
+
+    def test_module_keeps_given_path_form(self, tree, monkeypatch):
+        """Test that relative paths are reported relative, like rglob()"""
+        monkeypatch.chdir(tree)
+
+        analysis = PathAnalyzer().analyze(Path("sale_ext"))
+
+        assert analysis.is_odoo_module and analysis.has_models
+        assert Path("sale_ext/models/model.py") in analysis.python_files
@@ -134,6 +134,34 @@ class TestGitManager:
         uncommitted = git_manager.get_uncommitted_files()
         assert "untracked.py" in uncommitted["added"]
 
+    def test_get_changed_files(self, test_repo):
+        """Test listing changed files without walking the tree"""
+        git_manager = GitManager(test_repo)
+        (test_repo / "kept.py").write_text("kept")
+        (test_repo / "gone.py").write_text("gone")
+        subprocess.run(["git", "add", "."], cwd=test_repo)
+        subprocess.run(["git", "commit", "-m", "Add files"], cwd=test_repo)
+        base = git_manager.resolve_commit("HEAD")
+
+        (test_repo / "README.md").write_text("changed")
+        (test_repo / "gone.py").unlink()
+        (test_repo / "staged.xml").write_text("<odoo/>")
+        subprocess.run(["git", "add", "staged.xml"], cwd=test_repo)
+        (test_repo / "new.py").write_text("untracked")
+
+        changed = git_manager.get_changed_files(since=base)
+        assert [p.name for p in changed] == ["README.md", "new.py", "staged.xml"]
+        assert all(p.is_absolute() for p in changed)
+
+        staged = git_manager.get_changed_files(staged=True)
+        assert [p.name for p in staged] == ["staged.xml"]
+
+        limited = git_manager.get_changed_files(paths=[str(test_repo / "new.py")])
+        assert [p.name for p in limited] == ["new.py"]
+
+        with pytest.raises(ValueError):
+            git_manager.get_changed_files(since="no-such-ref")
+
     def test_stash_operations(self, test_repo):
         """Test stash and restore operations"""
         git_manager = GitManager(test_repo)
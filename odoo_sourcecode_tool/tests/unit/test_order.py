@@ -0,0 +1,115 @@
+"""
+Unit tests for the Python reordering pipeline
+"""
+
+import ast
+
+import black
+import isort
+from core.config import Config
+from core.order import Order, format_python_source
+
+
+def two_pass_reference(order: Order, content: str) -> str:
+    """Text round-trip between passes, formatting at the end"""
+    content = order.reorganize_node(content, level="field_attributes")
+    content = order.reorganize_node(content, level="module")
+    content = black.format_str(content, mode=black.Mode(line_length=88))
+    return isort.code(content)
+
+
+class TestPythonTransformer:
+    """Test the single-parse Python pipeline"""
+
+    def test_shared_tree_matches_text_round_trip(self, sample_python_code):
+        """Test that sharing one tree gives the same output as re-parsing"""
+        order = Order(Config())
+        transformer = order.python_transformer(["field_attributes", "module"])
+
+        content, metadata = transformer(sample_python_code)
+
+        assert content == two_pass_reference(order, sample_python_code)
+        assert "module" in metadata["changes_made"]
+
+    def test_field_attributes_only(self, sample_python_code):
+        """Test that field attribute mode neither reorganizes nor formats"""
+        order = Order(Config())
+
+        content, _ = order.python_transformer(["field_attributes"])(
+            sample_python_code
+        )
+
+        assert content == order.reorganize_node(
+            sample_python_code, level="field_attributes"
+        )
+
+    def test_reorder_field_attributes_counts_changes(self):
+        """Test that only fields whose attribute order changed are counted"""
+        order = Order(Config())
+        tree = ast.parse(
+            "class A:\n"
+            "    a = fields.Char(required=True, string='A')\n"
+            "    b = fields.Char(string='B', required=True)\n"
+        )
+
+        assert order.reorder_field_attributes(tree) == 1
+        assert order.reorder_field_attributes(tree) == 0
+
+    def test_syntax_error_is_left_alone(self):
+        """Test that unparseable content is returned unchanged"""
+        order = Order(Config())
+        broken = "def broken(:\n    pass\n"
+
+        content, metadata = order.python_transformer(["field_attributes"])(broken)
+
+        assert content == broken
+        assert metadata["changes_made"] == []
+
+    def test_formatting_is_memoized(self):
+        """Test that identical sources are formatted once"""
+        source = "import os\nx=1\n"
+        format_python_source.cache_clear()
+
+        first = format_python_source(source)
+        second = format_python_source(source)
+
+        assert first == second == "import os\n\nx = 1\n"
+        assert format_python_source.cache_info().hits == 1
+
+
+class TestXmlTransformer:
+    """Test the in-memory XML pipeline"""
+
+    FORM_VIEW = (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        '<form create="0" string="Order">\n'
+        '    <group name="main" string="Main"><field widget="x" name="a"/></group>\n'
+        '    <header><button type="object" name="act" string="Do"/></header>\n'
+        "</form>"
+    )
+
+    def test_chained_modes_keep_earlier_passes(self):
+        """Test that the attributes pass builds on the structure pass"""
+        order = Order(Config())
+
+        structure, _ = order.xml_transformer(["structure"])(self.FORM_VIEW)
+        chained, metadata = order.xml_transformer(["structure", "attributes"])(
+            self.FORM_VIEW
+        )
+
+        assert chained == order.xml_transformer(["attributes"])(structure)[0]
+        assert "<sheet>" in chained
+        assert metadata["changes_made"] == ["structure", "attributes"]
+
+    def test_transforms_given_content(self, temp_dir, sample_xml_code):
+        """Test that the transformer works on its input, not on the file"""
+        xml_file = temp_dir / "view.xml"
+        xml_file.write_text(sample_xml_code)
+        order = Order(Config())
+
+        from_content, _ = order.xml_transformer(["attributes"])(sample_xml_code)
+
+        assert from_content == order.reorganize_xml(xml_file, "attributes")
+        assert order.xml_transformer(["attributes"])(self.FORM_VIEW)[0] != (
+            from_content
+        )
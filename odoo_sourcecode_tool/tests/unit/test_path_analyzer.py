@@ -0,0 +1,157 @@
+"""
+Unit tests for PathAnalyzer file processing
+"""
+
+from pathlib import Path
+
+import pytest
+from core.config import Config
+from core.order import OrderTransformFactory
+from core.path_analyzer import PathAnalyzer, ProcessingStatus, resolve_jobs
+
+
+class UpperFactory:
+    """Picklable transformer factory for the worker pool"""
+
+    def __call__(self, file_path: Path):
+        def transformer(content: str) -> tuple[str, dict]:
+            if "boom" in content:
+                raise ValueError("cannot transform")
+            return content.upper(), {"changes_count": 2}
+
+        return transformer
+
+
+@pytest.fixture
+def text_files(temp_dir) -> list[Path]:
+    files = []
+    for name, content in [
+        ("a.txt", "alpha"),
+        ("b.txt", "BRAVO"),
+        ("c.txt", "boom"),
+        ("d.txt", "delta"),
+    ]:
+        path = temp_dir / name
+        path.write_text(content)
+        files.append(path)
+    return files
+
+
+class TestProcessFilesParallel:
+    """Test worker pool processing with writes in the parent"""
+
+    @pytest.mark.parametrize("jobs", [1, 2])
+    def test_results_and_writes(self, text_files, jobs):
+        """Test that statuses, order and written content match for any job count"""
+        results = PathAnalyzer().process_files_parallel(
+            text_files, UpperFactory(), jobs=jobs, backup=False
+        )
+
+        assert [r.file_path for r in results] == text_files
+        assert [r.status for r in results] == [
+            ProcessingStatus.SUCCESS,
+            ProcessingStatus.NO_CHANGES,
+            ProcessingStatus.ERROR,
+            ProcessingStatus.SUCCESS,
+        ]
+        assert results[0].changes_applied == 2
+        assert "cannot transform" in results[2].error_message
+        assert [f.read_text() for f in text_files] == ["ALPHA", "BRAVO", "boom", "DELTA"]
+
+    def test_dry_run_does_not_write(self, text_files):
+        """Test that dry run reports changes without writing"""
+        results = PathAnalyzer().process_files_parallel(
+            text_files, UpperFactory(), jobs=2, dry_run=True, backup=False
+        )
+
+        assert results[0].status == ProcessingStatus.SUCCESS
+        assert text_files[0].read_text() == "alpha"
+
+    def test_backups_only_changed_files(self, text_files, temp_dir):
+        """Test that the parent backs up the files it rewrites"""
+        config = Config()
+        config.backup.directory = str(temp_dir / ".backups")
+        config.backup.compression = False
+        analyzer = PathAnalyzer().with_backup(config)
+
+        analyzer.process_files_parallel(
+            text_files, UpperFactory(), jobs=2, session_description="test"
+        )
+
+        (session,) = analyzer._backup_manager.list_sessions()
+        backed_up = sorted(Path(p).name for p in session["files_backed_up"])
+        assert backed_up == ["a.txt", "d.txt"]
+
+        # The bytes the worker read are what gets backed up
+        manager = analyzer._backup_manager
+        contents = sorted(
+            manager.read_blob(blob) for blob in manager.objects_dir.glob("*/*")
+        )
+        assert contents == [b"alpha", b"delta"]
+
+    def test_resolve_jobs(self):
+        """Test worker count normalization"""
+        assert resolve_jobs(1) == 1
+        assert resolve_jobs(3) == 3
+        assert resolve_jobs(0) >= 1
+        assert resolve_jobs(None) >= 1
+
+
+class TestOrderTransformFactory:
+    """Test the picklable Order transformer factory"""
+
+    def test_parallel_matches_sequential(self, temp_dir, sample_python_code):
+        """Test that reordering in workers gives the in-process result"""
+        files = []
+        for index in range(3):
+            path = temp_dir / f"model_{index}.py"
+            path.write_text(sample_python_code)
+            files.append(path)
+
+        factory = OrderTransformFactory(Config(), "python", ["field_attributes"])
+        expected = factory(files[0])(sample_python_code)[0]
+
+        PathAnalyzer().process_files_parallel(files, factory, jobs=2, backup=False)
+
+        assert [f.read_text() for f in files] == [expected] * 3
+
+
+class TestAnalyzeFileList:
+    """Test analysis restricted to an explicit list of files"""
+
+    def test_only_listed_files_inside_path(self, sample_odoo_module, temp_dir):
+        """Test that unlisted and outside files are ignored"""
+        model = sample_odoo_module / "models" / "changed.py"
+        model.write_text("X = 1\n")
+        (sample_odoo_module / "models" / "untouched.py").write_text("Y = 1\n")
+        outside = temp_dir / "outside.py"
+        outside.write_text("Z = 1\n")
+
+        analysis = PathAnalyzer().analyze(sample_odoo_module, files=[model, outside])
+
+        assert analysis.is_odoo_module
+        assert analysis.python_files == [model.resolve()]
+        assert analysis.xml_files == []
+        assert analysis.recommended_targets == ["python_code"]
+
+    def test_no_changes(self, sample_odoo_module):
+        """Test that an empty list yields nothing to process"""
+        analysis = PathAnalyzer().analyze(sample_odoo_module, files=[])
+
+        assert analysis.total_files == 0
+        assert analysis.recommended_targets == []
+
+    def test_find_odoo_files_from_candidates(self, sample_odoo_module):
+        """Test that candidate files are classified like the module walk"""
+        view = sample_odoo_module / "views" / "changed.xml"
+        view.write_text("<odoo/>")
+        init = sample_odoo_module / "models" / "__init__.py"
+        init.write_text("")
+        manifest = sample_odoo_module / "__manifest__.py"
+
+        found = PathAnalyzer().find_odoo_files(
+            sample_odoo_module, files=[view, init, manifest]
+        )
+
+        assert found["views"] == [view]
+        assert found["models"] == found["wizards"] == []
@@ -0,0 +1,100 @@
+"""
+Unit tests for per-file batching of rename changes
+"""
+
+from pathlib import Path
+
+import pandas as pd
+from commands.rename import FieldChange, RenameCommand
+from core.config import Config
+
+
+def make_module(root: Path) -> Path:
+    """Module with one Python and one XML file touching two models"""
+    module = root / "sale_ext"
+    (module / "models").mkdir(parents=True)
+    (module / "views").mkdir()
+    (module / "__manifest__.py").write_text("{'name': 'Sale Ext'}\n")
+    (module / "models" / "sale.py").write_text(
+        "class SaleOrder(models.Model):\n"
+        "    amount = fields.Float()\n"
+        "\n"
+        "\n"
+        "class SaleOrderLine(models.Model):\n"
+        "    qty = fields.Float()\n"
+    )
+    (module / "views" / "sale.xml").write_text(
+        '<odoo>\n    <field name="amount"/>\n    <field name="qty"/>\n</odoo>\n'
+    )
+    return module
+
+
+def make_command(root: Path) -> RenameCommand:
+    config = Config()
+    config.repo_path = root
+    config.backup.enabled = False
+    return RenameCommand(config)
+
+
+class TestRenameBatching:
+    """Test that each file is processed once with every applicable change"""
+
+    def test_each_file_processed_once(self, temp_dir, monkeypatch):
+        """Test that two models of one module give one pass per file"""
+        module = make_module(temp_dir)
+        csv_file = temp_dir / "changes.csv"
+        pd.DataFrame(
+            [
+                {
+                    "old_name": "amount",
+                    "new_name": "amount_total",
+                    "item_type": "field",
+                    "module": "sale_ext",
+                    "model": "sale.order",
+                },
+                {
+                    "old_name": "qty",
+                    "new_name": "product_qty",
+                    "item_type": "field",
+                    "module": "sale_ext",
+                    "model": "sale.order.line",
+                },
+            ]
+        ).to_csv(csv_file, index=False)
+
+        command = make_command(temp_dir)
+        processed = []
+        process_file = command._process_file
+
+        def spy(file_path, changes):
+            processed.append(file_path)
+            return process_file(file_path, changes)
+
+        monkeypatch.setattr(command, "_process_file", spy)
+
+        assert command.execute(csv_file)
+
+        assert sorted(processed) == sorted(
+            [module / "models" / "sale.py", module / "views" / "sale.xml"]
+        )
+        python = (module / "models" / "sale.py").read_text()
+        assert "amount_total = fields.Float()" in python
+        assert "product_qty = fields.Float()" in python
+        xml = (module / "views" / "sale.xml").read_text()
+        assert 'name="amount_total"' in xml and 'name="product_qty"' in xml
+
+    def test_conflicting_renames_keep_first(self, temp_dir):
+        """Test that a name renamed differently by two models is renamed once"""
+        command = make_command(temp_dir)
+        changes = [
+            FieldChange("name", "title", "field", "sale_ext", "sale.order"),
+            FieldChange("name", "label", "field", "sale_ext", "sale.order.line"),
+            FieldChange("name", "label", "method", "sale_ext", "sale.order.line"),
+        ]
+
+        merged = command._merge_changes(Path("sale.py"), changes)
+
+        assert [(c.item_type, c.new_name) for c in merged] == [
+            ("field", "title"),
+            ("method", "label"),
+        ]
@@ -0,0 +1,112 @@
+"""
+Unit tests for the in-place (patch) Python rename backend
+"""
+
+import ast
+
+import pytest
+from commands.rename import (
+    ASTRenameLocator,
+    ASTRenameTransformer,
+    FieldChange,
+    RenameCommand,
+)
+from core.config import Config
+
+SOURCE = """from odoo import api, fields, models
+
+
+class SaleOrder(models.Model):
+    _inherit = "sale.order"
+
+    # Amount shown to the customer — señal
+    amount = fields.Float(  # keep this comment
+        string="Amount",
+    )
+    label = fields.Char(related='amount')
+
+    @api.depends("amount", 'other')
+    def _compute_total(self):
+        for rec in self:
+            rec.total = rec.amount  *  2   # odd spacing kept
+            self.amount += 1
+
+    async def _compute_total_async(self):
+        return super()._compute_total()
+
+    def other(self):
+        return self._compute_total(
+        )
+"""
+
+FIELDS = {"amount": "amount_untaxed"}
+METHODS = {"_compute_total": "_compute_amount_total"}
+
+
+def locate(source: str) -> ASTRenameLocator:
+    locator = ASTRenameLocator(FIELDS, METHODS, source)
+    locator.visit(ast.parse(source))
+    return locator
+
+
+class TestASTRenameLocator:
+    """Test that renames are patched into the original text"""
+
+    def test_only_renamed_names_change(self):
+        """Test that comments, quotes and spacing are kept"""
+        result = locate(SOURCE).apply()
+
+        expected = (
+            SOURCE.replace("amount =", "amount_untaxed =")
+            .replace("'amount'", "'amount_untaxed'")
+            .replace('"amount"', '"amount_untaxed"')
+            .replace(".amount ", ".amount_untaxed ")
+            .replace("_compute_total(", "_compute_amount_total(")
+        )
+        assert result == expected
+
+    def test_same_tree_and_changes_as_unparse(self):
+        """Test that the patch backend renames what the transformer renames"""
+        locator = locate(SOURCE)
+        transformer = ASTRenameTransformer(FIELDS, METHODS)
+        tree = transformer.visit(ast.parse(SOURCE))
+
+        assert ast.dump(ast.parse(locator.apply())) == ast.dump(tree)
+        assert locator.changes_made == transformer.changes_made
+
+    def test_concatenated_string_left_unchanged(self):
+        """Test that a string without a plain literal span is skipped"""
+        source = "x = ('amo' 'unt')\n"
+        locator = locate(source)
+
+        assert locator.apply() == source
+        assert locator.changes_made == []
+
+
+class TestPythonBackend:
+    """Test the python_backend renaming option"""
+
+    @pytest.mark.parametrize("backend", ["patch", "unparse"])
+    def test_backend_option(self, temp_dir, backend):
+        """Test that both backends rename, only patch keeps comments"""
+        config = Config()
+        config.backup.enabled = False
+        config.renaming.python_backend = backend
+        file_path = temp_dir / "sale.py"
+        file_path.write_text(SOURCE)
+
+        changes = [
+            FieldChange("amount", "amount_untaxed", "field", "sale", "sale.order")
+        ]
+        RenameCommand(config)._process_python_file(file_path, changes)
+
+        content = file_path.read_text()
+        assert "amount_untaxed = fields.Float" in content
+        assert ("# keep this comment" in content) == (backend == "patch")
+
+    def test_invalid_backend(self):
+        """Test that an unknown backend is reported by validate()"""
+        config = Config()
+        config.renaming.python_backend = "black"
+
+        assert any("Python rename backend" in error for error in config.validate())
@@ -0,0 +1,169 @@
+"""
+Unit tests for the incremental reorder manifest
+"""
+
+from pathlib import Path
+
+import pytest
+from core.config import Config
+from core.order import Order
+from core.path_analyzer import PathAnalyzer, ProcessingStatus
+from core.transform_manifest import (
+    TransformManifest,
+    content_hash,
+    find_repo_root,
+    make_fingerprint,
+    source_digest,
+)
+
+
+class CountingTransformer:
+    """Upper-cases content and counts its calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, content: str) -> str:
+        self.calls += 1
+        return content.upper()
+
+
+class CountingFactory:
+    """Picklable factory for the in-process parallel path"""
+
+    def __init__(self):
+        self.transformer = CountingTransformer()
+
+    def __call__(self, file_path: Path):
+        return self.transformer
+
+
+@pytest.fixture
+def repo(temp_dir) -> Path:
+    (temp_dir / ".git").mkdir()
+    (temp_dir / "module").mkdir()
+    return temp_dir
+
+
+class TestTransformManifest:
+    """Test manifest persistence and invalidation"""
+
+    def test_round_trip(self, repo):
+        """Test that recorded hashes survive a save/load cycle"""
+        file_path = repo / "module" / "a.py"
+        file_path.write_text("X = 1\n")
+
+        manifest = TransformManifest(repo, "fp", tool_version="1.0")
+        manifest.record(file_path, content_hash("X = 1\n"))
+        manifest.save()
+
+        reloaded = TransformManifest(repo, "fp", tool_version="1.0")
+        assert reloaded.entries == {"module/a.py": content_hash("X = 1\n")}
+        assert reloaded.is_canonical_file(file_path)
+        assert (repo / ".odoo-tools" / "cache" / ".gitignore").read_text() == "*\n"
+
+        file_path.write_text("X = 2\n")
+        assert not reloaded.is_canonical_file(file_path)
+
+    def test_other_fingerprint_or_version_is_ignored(self, repo):
+        """Test that settings or version changes invalidate recorded files"""
+        manifest = TransformManifest(repo, "fp", tool_version="1.0")
+        manifest.record(repo / "a.py", "hash")
+        manifest.save()
+
+        assert TransformManifest(repo, "other", tool_version="1.0").entries == {}
+        assert TransformManifest(repo, "fp", tool_version="2.0").entries == {}
+        assert TransformManifest(repo, "fp", tool_version="1.0").entries
+
+    def test_forget(self, repo):
+        """Test that forgotten files are processed again"""
+        file_path = repo / "a.py"
+        file_path.write_text("x")
+        manifest = TransformManifest(repo, "fp", tool_version="1.0")
+        manifest.record(file_path, content_hash("x"))
+
+        manifest.forget(file_path)
+
+        assert not manifest.is_canonical_file(file_path)
+
+    def test_helpers(self, repo):
+        """Test repository detection and fingerprints"""
+        assert find_repo_root(repo / "module") == repo.resolve()
+        assert make_fingerprint("python", {"a": 1, "b": 2}) == make_fingerprint(
+            "python", {"b": 2, "a": 1}
+        )
+        assert make_fingerprint("python") != make_fingerprint("xml")
+
+    def test_source_digest(self, tmp_path):
+        """Test that editing an implementation file changes the digest"""
+        (tmp_path / "core").mkdir()
+        rule = tmp_path / "core" / "classification_rule_field.py"
+        rule.write_text("RULES = []\n")
+        (tmp_path / "core" / "other.py").write_text("x = 1\n")
+        patterns = ("core/classification_rule_*.py",)
+        before = source_digest(tmp_path, patterns)
+
+        (tmp_path / "core" / "other.py").write_text("x = 2\n")
+        assert source_digest(tmp_path, patterns) == before
+
+        rule.write_text("RULES = [1]\n")
+        assert source_digest(tmp_path, patterns) != before
+
+
+class TestIncrementalProcessing:
+    """Test that PathAnalyzer skips files the manifest knows"""
+
+    def test_second_run_skips_transform(self, repo):
+        """Test that canonical files are not transformed again"""
+        file_path = repo / "module" / "a.txt"
+        file_path.write_text("hello")
+        manifest = TransformManifest(repo, "fp", tool_version="1.0")
+        analyzer = PathAnalyzer().with_manifest(manifest)
+        transformer = CountingTransformer()
+
+        first = analyzer.process_file_with_transform(file_path, transformer)
+        second = analyzer.process_file_with_transform(file_path, transformer)
+
+        assert first.status == ProcessingStatus.SUCCESS
+        assert second.status == ProcessingStatus.NO_CHANGES
+        assert transformer.calls == 1
+        assert manifest.skipped == 1
+
+    def test_parallel_path_skips_transform(self, repo):
+        """Test that the batch path filters canonical files before dispatch"""
+        files = []
+        for name in ["a.txt", "b.txt"]:
+            path = repo / "module" / name
+            path.write_text(name)
+            files.append(path)
+        manifest = TransformManifest(repo, "fp", tool_version="1.0")
+        analyzer = PathAnalyzer().with_manifest(manifest)
+
+        analyzer.process_files_parallel(files, CountingFactory(), backup=False)
+        factory = CountingFactory()
+        results = analyzer.process_files_parallel(files, factory, backup=False)
+
+        assert [r.status for r in results] == [ProcessingStatus.NO_CHANGES] * 2
+        assert factory.transformer.calls == 0
+
+    def test_order_records_and_detaches_manifest(self, repo, sample_python_code):
+        """Test that Order persists the manifest and detaches it afterwards"""
+        from core.path_analyzer import path_analyzer
+
+        file_path = repo / "module" / "model.py"
+        file_path.write_text(sample_python_code)
+        config = Config()
+        config.backup.enabled = False
+
+        Order(config)._process_single_python_file(file_path, ["module"])
+
+        assert path_analyzer._manifest is None
+        manifest = Order(config)._load_manifest(file_path, "python", ["module"])
+        assert manifest.is_canonical_file(file_path)
+
+        config.ordering.black_line_length = 100
+        other = Order(config)._load_manifest(file_path, "python", ["module"])
+        assert not other.is_canonical_file(file_path)
+
+        config.ordering.incremental = False
+        assert Order(config)._load_manifest(file_path, "python", ["module"]) is None
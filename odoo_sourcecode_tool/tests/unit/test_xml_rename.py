@@ -0,0 +1,92 @@
+"""
+Unit tests for the single-scan XML rename engine
+"""
+
+from core.xml_rename import XMLRenameEngine
+
+
+def sequential_rename(
+    content: str, field_changes: dict[str, str], method_changes: dict[str, str]
+) -> str:
+    """Previous per-rename, per-pattern replacement loop"""
+    for old_name, new_name in field_changes.items():
+        for prefix in ("name=", "ref="):
+            for quote in ('"', "'"):
+                content = content.replace(
+                    f"{prefix}{quote}{old_name}{quote}",
+                    f"{prefix}{quote}{new_name}{quote}",
+                )
+    for old_name, new_name in method_changes.items():
+        for prefix in ("<button name=", "action="):
+            for quote in ('"', "'"):
+                content = content.replace(
+                    f"{prefix}{quote}{old_name}{quote}",
+                    f"{prefix}{quote}{new_name}{quote}",
+                )
+        content = content.replace(f".{old_name}(", f".{new_name}(")
+    return content
+
+
+VIEW = """<odoo>
+    <record id="view_order_form" model="ir.ui.view">
+        <field name="arch" type="xml">
+            <form>
+                <button name="action_confirm" type="object"/>
+                <button name='action_cancel' type="object"/>
+                <field name="amount"/>
+                <field name='qty' invisible="amount > 0"/>
+                <field name="amount_total"/>
+                <label for="amount" string="Amount"/>
+                <field name="partner_id" action="action_confirm"/>
+            </form>
+        </field>
+    </record>
+    <record id="filter" model="ir.filters">
+        <field name="domain">[('id', 'in', obj.action_confirm())]</field>
+        <field name="ref" ref="amount"/>
+    </record>
+</odoo>
+"""
+
+FIELDS = {"amount": "amount_untaxed", "qty": "product_qty"}
+METHODS = {"action_confirm": "action_approve", "action_cancel": "action_abort"}
+
+
+class TestXMLRenameEngine:
+    """Test single-scan renaming against the previous replacement loop"""
+
+    def test_same_output_as_sequential_replacements(self):
+        """Test that the scan rewrites exactly what the old loop rewrote"""
+        content, _, _ = XMLRenameEngine(FIELDS, METHODS).apply(VIEW)
+        assert content == sequential_rename(VIEW, FIELDS, METHODS)
+
+    def test_counts_hits_per_rename(self):
+        """Test that hits are counted per old name during the scan"""
+        _, field_hits, method_hits = XMLRenameEngine(FIELDS, METHODS).apply(VIEW)
+        assert field_hits == {"amount": 2, "qty": 1}
+        assert method_hits == {"action_confirm": 3, "action_cancel": 1}
+
+    def test_only_whole_attribute_values(self):
+        """Test that longer names and free text are left alone"""
+        content, field_hits, _ = XMLRenameEngine(FIELDS, {}).apply(VIEW)
+        assert '<field name="amount_total"/>' in content
+        assert 'invisible="amount > 0"' in content
+        assert '<label for="amount"' in content
+        assert "amount_total" not in field_hits
+
+    def test_methods_only_in_method_contexts(self):
+        """Test that a method name in a field name attribute is kept"""
+        content, _, method_hits = XMLRenameEngine({}, {"amount": "x"}).apply(VIEW)
+        assert content == VIEW
+        assert not method_hits
+
+    def test_renames_do_not_cascade(self):
+        """Test that chained renames are applied simultaneously"""
+        content, _, _ = XMLRenameEngine({"a": "b", "b": "c"}, {}).apply(
+            '<field name="a"/><field name="b"/>'
+        )
+        assert content == '<field name="b"/><field name="c"/>'
+
+    def test_no_renames(self):
+        """Test that content is returned unchanged without renames"""
+        assert XMLRenameEngine({}, {}).apply(VIEW) == (VIEW, {}, {})